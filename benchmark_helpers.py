@@ -0,0 +1,110 @@
+import json
+import sys
+import time
+from argparse import ArgumentParser
+
+from helpers.microbenchmarks import BENCHMARKS, compare_benchmarks, get_benchmark_names, run_benchmarks
+from helpers.run_history import get_commit, get_host_info
+
+
+def format_ns(delta_ns: float) -> str:
+    if delta_ns >= 1e6:
+        return f'{delta_ns / 1e6:.3f} ms'
+
+    if delta_ns >= 1e3:
+        return f'{delta_ns / 1e3:.3f} us'
+
+    return f'{delta_ns:.1f} ns'
+
+
+class BenchmarkCli(object):
+    def __init__(self):
+        parser = ArgumentParser(description="Helper Microbenchmarks",
+                                usage="[pattern ...] [--output PATH] [--compare PATH]")
+
+        parser.add_argument('patterns', nargs='*',
+                            help='only run benchmarks whose names match these glob patterns, e.g. "point.*"')
+        parser.add_argument('--list', action='store_true', help='list the benchmarks and their sizes, then exit')
+        parser.add_argument('--sizes', type=lambda value: [int(size) for size in value.split(',')],
+                            help='comma separated sizes to run every benchmark at, instead of their own')
+        parser.add_argument('--repeat', type=int, default=7, help='timed samples per benchmark (default: 7)')
+        parser.add_argument('--min-time', type=float, default=0.05,
+                            help='seconds each sample runs for at least, repeating the operation as needed '
+                                 '(default: 0.05)')
+        parser.add_argument('--output', metavar='PATH', help='write the results to a JSON file')
+        parser.add_argument('--compare', metavar='PATH',
+                            help='compare against results written by an earlier --output, exiting non-zero if '
+                                 'anything slowed down')
+        parser.add_argument('--threshold', type=float, default=10,
+                            help='percentage a benchmark\'s median can move before --compare flags it (default: 10)')
+
+        self.args = parser.parse_args(sys.argv[1:])
+
+    def print_comparison(self, results: dict) -> bool:
+        with open(self.args.compare, 'r') as compare_file:
+            old_output = json.loads(compare_file.read())
+
+        changes = compare_benchmarks(old_output['results'], results, self.args.threshold / 100)
+        old_commit = (old_output['commit'] or 'unknown')[:10]
+
+        if not changes:
+            print(f'\nNo benchmarks moved more than {self.args.threshold:g}% from {old_commit}.')
+            return False
+
+        print(f'\n{len(changes)} benchmark(s) moved more than {self.args.threshold:g}% from {old_commit}:')
+
+        for change in changes:
+            ratio = change['ratio']
+            summary = f'{ratio:.2f}x slower' if ratio >= 1 else f'{1 / ratio:.2f}x faster'
+
+            print(f'  {change["key"]:<36} {format_ns(change["old_ns"]):>12} -> {format_ns(change["new_ns"]):>12}  '
+                  f'{summary}')
+
+        return any(change['flag'] == 'slower' for change in changes)
+
+    def run(self):
+        names = get_benchmark_names(self.args.patterns)
+
+        if self.args.list:
+            for name in names:
+                print(f'{name:<36} sizes {", ".join(str(size) for size in BENCHMARKS[name][1])}')
+            return 0
+
+        if not names:
+            print(f'No benchmarks match {" ".join(self.args.patterns)}; see --list.')
+            return 1
+
+        print(f'{"benchmark":<36} {"ops":>8} {"min":>12} {"median":>12} {"p95":>12} {"stdev":>12}')
+
+        def print_result(key: str, result: dict):
+            print(f'{key:<36} {result["operations"]:>8} {format_ns(result["min"]):>12} '
+                  f'{format_ns(result["median"]):>12} {format_ns(result["p95"]):>12} {format_ns(result["stdev"]):>12}')
+
+        results = run_benchmarks(names, self.args.repeat, self.args.min_time, self.args.sizes, print_result)
+
+        if self.args.output:
+            commit_hash, is_dirty = get_commit()
+
+            # Times are nanoseconds per primitive operation, keyed by "name/size".
+            output = {
+                'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'commit': commit_hash,
+                'is_dirty': is_dirty,
+                'host': get_host_info(),
+                'repeat': self.args.repeat,
+                'min_time': self.args.min_time,
+                'results': results
+            }
+
+            with open(self.args.output, 'w') as output_file:
+                output_file.write(json.dumps(output, indent=2))
+
+        if self.args.compare and self.print_comparison(results):
+            return 1
+
+        return 0
+
+
+if __name__ == "__main__":
+    cli = BenchmarkCli()
+    sys.exit(cli.run())
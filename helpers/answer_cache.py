@@ -0,0 +1,64 @@
+import hashlib
+import json
+import os
+from typing import Optional
+
+from helpers.dependency_map import ROOT_DIR, get_local_dependencies
+
+CACHE_DIR = os.path.join(ROOT_DIR, '.answer_cache')
+
+# Results are stored as JSON, which turns the per-part dicts' int keys into strings.
+PART_KEYED_FIELDS = ['answers', 'times', 'phases', 'profiles', 'memory', 'stats']
+
+
+def get_cache_key(year: int, day: int, mode: str) -> Optional[str]:
+    day_path = os.path.join(ROOT_DIR, f'year_{year}', f'day-{day}.py')
+    input_path = os.path.join(ROOT_DIR, f'year_{year}', 'inputs', f'day-{day}.txt')
+
+    if not os.path.isfile(day_path) or not os.path.isfile(input_path):
+        return None
+
+    digest = hashlib.sha256(mode.encode())
+
+    for path in [day_path, input_path] + sorted(get_local_dependencies(day_path)):
+        digest.update(os.path.relpath(path, ROOT_DIR).encode())
+
+        with open(path, 'rb') as hashed_file:
+            digest.update(hashlib.sha256(hashed_file.read()).digest())
+
+    return digest.hexdigest()
+
+
+def _get_cache_path(year: int, day: int) -> str:
+    return os.path.join(CACHE_DIR, f'{year}_day-{day}.json')
+
+
+def load_cached_result(year: int, day: int, key: str) -> Optional[dict]:
+    cache_path = _get_cache_path(year, day)
+
+    if not key or not os.path.isfile(cache_path):
+        return None
+
+    with open(cache_path, 'r') as cache_file:
+        cached = json.loads(cache_file.read())
+
+    if cached['key'] != key:
+        return None
+
+    result = cached['result']
+
+    for field in PART_KEYED_FIELDS:
+        if field in result:
+            result[field] = {int(part): value for part, value in result[field].items()}
+
+    return result
+
+
+def store_result(year: int, day: int, key: str, result: dict):
+    if not key:
+        return
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    with open(_get_cache_path(year, day), 'w') as cache_file:
+        cache_file.write(json.dumps({'key': key, 'result': result}))
@@ -0,0 +1,88 @@
+import json
+import os
+from typing import Dict, List, Optional
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'baselines')
+
+# Changes smaller than this are treated as noise, however large they are relative to the baseline.
+MIN_DELTA_NS = 1_000_000
+
+
+def get_baseline_path(year: int) -> str:
+    return os.path.join(BASELINE_DIR, f'{year}_baseline.json')
+
+
+def get_record_time(record: dict) -> Optional[int]:
+    if record['status'] != 'ok':
+        return None
+
+    return record['median_ns'] if record.get('median_ns') is not None else record['total_ns']
+
+
+def save_baseline(year: int, records: List[dict]):
+    baseline = {}
+
+    for record in records:
+        if record['year'] != year:
+            continue
+
+        baseline.setdefault(str(record['day']), {})[str(record['part'])] = {
+            'status': record['status'],
+            'time_ns': get_record_time(record)
+        }
+
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+
+    with open(get_baseline_path(year), 'w') as baseline_file:
+        baseline_file.write(json.dumps(baseline, indent=2))
+
+
+def load_baseline(year: int) -> Optional[Dict[str, Dict[str, dict]]]:
+    baseline_path = get_baseline_path(year)
+
+    if not os.path.isfile(baseline_path):
+        return None
+
+    with open(baseline_path, 'r') as baseline_file:
+        return json.loads(baseline_file.read())
+
+
+def compare_to_baseline(baseline: Dict[str, Dict[str, dict]], records: List[dict], threshold: float) -> List[dict]:
+    changes = []
+
+    for record in records:
+        baseline_entry = baseline.get(str(record['day']), {}).get(str(record['part']))
+
+        if not baseline_entry:
+            continue
+
+        old_time = baseline_entry['time_ns']
+        new_time = get_record_time(record)
+
+        change = {
+            'year': record['year'],
+            'day': record['day'],
+            'part': record['part'],
+            'baseline_ns': old_time,
+            'current_ns': new_time,
+            'ratio': None,
+            'flag': None
+        }
+
+        if old_time is not None and new_time is None:
+            change['flag'] = 'broken'
+        elif old_time is None and new_time is not None:
+            change['flag'] = 'fixed'
+        elif old_time is not None and new_time is not None:
+            change['ratio'] = new_time / old_time if old_time else None
+
+            if abs(new_time - old_time) >= MIN_DELTA_NS and change['ratio'] is not None:
+                if change['ratio'] > 1 + threshold:
+                    change['flag'] = 'slower'
+                elif change['ratio'] < 1 / (1 + threshold):
+                    change['flag'] = 'faster'
+
+        if change['flag']:
+            changes.append(change)
+
+    return changes
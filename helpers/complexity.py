@@ -0,0 +1,163 @@
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+# From best to worst.
+GROWTH_CLASSES = ['1', 'n', 'n log n', 'n^2', 'n^3', 'exp']
+
+GROWTH_FUNCTIONS: Dict[str, Callable[[float], float]] = {
+    '1': lambda n: 0,
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log(n),
+    'n^2': lambda n: n ** 2,
+    'n^3': lambda n: n ** 3
+}
+
+# Most puzzles should be solvable in close to linear time in their input's length.
+DEFAULT_EXPECTED_GROWTH = 'n log n'
+
+# A more complex class has to fit this much better than a simpler one before it's picked over it, since noisy timings
+# are always fitted at least a little better by a steeper curve.
+SIMPLER_CLASS_TOLERANCE = 1.5
+
+# Residuals this small already fit to within a few percent, so any class that gets there is good enough.
+GOOD_FIT_RESIDUAL = 0.005
+
+# If even the best class is off by more than about 20% on average, the timings are too noisy, or follow some other
+# curve, for any class to be trusted, and only the exponent is reported.
+MAX_FIT_RESIDUAL = 0.04
+
+# The exponent each class looks like on a log-log plot, over the sizes a sweep covers.
+CLASS_EXPONENTS = {'1': 0, 'n': 1, 'n log n': 1, 'n^2': 2, 'n^3': 3}
+
+# A part is only flagged when its exponent is also at least this much steeper than its expected class's.
+EXPONENT_MARGIN = 0.5
+
+# Fits need at least this many sizes, with the largest at least this many times the smallest.
+MIN_POINTS = 3
+MIN_SIZE_RATIO = 2
+
+Fit = Tuple[str, Callable[[float], float], float]
+
+
+def _relative_residual(points: List[Tuple[float, float]], predict: Callable[[float], float]) -> float:
+    return sum(((predict(n) - t) / t) ** 2 for n, t in points) / len(points)
+
+
+def _fit_scaled(points: List[Tuple[float, float]], growth: Callable[[float], float]) -> Callable[[float], float]:
+    # Weighted least squares for t = a + b * growth(n), weighting by 1/t^2 so every point's relative error counts the
+    # same. Negative coefficients don't mean anything here, so they're clamped to zero and the other one refitted.
+    weights = [1 / t ** 2 for _, t in points]
+    xs = [growth(n) for n, _ in points]
+    ts = [t for _, t in points]
+
+    sum_w = sum(weights)
+    sum_wx = sum(w * x for w, x in zip(weights, xs))
+    sum_wt = sum(w * t for w, t in zip(weights, ts))
+    sum_wxx = sum(w * x * x for w, x in zip(weights, xs))
+    sum_wxt = sum(w * x * t for w, x, t in zip(weights, xs, ts))
+
+    determinant = sum_w * sum_wxx - sum_wx ** 2
+
+    if determinant > 0:
+        offset = (sum_wxx * sum_wt - sum_wx * sum_wxt) / determinant
+        scale = (sum_w * sum_wxt - sum_wx * sum_wt) / determinant
+    else:
+        offset, scale = sum_wt / sum_w, 0
+
+    if scale < 0:
+        offset, scale = sum_wt / sum_w, 0
+    elif offset < 0:
+        offset, scale = 0, sum_wxt / sum_wxx
+
+    return lambda n: offset + scale * growth(n)
+
+
+def _fit_exponential(points: List[Tuple[float, float]]) -> Optional[Callable[[float], float]]:
+    # Ordinary least squares on log(t) = a + b * n.
+    count = len(points)
+    mean_n = sum(n for n, _ in points) / count
+    mean_log = sum(math.log(t) for _, t in points) / count
+
+    spread = sum((n - mean_n) ** 2 for n, _ in points)
+    if spread == 0:
+        return None
+
+    rate = sum((n - mean_n) * (math.log(t) - mean_log) for n, t in points) / spread
+    if rate <= 0:
+        return None
+
+    intercept = mean_log - rate * mean_n
+
+    return lambda n: math.exp(min(intercept + rate * n, 700))
+
+
+def fit_growth_classes(points: List[Tuple[float, float]]) -> List[Fit]:
+    fits = []
+
+    for growth_class in GROWTH_CLASSES:
+        if growth_class == 'exp':
+            predict = _fit_exponential(points)
+            if predict is None:
+                continue
+        else:
+            predict = _fit_scaled(points, GROWTH_FUNCTIONS[growth_class])
+
+        fits.append((growth_class, predict, _relative_residual(points, predict)))
+
+    return fits
+
+
+def has_enough_sizes(points: List[Tuple[float, float]]) -> bool:
+    sizes = set(n for n, t in points if n > 0 and t > 0)
+
+    return len(sizes) >= MIN_POINTS and max(sizes) >= min(sizes) * MIN_SIZE_RATIO
+
+
+# Picks the growth class that best explains how runtime t grows with input size n, given (n, t) points. Returns the
+# class and its fitted curve, or None if the sizes are too few or too close together to tell, or no class fits well.
+def estimate_growth(points: List[Tuple[float, float]]) -> Optional[Tuple[str, Callable[[float], float]]]:
+    if not has_enough_sizes(points):
+        return None
+
+    points = [(n, t) for n, t in points if n > 0 and t > 0]
+    fits = fit_growth_classes(points)
+    best_residual = min(residual for _, _, residual in fits)
+
+    if best_residual > MAX_FIT_RESIDUAL:
+        return None
+
+    for growth_class, predict, residual in fits:
+        if residual <= max(best_residual * SIMPLER_CLASS_TOLERANCE, GOOD_FIT_RESIDUAL):
+            return growth_class, predict
+
+    return None
+
+
+# The slope of log(t) against log(n), i.e. k in t ~ n^k, as a rougher but class-free summary of the same points.
+def estimate_exponent(points: List[Tuple[float, float]]) -> Optional[float]:
+    logs = [(math.log(n), math.log(t)) for n, t in points if n > 0 and t > 0]
+
+    if len(set(log_n for log_n, _ in logs)) < 2:
+        return None
+
+    mean_n = sum(log_n for log_n, _ in logs) / len(logs)
+    mean_t = sum(log_t for _, log_t in logs) / len(logs)
+
+    return sum((log_n - mean_n) * (log_t - mean_t) for log_n, log_t in logs) / \
+        sum((log_n - mean_n) ** 2 for log_n, _ in logs)
+
+
+def is_worse_than(growth_class: str, expected_class: str) -> bool:
+    return GROWTH_CLASSES.index(growth_class) > GROWTH_CLASSES.index(expected_class)
+
+
+# A fitted class only counts as worse than expected when the log-log exponent agrees, so one noisy size can't flag a part
+# whose timings otherwise grow as expected.
+def is_worse_than_expected(growth_class: str, exponent: Optional[float], expected_class: str) -> bool:
+    if not is_worse_than(growth_class, expected_class):
+        return False
+
+    if expected_class not in CLASS_EXPONENTS or exponent is None:
+        return True
+
+    return exponent >= CLASS_EXPONENTS[expected_class] + EXPONENT_MARGIN
@@ -0,0 +1,75 @@
+import ast
+import os
+from typing import Dict, Set, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _resolve_module(module_name: str) -> str | None:
+    module_path = os.path.join(ROOT_DIR, *module_name.split('.'))
+
+    if os.path.isfile(module_path + '.py'):
+        return module_path + '.py'
+    elif os.path.isfile(os.path.join(module_path, '__init__.py')):
+        return os.path.join(module_path, '__init__.py')
+
+    return None
+
+
+def _get_imported_modules(path: str) -> Set[str]:
+    with open(path, 'r') as source_file:
+        tree = ast.parse(source_file.read(), path)
+
+    module_names = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            module_names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            module_names.add(node.module)
+            # 'from helpers import grid' imports a module rather than a name.
+            module_names.update(f'{node.module}.{alias.name}' for alias in node.names)
+
+    return module_names
+
+
+# Returns every file in this repo that the given source file imports, directly or indirectly. Third-party and
+# standard library modules are left out.
+def get_local_dependencies(path: str) -> Set[str]:
+    dependencies = set()
+    pending = [os.path.abspath(path)]
+
+    while pending:
+        current = pending.pop()
+
+        for module_name in _get_imported_modules(current):
+            module_path = _resolve_module(module_name)
+
+            if module_path and module_path not in dependencies and module_path != os.path.abspath(path):
+                dependencies.add(module_path)
+                pending.append(module_path)
+
+    return dependencies
+
+
+# Maps every file a (year, day) pair depends on - its module, its input, and the repo modules it imports - to the
+# pairs that depend on it.
+def build_dependency_map(tasks) -> Dict[str, Set[Tuple[int, int]]]:
+    dependency_map = {}
+
+    for year, day in tasks:
+        day_path = os.path.join(ROOT_DIR, f'year_{year}', f'day-{day}.py')
+        input_path = os.path.join(ROOT_DIR, f'year_{year}', 'inputs', f'day-{day}.txt')
+
+        paths = {day_path, input_path}
+        if os.path.isfile(day_path):
+            try:
+                paths.update(get_local_dependencies(day_path))
+            except SyntaxError:
+                # Mid-edit files can't be parsed; they're picked up again on their next change.
+                pass
+
+        for path in paths:
+            dependency_map.setdefault(path, set()).add((year, day))
+
+    return dependency_map
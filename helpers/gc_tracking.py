@@ -0,0 +1,51 @@
+import gc
+import time
+from typing import List, Optional, Tuple
+
+
+def parse_gc_thresholds(value: str) -> Tuple[int, ...]:
+    # Same arguments as gc.set_threshold(): '0' turns automatic collection off, '50000,20,20' makes it rarer.
+    return tuple(int(threshold) for threshold in value.split(','))
+
+
+# Counts the cyclic collector's passes, and how long the program was paused for them, through gc.callbacks.
+class GcTracker:
+    collections: List[int]
+    collected: int
+    pause_ns: int
+    max_pause_ns: int
+
+    pause_start: Optional[int]
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.collected = 0
+        self.pause_ns = 0
+        self.max_pause_ns = 0
+        self.pause_start = None
+
+    def on_collection(self, phase: str, info: dict):
+        if phase == 'start':
+            self.pause_start = time.perf_counter_ns()
+        elif self.pause_start is not None:
+            pause = time.perf_counter_ns() - self.pause_start
+
+            self.collections[info['generation']] += 1
+            self.collected += info['collected']
+            self.pause_ns += pause
+            self.max_pause_ns = max(self.max_pause_ns, pause)
+            self.pause_start = None
+
+    def start(self):
+        gc.callbacks.append(self.on_collection)
+
+    def stop(self) -> dict:
+        gc.callbacks.remove(self.on_collection)
+
+        return {
+            'collections': sum(self.collections),
+            'by_generation': self.collections,
+            'collected': self.collected,
+            'pause_ns': self.pause_ns,
+            'max_pause_ns': self.max_pause_ns
+        }
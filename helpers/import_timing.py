@@ -0,0 +1,44 @@
+import os
+import re
+import subprocess
+import sys
+from typing import List, Tuple
+
+from helpers.dependency_map import ROOT_DIR
+
+ImportEntry = Tuple[str, int, int]
+
+MARKER = '--- loading day ---'
+
+IMPORT_TIME_PATTERN = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)')
+
+# The runner's own imports happen before the marker, so only what the day pulls in on top of them is measured.
+LOADER_SOURCE = f'''
+import sys
+from run_year import load_puzzle
+sys.stderr.write({MARKER!r} + '\\n')
+sys.stderr.flush()
+load_puzzle(int(sys.argv[1]), int(sys.argv[2]))
+'''
+
+
+# Loads the day in a fresh interpreter under -X importtime, and returns the modules it imported as
+# (name, self microseconds, cumulative microseconds), ordered by cumulative time.
+def measure_import_breakdown(year: int, day: int) -> List[ImportEntry]:
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', LOADER_SOURCE, str(year), str(day)],
+                             cwd=ROOT_DIR, capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=ROOT_DIR))
+
+    lines = process.stderr.split('\n')
+    if MARKER not in lines:
+        return []
+
+    entries = []
+
+    for line in lines[lines.index(MARKER) + 1:]:
+        match = IMPORT_TIME_PATTERN.match(line)
+
+        # Only top-level imports are kept; nested ones are already included in their parent's cumulative time.
+        if match and len(match[3]) == 1:
+            entries.append((match[4], int(match[1]), int(match[2])))
+
+    return sorted(entries, key=lambda entry: entry[2], reverse=True)
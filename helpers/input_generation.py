@@ -0,0 +1,22 @@
+import random
+import string
+from typing import List, Optional, Sequence
+
+
+# Shared pieces for Puzzle.generate_input() implementations.
+
+def random_rows(width: int, height: int, rng: random.Random, chars: str,
+                weights: Optional[Sequence[float]] = None) -> List[str]:
+    return [''.join(rng.choices(chars, weights, k=width)) for _ in range(height)]
+
+
+def unique_names(count: int, rng: random.Random, length=2, alphabet=string.ascii_uppercase) -> List[str]:
+    # Names get longer once the shorter ones run out, so any count can be asked for.
+    while len(alphabet) ** length < count:
+        length += 1
+
+    names = set()
+    while len(names) < count:
+        names.add(''.join(rng.choices(alphabet, k=length)))
+
+    return sorted(names)
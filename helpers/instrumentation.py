@@ -0,0 +1,87 @@
+import functools
+import importlib
+import os
+import time
+from typing import Callable, Dict, List, Tuple
+
+# Setting this to anything non-empty turns instrumentation on for runs that don't pass --instrument.
+ENVIRONMENT_VARIABLE = 'AOC_INSTRUMENT'
+
+HelperEntry = Tuple[str, int, int]
+
+
+def is_enabled_by_environment() -> bool:
+    return bool(os.environ.get(ENVIRONMENT_VARIABLE))
+
+
+def get_instrumented_methods() -> List[Tuple[type, str]]:
+    # Looked up by name rather than imported, so puzzles that never turn instrumentation on don't pay for the imports,
+    # and dependency_map doesn't think every day depends on these helpers.
+    grid = importlib.import_module('helpers.grid')
+    list_helpers = importlib.import_module('helpers.list_helpers')
+    pathing_grid = importlib.import_module('helpers.pathing_grid')
+
+    points = [(point_type, name) for point_type in [grid.Point, grid.Point3D]
+              for name in ['__add__', '__sub__', '__mul__', '__eq__', '__hash__']]
+    grids = [(grid_type, name) for grid_type in [grid.ArrayGrid, grid.SparseGrid, grid.Grid3D]
+             for name in ['__getitem__', '__setitem__', 'neighbors']]
+    pathing_grids = [(pathing_grid.PathingGrid, name) for name in ['locate_start_end', 'get_start_node',
+                                                                   'get_end_node', 'set_start', 'set_end']]
+    list_helper_methods = [(list_helpers.ListHelper, 'get_permutations')]
+
+    # Subclasses that don't override a method share their parent's, which is only wrapped once.
+    return [(owner, name) for owner, name in points + grids + pathing_grids + list_helper_methods
+            if name in owner.__dict__]
+
+
+def _wrap(method: Callable, counter: list) -> Callable:
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        # Recursive calls are counted, but only the outermost one is timed, so the time isn't counted twice.
+        counter[0] += 1
+        counter[2] += 1
+
+        if counter[2] > 1:
+            try:
+                return method(*args, **kwargs)
+            finally:
+                counter[2] -= 1
+
+        start = time.perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            counter[1] += time.perf_counter_ns() - start
+            counter[2] -= 1
+
+    return wrapper
+
+
+# Counts calls to, and time spent in, the helper primitives puzzles lean on most. The helpers are only wrapped between
+# start() and stop(), so runs without instrumentation call the original methods directly.
+class HelperInstrumentation:
+    originals: Dict[Tuple[type, str], Callable]
+    counters: Dict[str, list]
+
+    def __init__(self):
+        self.originals = {}
+        self.counters = {}
+
+    def start(self):
+        for owner, name in get_instrumented_methods():
+            method = owner.__dict__[name]
+            counter = self.counters[f'{owner.__name__}.{name}'] = [0, 0, 0]
+
+            self.originals[(owner, name)] = method
+            setattr(owner, name, _wrap(method, counter))
+
+    # Returns (helper, calls, nanoseconds) for every helper that was called, most time first.
+    def stop(self) -> List[HelperEntry]:
+        for (owner, name), method in self.originals.items():
+            setattr(owner, name, method)
+
+        self.originals = {}
+
+        entries = [(label, calls, time_ns) for label, (calls, time_ns, _) in self.counters.items() if calls]
+
+        return sorted(entries, key=lambda entry: entry[2], reverse=True)
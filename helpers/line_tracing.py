@@ -0,0 +1,121 @@
+import linecache
+import os
+import sys
+from collections import Counter
+from typing import Callable, Dict, List, Set, Tuple
+
+from helpers.dependency_map import ROOT_DIR
+
+HELPERS_PREFIXES = (os.path.join(ROOT_DIR, 'helpers') + os.sep, os.path.join('helpers', ''))
+
+# sys.monitoring's tool ids 0-2 and 5 are claimed by debuggers, coverage, profilers and optimizers.
+MONITORING_TOOL_IDS = [3, 4]
+
+HotLine = Tuple[str, int, str]
+
+
+class LineCounter:
+    # Counts how often each line runs in the given files, plus everything in helpers/. Uses sys.monitoring where it
+    # exists (3.12+), which only pays for the lines it's asked about, and falls back to sys.settrace, which at least
+    # leaves every other file's frames untraced.
+    files: Set[str]
+    counts: Counter
+
+    def __init__(self, files: List[str]):
+        # Code objects keep whatever path their module was loaded by, relative or not.
+        self.files = set(files) | set(os.path.abspath(path) for path in files)
+        self.counts = Counter()
+        self.tool_id = None
+        self.previous_trace = None
+
+    def is_counted(self, file_name: str) -> bool:
+        return file_name in self.files or file_name.startswith(HELPERS_PREFIXES) and file_name != __file__
+
+    def on_line(self, code, line: int):
+        if not self.is_counted(code.co_filename):
+            # Stops this line of this function from calling us again until the events are restarted.
+            return sys.monitoring.DISABLE
+
+        self.counts[(code.co_filename, line)] += 1
+
+    def trace_calls(self, frame, event, arg):
+        if event == 'call' and self.is_counted(frame.f_code.co_filename):
+            return self.trace_lines
+
+        return None
+
+    def trace_lines(self, frame, event, arg):
+        if event == 'line':
+            self.counts[(frame.f_code.co_filename, frame.f_lineno)] += 1
+
+        return self.trace_lines
+
+    def start(self):
+        if hasattr(sys, 'monitoring'):
+            for tool_id in MONITORING_TOOL_IDS:
+                if sys.monitoring.get_tool(tool_id) is None:
+                    self.tool_id = tool_id
+                    break
+
+        if self.tool_id is not None:
+            sys.monitoring.use_tool_id(self.tool_id, 'line counts')
+            sys.monitoring.register_callback(self.tool_id, sys.monitoring.events.LINE, self.on_line)
+            sys.monitoring.set_events(self.tool_id, sys.monitoring.events.LINE)
+        else:
+            self.previous_trace = sys.gettrace()
+            sys.settrace(self.trace_calls)
+
+    def stop(self) -> Counter:
+        if self.tool_id is not None:
+            sys.monitoring.set_events(self.tool_id, 0)
+            sys.monitoring.register_callback(self.tool_id, sys.monitoring.events.LINE, None)
+            sys.monitoring.free_tool_id(self.tool_id)
+            # Lines disabled above would otherwise stay disabled for the next counter too.
+            sys.monitoring.restart_events()
+        else:
+            sys.settrace(self.previous_trace)
+
+        return self.counts
+
+
+def count_lines_call(func: Callable, files: List[str], *args) -> Tuple[any, Counter]:
+    counter = LineCounter(files)
+    counter.start()
+
+    try:
+        result = func(*args)
+    finally:
+        counts = counter.stop()
+
+    return result, counts
+
+
+def get_hottest_lines(counts: Counter, count: int) -> List[HotLine]:
+    return [(f'{os.path.relpath(file_name)}:{line}', executions, linecache.getline(file_name, line).strip())
+            for (file_name, line), executions in counts.most_common(count)]
+
+
+# Writes every file that had lines run as annotated source: each line prefixed with how often it ran and its share of
+# all the lines run. Files are in order of how much of the total they account for.
+def write_annotated_source(counts: Counter, report_path: str):
+    by_file: Dict[str, Dict[int, int]] = {}
+
+    for (file_name, line), executions in counts.items():
+        by_file.setdefault(file_name, {})[line] = executions
+
+    total = sum(counts.values()) or 1
+
+    os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+
+    with open(report_path, 'w') as report_file:
+        for file_name, line_counts in sorted(by_file.items(), key=lambda item: sum(item[1].values()), reverse=True):
+            report_file.write(f'=== {os.path.relpath(file_name)} ({sum(line_counts.values()) / total:.1%} of lines '
+                              f'run) ===\n')
+
+            for line, source in enumerate(linecache.getlines(file_name), start=1):
+                executions = line_counts.get(line)
+                annotation = f'{executions:>12} {executions / total:>6.1%}' if executions else ' ' * 19
+
+                report_file.write(f'{annotation} {line:>5}  {source.rstrip()}\n')
+
+            report_file.write('\n')
@@ -0,0 +1,71 @@
+import mmap
+import os
+from typing import Iterator, Union
+
+WHITESPACE = b' \t\r\n\x0b\x0c'
+
+
+class MappedInput:
+    path: str
+    should_strip_data: bool
+
+    # 'str' decodes each line, 'bytes' copies it out of the map, and 'memoryview' hands out zero-copy views which
+    # are only valid until the iteration that produced them finishes.
+    line_type: str
+
+    def __init__(self, path: str, should_strip_data=True, line_type='str'):
+        if line_type not in ['str', 'bytes', 'memoryview']:
+            raise ValueError(f'Unknown line type: {line_type}')
+
+        self.path = path
+        self.should_strip_data = should_strip_data
+        self.line_type = line_type
+
+    def __iter__(self) -> Iterator[Union[str, bytes, memoryview]]:
+        # Each pass maps the file afresh, so the same MappedInput can be read once per part.
+        with open(self.path, 'rb') as input_file:
+            if os.fstat(input_file.fileno()).st_size == 0:
+                # mmap refuses empty files; format_input('') would give us a single empty line.
+                yield self._convert(b'', 0, 0)
+                return
+
+            mapped = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+
+            try:
+                start = 0
+                while True:
+                    end = mapped.find(b'\n', start)
+                    line_end = end if end != -1 else len(mapped)
+
+                    yield self._convert(view, start, line_end)
+
+                    if end == -1:
+                        break
+
+                    start = end + 1
+            finally:
+                view.release()
+
+                try:
+                    mapped.close()
+                except BufferError:
+                    # The caller is still holding views into the map; it'll be closed once they're released.
+                    pass
+
+    def _convert(self, data: Union[bytes, memoryview], start: int, end: int) -> Union[str, bytes, memoryview]:
+        if self.should_strip_data:
+            while start < end and data[start] in WHITESPACE:
+                start += 1
+            while end > start and data[end - 1] in WHITESPACE:
+                end -= 1
+        elif end > start and data[end - 1] == ord('\r'):
+            # Text-mode reads translate line endings, so do the same here.
+            end -= 1
+
+        if self.line_type == 'memoryview':
+            return data[start:end] if isinstance(data, memoryview) else memoryview(data[start:end])
+        elif self.line_type == 'bytes':
+            return bytes(data[start:end])
+        else:
+            return str(data[start:end], 'utf-8')
@@ -0,0 +1,90 @@
+import os
+import sys
+import tracemalloc
+from typing import List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; max RSS is simply left out there.
+    resource = None
+
+AllocationSite = Tuple[str, int, int]
+
+IGNORED_FILES = [tracemalloc.__file__, '<frozen importlib._bootstrap>', '<frozen importlib._bootstrap_external>',
+                 '<unknown>']
+
+
+def get_max_rss() -> Optional[int]:
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is reported in bytes on macOS, but in kilobytes everywhere else.
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def get_process_peak_rss(pid: int) -> Optional[int]:
+    # Only Linux exposes another process's high-water mark without extra dependencies.
+    try:
+        with open(f'/proc/{pid}/status', 'r') as status_file:
+            for line in status_file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    return None
+
+
+def format_size(size: Optional[int]) -> str:
+    if size is None:
+        return 'N/A'
+
+    for unit in ['B', 'KB', 'MB']:
+        if abs(size) < 1024:
+            return f'{size:.1f} {unit}' if unit != 'B' else f'{size} {unit}'
+
+        size /= 1024
+
+    return f'{size:.2f} GB'
+
+
+class MemoryTracker:
+    top_count: int
+
+    was_tracing: bool
+
+    def __init__(self, top_count=5):
+        self.top_count = top_count
+        self.was_tracing = False
+
+    def start(self):
+        self.was_tracing = tracemalloc.is_tracing()
+
+        if self.was_tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+
+    def stop(self) -> dict:
+        _, peak = tracemalloc.get_traced_memory()
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, file_name) for file_name in IGNORED_FILES]
+        )
+
+        if not self.was_tracing:
+            tracemalloc.stop()
+
+        top_sites: List[AllocationSite] = [
+            (f'{os.path.relpath(stat.traceback[0].filename)}:{stat.traceback[0].lineno}', stat.size, stat.count)
+            for stat in snapshot.statistics('lineno')[:self.top_count]
+        ]
+
+        return {
+            'peak': peak,
+            'max_rss': get_max_rss(),
+            'top_sites': top_sites
+        }
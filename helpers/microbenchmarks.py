@@ -0,0 +1,369 @@
+import fnmatch
+import gc
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from helpers.grid import ArrayGrid, Grid3D, Point, Point3D, SparseGrid
+from helpers.pathing_grid import PathingGrid
+from helpers.timing_stats import summarize
+
+# A setup takes a size and returns the operation to time, plus how many primitive operations one call of it makes.
+# Timings are reported per primitive operation, so sizes can be compared with each other.
+Setup = Callable[[int], Tuple[Callable[[], any], int]]
+
+BENCHMARKS: Dict[str, Tuple[Setup, Tuple[int, ...]]] = {}
+
+DEFAULT_SIZE = 100
+
+
+def benchmark(name: str, sizes: Tuple[int, ...] = (DEFAULT_SIZE,)):
+    def register(setup: Setup):
+        BENCHMARKS[name] = (setup, sizes)
+        return setup
+
+    return register
+
+
+def get_grid_strings(size: int, seed=0) -> List[str]:
+    rng = random.Random(seed)
+
+    return [''.join('#' if rng.random() < 0.2 else '.' for _ in range(size)) for _ in range(size)]
+
+
+def get_points(size: int) -> List[Point]:
+    return [Point(x, y) for y in range(size) for x in range(size)]
+
+
+@benchmark('point.create')
+def point_create(size: int):
+    coordinates = [(x, y) for y in range(size) for x in range(size)]
+
+    def run():
+        for x, y in coordinates:
+            Point(x, y)
+
+    return run, len(coordinates)
+
+
+@benchmark('point.hash')
+def point_hash(size: int):
+    points = get_points(size)
+
+    def run():
+        for point in points:
+            hash(point)
+
+    return run, len(points)
+
+
+@benchmark('point.eq')
+def point_eq(size: int):
+    points = get_points(size)
+    others = [point.copy() for point in points]
+
+    def run():
+        for point, other in zip(points, others):
+            point == other
+
+    return run, len(points)
+
+
+@benchmark('point.add')
+def point_add(size: int):
+    points = get_points(size)
+    offset = Point(1, -1)
+
+    def run():
+        for point in points:
+            point + offset
+
+    return run, len(points)
+
+
+@benchmark('point.add_tuple')
+def point_add_tuple(size: int):
+    points = get_points(size)
+
+    def run():
+        for point in points:
+            point + (1, -1)
+
+    return run, len(points)
+
+
+@benchmark('point.sub')
+def point_sub(size: int):
+    points = get_points(size)
+    offset = Point(1, -1)
+
+    def run():
+        for point in points:
+            point - offset
+
+    return run, len(points)
+
+
+@benchmark('point.mul')
+def point_mul(size: int):
+    points = get_points(size)
+
+    def run():
+        for point in points:
+            point * 3
+
+    return run, len(points)
+
+
+@benchmark('point.dict_lookup')
+def point_dict_lookup(size: int):
+    points = get_points(size)
+    lookup = {point.copy(): True for point in points}
+
+    def run():
+        for point in points:
+            lookup[point]
+
+    return run, len(points)
+
+
+@benchmark('point3d.hash')
+def point3d_hash(size: int):
+    points = [Point3D(x, y, z) for z in range(4) for y in range(size) for x in range(size // 4)]
+
+    def run():
+        for point in points:
+            hash(point)
+
+    return run, len(points)
+
+
+def _grid_get(grid_type: type, keys: Callable[[int], list]):
+    def setup(size: int):
+        grid = grid_type.from_strings(get_grid_strings(size))
+        grid_keys = keys(size)
+
+        def run():
+            for key in grid_keys:
+                grid[key]
+
+        return run, len(grid_keys)
+
+    return setup
+
+
+def _grid_set(grid_type: type):
+    def setup(size: int):
+        grid = grid_type.from_strings(get_grid_strings(size))
+        points = get_points(size)
+
+        def run():
+            for point in points:
+                grid[point] = '#'
+
+        return run, len(points)
+
+    return setup
+
+
+def _grid_neighbors(grid_type: type, include_diagonals: bool):
+    def setup(size: int):
+        grid = grid_type.from_strings(get_grid_strings(size))
+        points = get_points(size)
+
+        def run():
+            for point in points:
+                grid.neighbors(point, include_diagonals)
+
+        return run, len(points)
+
+    return setup
+
+
+def _grid_copy(grid_type: type):
+    def setup(size: int):
+        grid = grid_type.from_strings(get_grid_strings(size))
+
+        return grid.copy, size * size
+
+    return setup
+
+
+def _from_strings(create: Callable[[List[str]], any]):
+    def setup(size: int):
+        strings = get_grid_strings(size)
+
+        return lambda: create(strings), size * size
+
+    return setup
+
+
+def _get_tuples(size: int) -> List[tuple]:
+    return [(x, y) for y in range(size) for x in range(size)]
+
+
+for _grid_name, _grid_type in [('array_grid', ArrayGrid), ('sparse_grid', SparseGrid)]:
+    benchmark(f'{_grid_name}.get_point')(_grid_get(_grid_type, get_points))
+    benchmark(f'{_grid_name}.get_tuple')(_grid_get(_grid_type, _get_tuples))
+    benchmark(f'{_grid_name}.set')(_grid_set(_grid_type))
+    benchmark(f'{_grid_name}.neighbors')(_grid_neighbors(_grid_type, False))
+    benchmark(f'{_grid_name}.neighbors_diagonal')(_grid_neighbors(_grid_type, True))
+    benchmark(f'{_grid_name}.copy')(_grid_copy(_grid_type))
+    benchmark(f'{_grid_name}.from_strings', (10, 100, 300))(_from_strings(_grid_type.from_strings))
+
+
+@benchmark('array_grid.slice')
+def array_grid_slice(size: int):
+    grid = ArrayGrid.from_strings(get_grid_strings(size))
+    # Slices stop one short of their end point, so this copies all but the last row and column.
+    grid_slice = slice(Point(0, 0), Point(size, size))
+
+    return lambda: grid[grid_slice], (size - 1) * (size - 1)
+
+
+def _get_grid_3d(size: int) -> Grid3D:
+    rng = random.Random(0)
+
+    return Grid3D.from_dict({Point3D(x, y, z): '#' for z in range(size) for y in range(size) for x in range(size)
+                             if rng.random() < 0.5})
+
+
+@benchmark('grid3d.get', (20,))
+def grid3d_get(size: int):
+    grid = _get_grid_3d(size)
+    points = [Point3D(x, y, z) for z in range(size) for y in range(size) for x in range(size)]
+
+    def run():
+        for point in points:
+            grid[point]
+
+    return run, len(points)
+
+
+@benchmark('grid3d.set', (20,))
+def grid3d_set(size: int):
+    grid = _get_grid_3d(size)
+    points = [Point3D(x, y, z) for z in range(size) for y in range(size) for x in range(size)]
+
+    def run():
+        for point in points:
+            grid[point] = '#'
+
+    return run, len(points)
+
+
+@benchmark('grid3d.neighbors', (20,))
+def grid3d_neighbors(size: int):
+    grid = _get_grid_3d(size)
+    points = [(x, y, z) for z in range(size) for y in range(size) for x in range(size)]
+
+    def run():
+        for point in points:
+            grid.neighbors(point)
+
+    return run, len(points)
+
+
+@benchmark('grid3d.copy', (20,))
+def grid3d_copy(size: int):
+    grid = _get_grid_3d(size)
+
+    return grid.copy, len(grid.grid)
+
+
+@benchmark('pathing_grid.from_strings', (10, 50, 100, 200))
+def pathing_grid_from_strings(size: int):
+    strings = get_grid_strings(size)
+    strings[0] = 'S' + strings[0][1:]
+    strings[-1] = strings[-1][:-1] + 'E'
+
+    return lambda: PathingGrid.from_strings(strings), size * size
+
+
+@benchmark('pathing_grid.copy', (100,))
+def pathing_grid_copy(size: int):
+    grid = PathingGrid.from_strings(get_grid_strings(size))
+
+    return grid.copy, size * size
+
+
+def get_benchmark_names(patterns: Optional[List[str]] = None) -> List[str]:
+    return [name for name in BENCHMARKS if not patterns or any(fnmatch.fnmatch(name, pattern) for pattern in patterns)]
+
+
+# Times one benchmark at one size. Each sample repeats the operation until it has taken at least min_time seconds, so
+# fast primitives aren't swamped by the timer's resolution. The collector is off while timing, as with timeit.
+def measure(setup: Setup, size: int, repeat: int, min_time: float) -> dict:
+    run, operations = setup(size)
+    run()
+
+    loops = 1
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        while True:
+            start = time.perf_counter_ns()
+            for _ in range(loops):
+                run()
+            elapsed = time.perf_counter_ns() - start
+
+            if elapsed >= min_time * 1e9:
+                break
+
+            loops *= 2 if elapsed * 2 >= min_time * 1e9 else 10
+
+        samples = [elapsed / (loops * operations)]
+
+        for _ in range(repeat - 1):
+            start = time.perf_counter_ns()
+            for _ in range(loops):
+                run()
+            samples.append((time.perf_counter_ns() - start) / (loops * operations))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {'size': size, 'operations': operations, 'loops': loops, **summarize(samples)}
+
+
+def get_result_key(name: str, size: int) -> str:
+    return f'{name}/{size}'
+
+
+def run_benchmarks(names: List[str], repeat: int, min_time: float, sizes: Optional[List[int]] = None,
+                   on_result: Callable[[str, dict], None] = None) -> Dict[str, dict]:
+    results = {}
+
+    for name in names:
+        setup, default_sizes = BENCHMARKS[name]
+
+        for size in sizes or default_sizes:
+            result = {'name': name, **measure(setup, size, repeat, min_time)}
+            results[get_result_key(name, size)] = result
+
+            if on_result:
+                on_result(get_result_key(name, size), result)
+
+    return results
+
+
+# Benchmarks whose median time per operation moved by more than threshold (a fraction) between two result sets, with
+# the largest moves first.
+def compare_benchmarks(old_results: Dict[str, dict], new_results: Dict[str, dict], threshold: float) -> List[dict]:
+    changes = []
+
+    for key in old_results.keys() & new_results.keys():
+        old_ns, new_ns = old_results[key]['median'], new_results[key]['median']
+
+        if not old_ns or not new_ns:
+            continue
+
+        ratio = new_ns / old_ns
+
+        if ratio > 1 + threshold:
+            changes.append({'key': key, 'old_ns': old_ns, 'new_ns': new_ns, 'ratio': ratio, 'flag': 'slower'})
+        elif ratio < 1 / (1 + threshold):
+            changes.append({'key': key, 'old_ns': old_ns, 'new_ns': new_ns, 'ratio': ratio, 'flag': 'faster'})
+
+    return sorted(changes, key=lambda change: max(change['ratio'], 1 / change['ratio']), reverse=True)
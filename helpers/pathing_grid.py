@@ -38,6 +38,13 @@ class Node:
 
         return self.char_code
 
+    def copy(self):
+        # Skips __init__, which is noticeably cheaper than re-parsing every node when copying large grids.
+        node = self.__class__.__new__(self.__class__)
+        node.__dict__.update(self.__dict__)
+
+        return node
+
     def set_is_start(self, is_start: bool):
         self.is_start = is_start
 
@@ -107,9 +114,17 @@ class PathingGrid(ArrayGrid):
 
         return grid
 
+    def copy(self):
+        grid = PathingGrid([[node.copy() for node in row] for row in self.grid], self.default_value)
+
+        grid.start_pos = self.start_pos
+        grid.end_pos = self.end_pos
+
+        return grid
+
     def locate_start_end(self):
-        for x in range(self.extents[0][1]):
-            for y in range(self.extents[1][1]):
+        for x in range(self.extents[0][1] + 1):
+            for y in range(self.extents[1][1] + 1):
                 node = self[(x, y)]
 
                 if node.char_code == 'S':
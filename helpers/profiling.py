@@ -0,0 +1,136 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from typing import Callable, List, Tuple
+
+ProfileEntry = Tuple[str, int, float, float]
+SampledEntry = Tuple[str, int, int]
+
+
+def profile_call(func: Callable, stats_path: str, *args):
+    profiler = cProfile.Profile()
+
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        os.makedirs(os.path.dirname(stats_path) or '.', exist_ok=True)
+        profiler.dump_stats(stats_path)
+
+
+def format_function(file_name: str, line: int, function_name: str) -> str:
+    if file_name == '~':
+        # Built-ins have no source location, and pstats already names them like '<built-in method ...>'.
+        return function_name
+
+    try:
+        file_name = os.path.relpath(file_name)
+    except ValueError:
+        pass
+
+    return f'{file_name}:{line}({function_name})'
+
+
+def get_top_functions(stats_path: str, count: int) -> List[ProfileEntry]:
+    stats = pstats.Stats(stats_path).stats
+
+    # The profiler's own disable() call shows up in every capture, so it's left out.
+    entries = [(format_function(*function), call_count, total_time, cumulative_time)
+               for function, (_, call_count, total_time, cumulative_time, _) in stats.items()
+               if '_lsprof.Profiler' not in function[2]]
+
+    return sorted(entries, key=lambda entry: entry[3], reverse=True)[:count]
+
+
+def _call_sampled(func: Callable, args: tuple):
+    return func(*args)
+
+
+class StackSampler(threading.Thread):
+    # Snapshots another thread's Python stack every interval seconds, counting each distinct stack. Only frames called
+    # from _call_sampled() are kept, so the runner's own frames don't show up in every sample.
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(daemon=True)
+
+        self.thread_id = thread_id
+        self.interval = interval
+
+        self.stacks = Counter()
+        self.labels = {}
+        self.stopped = threading.Event()
+
+    def get_label(self, code) -> str:
+        label = self.labels.get(code)
+
+        if label is None:
+            label = self.labels[code] = format_function(code.co_filename, code.co_firstlineno, code.co_name)
+
+        return label
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+
+            while frame is not None and frame.f_code is not _call_sampled.__code__:
+                stack.append(self.get_label(frame.f_code))
+                frame = frame.f_back
+
+            # Samples taken before the call starts, or after it returns, have nothing of the call in them.
+            if stack and frame is not None:
+                self.stacks[tuple(reversed(stack))] += 1
+
+
+# Runs func(*args) while another thread samples its stack rate times a second, then writes the samples to stacks_path
+# in the collapsed format flamegraph.pl, speedscope and inferno read: one 'root;...;leaf count' line per stack.
+# Unlike cProfile this costs nothing per call, so days made of millions of tiny calls keep their shape.
+def sample_call(func: Callable, stacks_path: str, rate: float, *args):
+    interval = 1 / rate
+
+    # The sampler can only look while it holds the GIL, which a busy solve only gives up every switch interval.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+
+    sampler = StackSampler(threading.get_ident(), interval)
+    sampler.start()
+
+    try:
+        return _call_sampled(func, args)
+    finally:
+        sampler.stopped.set()
+        sampler.join()
+        sys.setswitchinterval(switch_interval)
+
+        os.makedirs(os.path.dirname(stacks_path) or '.', exist_ok=True)
+
+        with open(stacks_path, 'w') as stacks_file:
+            for stack, count in sampler.stacks.most_common():
+                stacks_file.write(f'{";".join(stack)} {count}\n')
+
+
+# Reads a collapsed stacks file back into (function, own samples, total samples) for its hottest functions, along with
+# the number of samples taken.
+def get_top_sampled_functions(stacks_path: str, count: int) -> Tuple[List[SampledEntry], int]:
+    own_samples = Counter()
+    total_samples = Counter()
+    sample_count = 0
+
+    with open(stacks_path, 'r') as stacks_file:
+        for line in stacks_file:
+            stack, samples = line.rstrip('\n').rsplit(' ', 1)
+            samples = int(samples)
+            functions = stack.split(';')
+
+            own_samples[functions[-1]] += samples
+            # Recursive functions appear more than once in a stack, but were still only running once at the time.
+            for function in set(functions):
+                total_samples[function] += samples
+
+            sample_count += samples
+
+    entries = [(function, own_samples[function], total) for function, total in total_samples.items()]
+
+    # Callers come before the functions they spend all their time in.
+    return sorted(entries, key=lambda entry: (entry[2], -entry[1]), reverse=True)[:count], sample_count
@@ -0,0 +1,209 @@
+import os
+import platform
+import socket
+import sqlite3
+import statistics
+import subprocess
+import time
+from typing import Dict, List, Optional, Tuple
+
+from helpers.baselines import MIN_DELTA_NS, get_record_time
+from helpers.dependency_map import ROOT_DIR
+
+HISTORY_PATH = os.path.join(ROOT_DIR, '.run_history.sqlite')
+
+# Tracking memory slows every part down, so those runs are recorded under their mode with this added, and are left out
+# of the timing rankings unless that mode is asked for.
+MEMORY_MODE_SUFFIX = ',memory'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    commit_hash TEXT,
+    is_dirty INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    hostname TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    python_version TEXT NOT NULL,
+    cpu_count INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    answer TEXT,
+    time_ns INTEGER,
+    reset_ns INTEGER,
+    parse_ns INTEGER,
+    solve_ns INTEGER,
+    peak_bytes INTEGER,
+    max_rss_bytes INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS results_by_part ON results (year, day, part);
+'''
+
+
+def _run_git(*args) -> Optional[str]:
+    try:
+        return subprocess.run(['git', *args], cwd=ROOT_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_commit() -> Tuple[Optional[str], bool]:
+    commit_hash = _run_git('rev-parse', 'HEAD')
+
+    # Only tracked files count; scratch inputs and caches lying around don't make a run's code any different.
+    changes = _run_git('status', '--porcelain', '--untracked-files=no')
+
+    return commit_hash, bool(changes)
+
+
+# Turns anything git understands (HEAD~3, a branch, a short hash) into a full hash, so runs can be looked up by it.
+# Refs git doesn't know are used as hash prefixes as they are.
+def resolve_commit(ref: str) -> str:
+    return _run_git('rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}') or ref
+
+
+def get_host_info() -> dict:
+    return {
+        'hostname': socket.gethostname(),
+        'platform': platform.platform(),
+        'python_version': platform.python_version(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def connect(path: str = HISTORY_PATH) -> sqlite3.Connection:
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    connection.executescript(SCHEMA)
+
+    return connection
+
+
+def record_run(connection: sqlite3.Connection, records: List[dict], mode: str) -> int:
+    commit_hash, is_dirty = get_commit()
+    host_info = get_host_info()
+
+    with connection:
+        run_id = connection.execute(
+            'INSERT INTO runs (started_at, commit_hash, is_dirty, mode, hostname, platform, python_version, cpu_count) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (time.strftime('%Y-%m-%d %H:%M:%S'), commit_hash, is_dirty, mode, host_info['hostname'],
+             host_info['platform'], host_info['python_version'], host_info['cpu_count'])
+        ).lastrowid
+
+        connection.executemany(
+            'INSERT INTO results (run_id, year, day, part, status, answer, time_ns, reset_ns, parse_ns, solve_ns, '
+            'peak_bytes, max_rss_bytes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(run_id, record['year'], record['day'], record['part'], record['status'],
+              None if record['answer'] is None else str(record['answer']), get_record_time(record),
+              record['reset_ns'], record['parse_ns'], record['solve_ns'], record.get('peak_bytes'),
+              record.get('max_rss_bytes'))
+             for record in records]
+        )
+
+    return run_id
+
+
+def _get_filters(host: Optional[str], mode: Optional[str], timing_only: bool = False) -> Tuple[str, list]:
+    conditions, parameters = [], []
+
+    if host:
+        conditions.append('runs.hostname = ?')
+        parameters.append(host)
+
+    if mode:
+        conditions.append('runs.mode = ?')
+        parameters.append(mode)
+    elif timing_only:
+        conditions.append('runs.mode NOT LIKE ?')
+        parameters.append(f'%{MEMORY_MODE_SUFFIX}')
+
+    return ''.join(f' AND {condition}' for condition in conditions), parameters
+
+
+# A day's results across runs, oldest first.
+def get_trend(connection: sqlite3.Connection, year: int, day: int, part: Optional[int] = None, limit: int = 20,
+              host: Optional[str] = None, mode: Optional[str] = None) -> List[sqlite3.Row]:
+    filters, parameters = _get_filters(host, mode)
+
+    if part:
+        filters += ' AND results.part = ?'
+        parameters.append(part)
+
+    rows = connection.execute(
+        'SELECT runs.*, results.* FROM results JOIN runs ON runs.id = results.run_id '
+        f'WHERE results.year = ? AND results.day = ?{filters} ORDER BY runs.id DESC, results.part LIMIT ?',
+        [year, day] + parameters + [limit]
+    ).fetchall()
+
+    return rows[::-1]
+
+
+# The latest successful result of every part, slowest first.
+def get_slowest(connection: sqlite3.Connection, limit: int = 10, year: Optional[int] = None,
+                commit: Optional[str] = None, host: Optional[str] = None,
+                mode: Optional[str] = None) -> List[sqlite3.Row]:
+    filters, parameters = _get_filters(host, mode, True)
+
+    if year:
+        filters += ' AND results.year = ?'
+        parameters.append(year)
+
+    if commit:
+        filters += ' AND runs.commit_hash LIKE ?'
+        parameters.append(f'{commit}%')
+
+    return connection.execute(
+        'SELECT runs.*, results.* FROM results JOIN runs ON runs.id = results.run_id '
+        'WHERE results.rowid IN ('
+        '    SELECT MAX(results.rowid) FROM results JOIN runs ON runs.id = results.run_id '
+        f"    WHERE results.status = 'ok'{filters} GROUP BY results.year, results.day, results.part"
+        ') ORDER BY results.time_ns DESC LIMIT ?',
+        parameters + [limit]
+    ).fetchall()
+
+
+def _get_median_times(connection: sqlite3.Connection, commit: str, filters: str,
+                      parameters: list) -> Dict[Tuple[int, int, int], int]:
+    times = {}
+
+    for row in connection.execute(
+            'SELECT results.year, results.day, results.part, results.time_ns FROM results '
+            'JOIN runs ON runs.id = results.run_id '
+            f"WHERE results.status = 'ok' AND runs.commit_hash LIKE ? AND NOT runs.is_dirty{filters}",
+            [f'{commit}%'] + parameters):
+        times.setdefault((row['year'], row['day'], row['part']), []).append(row['time_ns'])
+
+    return {key: statistics.median(part_times) for key, part_times in times.items()}
+
+
+# Parts whose median time changed the most between two commits, by ratio. Runs with uncommitted changes are left
+# out, since they don't show either commit's code.
+def get_movers(connection: sqlite3.Connection, old_commit: str, new_commit: str, limit: int = 10,
+               host: Optional[str] = None, mode: Optional[str] = None) -> List[dict]:
+    filters, parameters = _get_filters(host, mode, True)
+
+    old_times = _get_median_times(connection, old_commit, filters, parameters)
+    new_times = _get_median_times(connection, new_commit, filters, parameters)
+
+    movers = [{'year': year, 'day': day, 'part': part, 'old_ns': old_times[(year, day, part)],
+               'new_ns': new_times[(year, day, part)]}
+              for year, day, part in sorted(old_times.keys() & new_times.keys())
+              if old_times[(year, day, part)] and new_times[(year, day, part)]]
+
+    # As with baselines, changes this small are noise however large they are relative to the old time.
+    movers = [mover for mover in movers if abs(mover['new_ns'] - mover['old_ns']) >= MIN_DELTA_NS]
+
+    for mover in movers:
+        mover['ratio'] = mover['new_ns'] / mover['old_ns']
+
+    # Halving and doubling are moves of the same size.
+    return sorted(movers, key=lambda mover: max(mover['ratio'], 1 / mover['ratio']), reverse=True)[:limit]
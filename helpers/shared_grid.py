@@ -0,0 +1,174 @@
+import math
+from array import array
+from multiprocessing import Pool, shared_memory
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from helpers.grid import ArrayGrid, Grid, Point
+
+
+class GridHandle:
+    name: str
+    width: int
+    height: int
+    default_value: str
+
+    def __init__(self, name: str, width: int, height: int, default_value: str):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.default_value = default_value
+
+
+class TableHandle:
+    name: str
+    format: str
+    shape: Tuple[int, ...]
+
+    def __init__(self, name: str, format: str, shape: Tuple[int, ...]):
+        self.name = name
+        self.format = format
+        self.shape = shape
+
+
+Handle = Union[GridHandle, TableHandle]
+
+
+# A read-only ArrayGrid look-alike over a grid published to shared memory, one byte per cell. Nothing is copied into
+# the processes reading it.
+class SharedGridView(Grid):
+    cells: memoryview
+
+    def __init__(self, cells: memoryview, width: int, height: int, default_value: str):
+        self.cells = cells
+        self.default_value = default_value
+        self.extents = [[0, width - 1], [0, height - 1]]
+
+    def __getitem__(self, item: Union[Point, Grid._key_base_type, slice]):
+        if isinstance(item, slice):
+            raise NotImplementedError
+
+        x, y = item[0], item[1]
+
+        if 0 <= x <= self.extents[0][1] and 0 <= y <= self.extents[1][1]:
+            return chr(self.cells[y * (self.extents[0][1] + 1) + x])
+
+        return None
+
+    def __setitem__(self, key: Union[Point, Grid._key_base_type], value):
+        raise TypeError('Shared grids are read-only; copy() one to change it.')
+
+    def __str__(self):
+        return '\n'.join(bytes(self.cells[y * self.width:(y + 1) * self.width]).decode('latin-1')
+                         for y in range(self.height))
+
+    def neighbors(self, pos: Point, include_diagonals=False):
+        x0, y0 = pos
+
+        candidates = [(x0 - 1, y0), (x0 + 1, y0), (x0, y0 - 1), (x0, y0 + 1)]
+        if include_diagonals:
+            candidates += [(x0 - 1, y0 - 1), (x0 - 1, y0 + 1), (x0 + 1, y0 - 1), (x0 + 1, y0 + 1)]
+        return [(p, self[p]) for p in candidates if self[p] is not None]
+
+    @property
+    def width(self) -> int:
+        return self.extents[0][1] + 1
+
+    @property
+    def height(self) -> int:
+        return self.extents[1][1] + 1
+
+    def copy(self):
+        return ArrayGrid.from_strings(str(self).split('\n'), self.default_value)
+
+
+# Owns shared memory blocks for the length of a with block, then frees them. What's published is described by small
+# handles, which cost the same to send to another process however much data is behind them.
+class SharedArrays:
+    blocks: List[shared_memory.SharedMemory]
+
+    def __init__(self):
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _publish_bytes(self, data: bytes) -> str:
+        # Empty blocks aren't allowed, even for empty grids.
+        block = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+        block.buf[:len(data)] = data
+
+        self.blocks.append(block)
+
+        return block.name
+
+    def publish_grid(self, grid: ArrayGrid) -> GridHandle:
+        # Every cell has to be one character that fits in a byte, which covers the puzzles' character grids.
+        data = ''.join(''.join(row) for row in grid.grid).encode('latin-1')
+
+        if len(data) != grid.width * grid.height:
+            raise ValueError('Only grids of single characters can be shared.')
+
+        return GridHandle(self._publish_bytes(data), grid.width, grid.height, grid.default_value)
+
+    # Publishes a flat list of numbers as a table of the given shape, which readers index with tuples. The format is
+    # one of array's type codes.
+    def publish_table(self, values: List[int], shape: Tuple[int, ...], format: str = 'i') -> TableHandle:
+        if len(values) != math.prod(shape):
+            raise ValueError(f'{len(values)} values don\'t fill a table of shape {shape}.')
+
+        return TableHandle(self._publish_bytes(array(format, values).tobytes()), format, shape)
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+        self.blocks = []
+
+
+# Blocks this process has attached to, kept open for as long as it has views of them.
+_attached_blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _attach_block(name: str) -> memoryview:
+    if name not in _attached_blocks:
+        _attached_blocks[name] = shared_memory.SharedMemory(name)
+
+    return _attached_blocks[name].buf
+
+
+def attach(handle: Handle) -> Union[SharedGridView, memoryview]:
+    buffer = _attach_block(handle.name)
+
+    if isinstance(handle, GridHandle):
+        return SharedGridView(buffer[:handle.width * handle.height].toreadonly(), handle.width, handle.height,
+                              handle.default_value)
+
+    item_size = array(handle.format).itemsize
+
+    return buffer[:math.prod(handle.shape) * item_size].cast(handle.format, handle.shape).toreadonly()
+
+
+_worker_task: Optional[Callable] = None
+
+
+def _init_worker(create_task: Callable[[dict], Callable], handles: Dict[str, Handle]):
+    global _worker_task
+
+    _worker_task = create_task({key: attach(handle) for key, handle in handles.items()})
+
+
+def _run_task(item):
+    return _worker_task(item)
+
+
+# Pool.map() for tasks that all read the same large data. Each worker attaches to the handles once, and calls
+# create_task() with a dict of their views to build the function it then runs on each item, so only the items
+# themselves are sent per task. create_task has to be picklable, i.e. a module level function.
+def shared_pool_map(create_task: Callable[[dict], Callable], items: Iterable, handles: Dict[str, Handle],
+                    processes: Optional[int] = None, chunksize: Optional[int] = None) -> list:
+    with Pool(processes, initializer=_init_worker, initargs=(create_task, handles)) as pool:
+        return pool.map(_run_task, items, chunksize)
@@ -0,0 +1,28 @@
+import math
+import statistics
+from typing import Dict, List
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0
+
+    ordered = sorted(samples)
+
+    # Nearest-rank percentile, so the result is always one of the measured samples.
+    rank = max(1, math.ceil(fraction * len(ordered)))
+
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {'runs': 0, 'min': 0, 'median': 0, 'p95': 0, 'stdev': 0}
+
+    return {
+        'runs': len(samples),
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'p95': percentile(samples, 0.95),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0
+    }
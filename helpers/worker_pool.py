@@ -0,0 +1,133 @@
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from multiprocessing.connection import wait
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from helpers.memory_tracking import get_process_peak_rss
+
+TIMED_OUT = 'timed_out'
+CRASHED = 'crashed'
+
+
+class WorkerState:
+    task: tuple
+    process: multiprocessing.Process
+
+    deadline: float
+    # When the current budget started, so a timeout can say how long the worker had been going.
+    budget_start: float
+
+    # Everything the worker reported before finishing, for callers that want partial results.
+    updates: list
+
+    def __init__(self, task, process, timeout):
+        self.task = task
+        self.process = process
+        self.updates = []
+
+        self.restart_budget(timeout)
+
+    def restart_budget(self, timeout: float):
+        self.budget_start = time.monotonic()
+        self.deadline = self.budget_start + timeout
+
+
+def _worker_main(target: Callable, task: tuple, connection):
+    # Each worker leads its own process group, so a timeout can also take down any
+    # processes the puzzle itself spawned (e.g. the Pool in 2024 day 6).
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+
+    def report(update: dict):
+        connection.send(('update', update))
+
+    result = target(*task, report)
+
+    connection.send(('result', result))
+    connection.close()
+
+
+def _kill_worker(process: multiprocessing.Process):
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            process.kill()
+    else:
+        process.kill()
+
+    process.join()
+
+
+# Runs target(*task, report) for each task in its own process, at most `jobs` at a time, and yields
+# (task, status, result) in completion order. Workers can call report() with a dict to send progress back; a
+# 'timeout' entry in it restarts their budget with that many seconds. Workers that overrun their budget are
+# killed, and yielded with a result holding their updates, elapsed time and peak RSS.
+#
+# start_method picks how workers are started, as with multiprocessing.get_context(). Forked workers (the default on
+# Linux) share our imports, while spawned ones import everything afresh.
+def run_tasks(target: Callable, tasks: Iterable[tuple], jobs: int, timeout: float,
+              start_method: Optional[str] = None) -> Iterator[Tuple[tuple, str, any]]:
+    context = multiprocessing.get_context(start_method)
+    pending = list(tasks)
+    running = {}
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            task = pending.pop(0)
+
+            receiver, sender = context.Pipe(duplex=False)
+
+            # Anything still sitting in our stdout buffer would otherwise be flushed a second time by the child.
+            sys.stdout.flush()
+
+            # Workers can't be daemonic, since some puzzles start their own multiprocessing pools.
+            process = context.Process(target=_worker_main, args=(target, task, sender), daemon=False)
+            process.start()
+            sender.close()
+
+            running[receiver] = WorkerState(task, process, timeout)
+
+        next_deadline = min(worker.deadline for worker in running.values())
+        ready = wait(list(running.keys()), timeout=max(0.0, next_deadline - time.monotonic()))
+
+        for receiver in ready:
+            worker = running[receiver]
+
+            try:
+                message_type, message = receiver.recv()
+            except EOFError:
+                message_type, message = CRASHED, None
+
+            if message_type == 'update':
+                worker.updates.append(message)
+
+                if 'timeout' in message:
+                    worker.restart_budget(message['timeout'])
+
+                continue
+
+            running.pop(receiver)
+            receiver.close()
+            worker.process.join()
+
+            yield worker.task, 'ok' if message_type == 'result' else CRASHED, message
+
+        now = time.monotonic()
+        for receiver, worker in list(running.items()):
+            if worker.deadline <= now:
+                running.pop(receiver)
+
+                peak_rss = get_process_peak_rss(worker.process.pid)
+
+                _kill_worker(worker.process)
+                receiver.close()
+
+                yield worker.task, TIMED_OUT, {
+                    'updates': worker.updates,
+                    'elapsed': now - worker.budget_start,
+                    'peak_rss': peak_rss
+                }
@@ -1,16 +1,83 @@
+import copy
+import gc
 import json
 import os
+import random
 import time
 from abc import abstractmethod
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from helpers.complexity import DEFAULT_EXPECTED_GROWTH
+from helpers.gc_tracking import GcTracker
+from helpers.instrumentation import HelperInstrumentation, is_enabled_by_environment
+from helpers.line_tracing import count_lines_call, get_hottest_lines, write_annotated_source
+from helpers.mapped_input import MappedInput
+from helpers.memory_tracking import MemoryTracker
+from helpers.profiling import profile_call, sample_call
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+# Process-wide caches, so every puzzle in a run shares one parse of each file. Entries are keyed by path and
+# carry the file's mtime, so edited files are picked up again.
+_input_cache: Dict[tuple, tuple] = {}
+_sample_cache: Dict[int, tuple] = {}
+
+
 def format_input(input_str: str, should_strip_data=True):
     return [line.strip() if should_strip_data else line for line in input_str.split('\n')]
 
 
+def get_input_path(year: int, day: int) -> str:
+    return os.path.join(ROOT_DIR, f'year_{year}', 'inputs', 'day-%d.txt' % day)
+
+
+def load_input(year: int, day: int, should_strip_data=True) -> List[str]:
+    input_path = get_input_path(year, day)
+    modified_time = os.stat(input_path).st_mtime_ns
+
+    cache_key = (input_path, should_strip_data)
+    cached = _input_cache.get(cache_key)
+
+    if cached is None or cached[0] != modified_time:
+        with open(input_path, 'r') as input_file:
+            cached = (modified_time, format_input(input_file.read(), should_strip_data))
+
+        _input_cache[cache_key] = cached
+
+    # Every caller gets its own list, so a puzzle that changes its input can't change it for the next one.
+    return list(cached[1])
+
+
+def load_sample_json(year: int) -> list:
+    sample_path = os.path.join(ROOT_DIR, 'sample_data', '%d_data.json' % year)
+    modified_time = os.stat(sample_path).st_mtime_ns
+
+    cached = _sample_cache.get(year)
+
+    if cached is None or cached[0] != modified_time:
+        with open(sample_path, 'r') as sample_file:
+            cached = (modified_time, json.loads(sample_file.read()))
+
+        _sample_cache[year] = cached
+
+    return cached[1]
+
+
+REFERENCE_IMPLEMENTATION = 'reference'
+
+
+# Registers a method as another way of answering a part, next to get_part_1_answer() or get_part_2_answer() (which are
+# the part's 'reference' implementation). It takes the same arguments as they do. run_year.py --compare-implementations
+# checks that every implementation gives the same answers and times them side by side.
+def implementation(part: int, name: str):
+    def register(method):
+        method.implementation = (part, name)
+        return method
+
+    return register
+
+
 class SampleData:
     day: int
 
@@ -24,7 +91,9 @@ class SampleData:
         self.day = day
 
         self.input_data = format_input(input_str, should_strip_data)
-        self.input_data_2 = format_input(input_str_2, should_strip_data)
+        # Sharing the list when both parts use the same sample lets parse_once puzzles parse it only once.
+        self.input_data_2 = self.input_data if input_str_2 == input_str else \
+            format_input(input_str_2, should_strip_data)
         self.answer_1 = answer_1
         self.answer_2 = answer_2
 
@@ -35,22 +104,116 @@ class PuzzleBase(object):
 
     should_strip_data = True
 
-    input_data: List[str]
-    sample_data: SampleData
+    # Both are loaded on first access (see the input_data and sample_data properties).
+    _input_data: Optional[List[str]] = None
+    _sample_data: Optional[SampleData] = None
+
+    # Puzzles whose prepare_data() only iterates over its input once can set this to 'str', 'bytes' or 'memoryview'.
+    # Real runs then get an mmap-backed MappedInput that yields lines lazily instead of the input_data list.
+    stream_input: Optional[str] = None
+    _input_stream: Optional[MappedInput] = None
 
     is_silent: bool = False
 
-    def __init__(self):
-        input_path = os.path.join(ROOT_DIR, f'year_{self.year}', 'inputs', 'day-%d.txt' % self.day)
-        with open(input_path, 'r') as input_file:
-            self.input_data = format_input(input_file.read(), self.should_strip_data)
+    # Nanosecond reset/parse/solve timings from the latest runs, keyed by 'sample' or 'real', then by part.
+    phase_timings: Dict[str, Dict[int, Dict[str, int]]]
 
-        sample_path = os.path.join(ROOT_DIR, 'sample_data', '%d_data.json' % self.year)
-        with open(sample_path, 'r') as sample_file:
-            sample_json = json.loads(sample_file.read())
+    # When set, each part's solve phase is run under cProfile and its stats are dumped into this folder.
+    profile_dir: Optional[str] = None
+    profile_paths: Dict[int, str]
+
+    # When set, each part's solve phase is sampled stack_sample_rate times a second instead, and its collapsed stacks
+    # are written into this folder.
+    stack_sample_dir: Optional[str] = None
+    stack_sample_rate: float = 1000
+    stack_paths: Dict[int, str]
+
+    # When set, each part's solve phase counts how often each line of this puzzle and of helpers/ runs. The hottest
+    # lines go into line_stats, and the annotated source into this folder.
+    line_count_dir: Optional[str] = None
+    line_stats: Dict[int, dict]
+
+    # When set, each part records its tracemalloc peak, max RSS and largest allocation sites into memory_stats.
+    track_memory: bool = False
+    memory_stats: Dict[str, Dict[int, dict]]
+
+    # When set, each part records how often it called the main grid, point and list helpers, and how long they took,
+    # into helper_stats.
+    instrument_helpers: bool = is_enabled_by_environment()
+    helper_stats: Dict[str, Dict[int, list]]
+
+    # Solvers that churn through short-lived objects can spend a lot of their time in the cyclic collector. Freezing
+    # moves everything that exists after parsing out of its reach, and solve_gc_thresholds replaces the collector's
+    # thresholds while solving, with (0,) turning it off. Both are undone once the part is solved.
+    freeze_gc_after_parse = False
+    solve_gc_thresholds: Optional[Tuple[int, ...]] = None
+
+    # When set, each part records how many collections ran and how long they paused it into gc_stats.
+    track_gc: bool = False
+    gc_stats: Dict[str, Dict[int, dict]]
+
+    # Puzzles whose parsing doesn't depend on the part can set this and implement parse_input(). Each input is then
+    # parsed once, and every part gets a copy_parsed_input() copy of it in parsed_input before prepare_data() runs.
+    parse_once = False
+    parsed_input: any = None
+    _parsed_inputs: Dict[int, tuple]
+
+    # Which of each part's implementations run_part() uses; parts that have none by this name use the reference one.
+    implementation_name: str = REFERENCE_IMPLEMENTATION
+
+    # Known-slow puzzles can ask the runner for more time than its default budgets, in seconds per part.
+    part_timeouts: Optional[Tuple[float, float]] = None
+
+    # How each part's runtime should grow with its input's length, as one of helpers.complexity.GROWTH_CLASSES.
+    # Sweeps with --fit flag parts that grow faster than this.
+    expected_growth: Tuple[str, str] = (DEFAULT_EXPECTED_GROWTH, DEFAULT_EXPECTED_GROWTH)
 
-            day_data = sample_json[self.day - 1]
-            self.sample_data = SampleData(
+    def __init__(self):
+        self._parsed_inputs = {}
+        self.phase_timings = {'sample': {}, 'real': {}}
+        self.profile_paths = {}
+        self.stack_paths = {}
+        self.line_stats = {}
+        self.memory_stats = {'sample': {}, 'real': {}}
+        self.helper_stats = {'sample': {}, 'real': {}}
+        self.gc_stats = {'sample': {}, 'real': {}}
+
+    @property
+    def input_data(self) -> List[str]:
+        if self._input_data is None:
+            self._input_data = load_input(self.year, self.day, self.should_strip_data)
+
+        return self._input_data
+
+    @input_data.setter
+    def input_data(self, value: List[str]):
+        self._input_data = value
+
+    def get_real_input(self) -> Union[List[str], MappedInput]:
+        if not self.stream_input or self._input_data is not None:
+            return self.input_data
+
+        if self._input_stream is None:
+            self._input_stream = MappedInput(get_input_path(self.year, self.day), self.should_strip_data,
+                                             self.stream_input)
+
+        return self._input_stream
+
+    # Forgets the real input and anything parsed from it, so the next real run reads the file afresh.
+    def forget_real_input(self):
+        for real_input in [self._input_data, self._input_stream]:
+            if real_input is not None:
+                self._parsed_inputs.pop(id(real_input), None)
+
+        self._input_data = None
+        self._input_stream = None
+
+    @property
+    def sample_data(self) -> SampleData:
+        if self._sample_data is None:
+            day_data = load_sample_json(self.year)[self.day - 1]
+
+            self._sample_data = SampleData(
                 day_data['day'],
                 day_data['input_data'],
                 day_data['input_data_2'] if 'input_data_2' in day_data else day_data['input_data'],
@@ -59,7 +222,13 @@ class PuzzleBase(object):
                 self.should_strip_data
             )
 
-    def format_run_time(self, start_time: time, end_time: time):
+        return self._sample_data
+
+    @sample_data.setter
+    def sample_data(self, value: SampleData):
+        self._sample_data = value
+
+    def format_run_time(self, start_time: float, end_time: float):
         delta = end_time - start_time
 
         if delta < 1:
@@ -71,6 +240,132 @@ class PuzzleBase(object):
         else:
             return f'{delta / 3600} hours'
 
+    def describe_part_timing(self, run_type: str, part: int) -> str:
+        phases = self.phase_timings[run_type][part]
+
+        return f'{self.format_run_time(0, sum(phases.values()) / 1e9)} ' \
+               f'(reset {self.format_run_time(0, phases["reset"] / 1e9)}, ' \
+               f'parse {self.format_run_time(0, phases["parse"] / 1e9)}, ' \
+               f'solve {self.format_run_time(0, phases["solve"] / 1e9)})'
+
+    def get_implementations(self, part: int) -> Dict[str, Callable[[bool], str]]:
+        implementations = {REFERENCE_IMPLEMENTATION: self.get_part_1_answer if part == 1 else self.get_part_2_answer}
+
+        for attribute_name in dir(type(self)):
+            registration = getattr(getattr(type(self), attribute_name), 'implementation', None)
+
+            if registration and registration[0] == part:
+                implementations[registration[1]] = getattr(self, attribute_name)
+
+        return implementations
+
+    def get_solver(self, part: int) -> Callable[[bool], str]:
+        if self.implementation_name != REFERENCE_IMPLEMENTATION:
+            solver = self.get_implementations(part).get(self.implementation_name)
+
+            if solver:
+                return solver
+
+        return self.get_part_1_answer if part == 1 else self.get_part_2_answer
+
+    # Passing None runs the real input, which is then loaded inside the timed parse phase.
+    def run_part(self, input_data: Optional[List[str]], part: int, use_sample: bool) -> (str, float):
+        solve = self.get_solver(part)
+
+        memory_tracker = MemoryTracker() if self.track_memory else None
+        if memory_tracker:
+            memory_tracker.start()
+
+        instrumentation = HelperInstrumentation() if self.instrument_helpers else None
+        if instrumentation:
+            instrumentation.start()
+
+        gc_tracker = GcTracker() if self.track_gc else None
+        if gc_tracker:
+            gc_tracker.start()
+
+        gc_thresholds = gc.get_threshold()
+
+        try:
+            time_before = time.perf_counter_ns()
+
+            self.reset()
+            time_after_reset = time.perf_counter_ns()
+
+            if input_data is None:
+                input_data = self.get_real_input()
+
+            if self.parse_once:
+                self.parsed_input = self.copy_parsed_input(self.get_parsed_input(input_data))
+
+            self.prepare_data(input_data, part)
+
+            if self.freeze_gc_after_parse:
+                gc.freeze()
+
+            if self.solve_gc_thresholds is not None:
+                gc.set_threshold(*self.solve_gc_thresholds)
+
+            time_after_parse = time.perf_counter_ns()
+
+            if self.profile_dir:
+                stats_path = os.path.join(self.profile_dir, f'{self.year}_day-{self.day}_part-{part}'
+                                                            f'{"_sample" if use_sample else ""}.pstats')
+                answer = profile_call(solve, stats_path, use_sample)
+                self.profile_paths[part] = stats_path
+            elif self.stack_sample_dir:
+                stacks_path = os.path.join(self.stack_sample_dir, f'{self.year}_day-{self.day}_part-{part}'
+                                                                  f'{"_sample" if use_sample else ""}.folded')
+                answer = sample_call(solve, stacks_path, self.stack_sample_rate, use_sample)
+                self.stack_paths[part] = stacks_path
+            elif self.line_count_dir:
+                answer, counts = count_lines_call(solve, [solve.__code__.co_filename], use_sample)
+
+                report_path = os.path.join(self.line_count_dir, f'{self.year}_day-{self.day}_part-{part}'
+                                                                f'{"_sample" if use_sample else ""}.lines.txt')
+                write_annotated_source(counts, report_path)
+
+                self.line_stats[part] = {'report': report_path, 'total': sum(counts.values()),
+                                         'hottest': get_hottest_lines(counts, 50)}
+            else:
+                answer = solve(use_sample)
+
+            time_after = time.perf_counter_ns()
+        finally:
+            # Helpers have to be unwrapped, the collector put back and tracemalloc stopped, even when the part fails
+            # or times out, or later parts would be affected too.
+            if instrumentation:
+                self.helper_stats['sample' if use_sample else 'real'][part] = instrumentation.stop()
+
+            if self.freeze_gc_after_parse:
+                gc.unfreeze()
+
+            gc.set_threshold(*gc_thresholds)
+
+            if gc_tracker:
+                self.gc_stats['sample' if use_sample else 'real'][part] = gc_tracker.stop()
+
+            if memory_tracker:
+                self.memory_stats['sample' if use_sample else 'real'][part] = memory_tracker.stop()
+
+        self.phase_timings['sample' if use_sample else 'real'][part] = {
+            'reset': time_after_reset - time_before,
+            'parse': time_after_parse - time_after_reset,
+            'solve': time_after - time_after_parse
+        }
+
+        return answer, (time_after - time_before) / 1e9
+
+    def get_parsed_input(self, input_data: List[str]) -> any:
+        # Keyed on the list itself; holding a reference to it keeps the id from being reused by another input.
+        cached = self._parsed_inputs.get(id(input_data))
+
+        if cached is None or cached[0] is not input_data:
+            cached = (input_data, self.parse_input(input_data))
+            self._parsed_inputs[id(input_data)] = cached
+
+        return cached[1]
+
     def test_answers(self, both_parts=True, silent=False) -> (bool, str, str):
         answer_1 = ''
         answer_2 = ''
@@ -78,32 +373,18 @@ class PuzzleBase(object):
         part_1_correct = True
         part_2_correct = True
 
-        time_before = time.time()
-
-        self.reset()
-        self.prepare_data(self.sample_data.input_data, 1)
-        answer_1 = self.get_part_1_answer(True)
+        answer_1, part_1_timespan = self.run_part(self.sample_data.input_data, 1, True)
         part_1_correct = answer_1 == self.sample_data.answer_1
 
-        time_after = time.time()
-        part_1_timespan = time_after - time_before
-
         if not silent:
-            print(f'Part 1 test ran in {self.format_run_time(time_before, time_after)}.')
+            print(f'Part 1 test ran in {self.describe_part_timing("sample", 1)}.')
 
         if both_parts:
-            time_before = time.time()
-
-            self.reset()
-            self.prepare_data(self.sample_data.input_data_2, 2)
-            answer_2 = self.get_part_2_answer(True)
+            answer_2, part_2_timespan = self.run_part(self.sample_data.input_data_2, 2, True)
             part_2_correct = answer_2 == self.sample_data.answer_2
 
-            time_after = time.time()
-            part_2_timespan = time_after - time_before
-
             if not silent:
-                print(f'Part 2 test ran in {self.format_run_time(time_before, time_after)}.')
+                print(f'Part 2 test ran in {self.describe_part_timing("sample", 2)}.')
         else:
             part_2_timespan = -1
 
@@ -115,35 +396,51 @@ class PuzzleBase(object):
 
         self.is_silent = silent
 
-        time_before = time.time()
-
-        self.reset()
-        self.prepare_data(self.input_data, 1)
-        answer_1 = self.get_part_1_answer(False)
-
-        time_after = time.time()
-        part_1_timespan = time_after - time_before
+        answer_1, part_1_timespan = self.run_part(None, 1, False)
 
         if not silent:
-            print(f'Part 1 ran in {self.format_run_time(time_before, time_after)}.')
+            print(f'Part 1 ran in {self.describe_part_timing("real", 1)}.')
 
         if both_parts:
-            time_before = time.time()
-
-            self.reset()
-            self.prepare_data(self.input_data, 2)
-            answer_2 = self.get_part_2_answer(False)
-
-            time_after = time.time()
-            part_2_timespan = time_after - time_before
+            answer_2, part_2_timespan = self.run_part(None, 2, False)
 
             if not silent:
-                print(f'Part 2 ran in {self.format_run_time(time_before, time_after)}.')
+                print(f'Part 2 ran in {self.describe_part_timing("real", 2)}.')
         else:
             part_2_timespan = -1
 
         return answer_1, answer_2, part_1_timespan, part_2_timespan
 
+    def benchmark(self, repeats: int, warmup=1, both_parts=True, use_sample=False) \
+            -> (Dict[int, str], Dict[int, List[Dict[str, int]]]):
+        answers = {}
+        samples = {}
+
+        for part in [1, 2] if both_parts else [1]:
+            answers[part], samples[part] = self.benchmark_part(part, repeats, warmup, use_sample)
+
+        return answers, samples
+
+    def benchmark_part(self, part: int, repeats: int, warmup=1, use_sample=False) -> (str, List[Dict[str, int]]):
+        self.is_silent = True
+
+        if use_sample:
+            input_data = self.sample_data.input_data if part == 1 else self.sample_data.input_data_2
+        else:
+            input_data = None
+
+        answer = ''
+        samples = []
+
+        # Every iteration goes through reset() and prepare_data(), so no state carries over between runs.
+        for i in range(warmup + repeats):
+            answer, _ = self.run_part(input_data, part, use_sample)
+
+            if i >= warmup:
+                samples.append(self.phase_timings['sample' if use_sample else 'real'][part])
+
+        return answer, samples
+
     def test_and_run(self, both_parts=True) -> str:
         test_results = self.test_answers(both_parts)
         if not test_results[0]:
@@ -169,6 +466,21 @@ class PuzzleBase(object):
 
         return results
 
+    def parse_input(self, input_data: List[str]) -> any:
+        raise NotImplementedError
+
+    def copy_parsed_input(self, parsed_input: any) -> any:
+        return copy.deepcopy(parsed_input)
+
+    # Puzzles that can make up their own inputs implement this, so they can be timed at any size (see --sweep in
+    # run_year.py). What size measures - grid width, list length, sensor count - is up to each puzzle, and every
+    # random choice has to come from rng so the same seed always gives the same input.
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        raise NotImplementedError
+
+    def get_generated_input(self, size: int, seed=0) -> List[str]:
+        return format_input(self.generate_input(size, random.Random(seed)), self.should_strip_data)
+
     @abstractmethod
     def reset(self):
         pass
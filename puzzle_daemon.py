@@ -0,0 +1,308 @@
+import getpass
+import importlib
+import importlib.util
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import time
+import traceback
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from typing import Optional
+
+from helpers.dependency_map import ROOT_DIR, get_local_dependencies
+from puzzle_base import get_input_path
+
+SOCKET_PATH = os.path.join(tempfile.gettempdir(), f'aoc-puzzle-daemon-{getpass.getuser()}.sock')
+
+# Imported up front so the first request doesn't pay for them either.
+PRELOADED_MODULES = ['puzzle_base', 'helpers.grid', 'helpers.pathing_grid', 'helpers.list_helpers',
+                     'helpers.number_helpers']
+
+
+class LoadedDay:
+    module: any
+    puzzle: any
+
+    # Modification times of the day's file and every repo module it imports, as of when it was loaded.
+    file_times: dict[str, int]
+
+    # Modification time of the input the puzzle holds, as of when it was last run.
+    input_times: Optional[dict[str, int]] = None
+
+    def __init__(self, module, puzzle, file_times):
+        self.module = module
+        self.puzzle = puzzle
+        self.file_times = file_times
+
+
+def get_file_times(paths) -> dict[str, int]:
+    return {path: os.stat(path).st_mtime_ns for path in paths if os.path.isfile(path)}
+
+
+def is_repo_module(module) -> bool:
+    path = getattr(module, '__file__', None)
+
+    return path is not None and os.path.abspath(path).startswith(ROOT_DIR + os.sep)
+
+
+# Whether something is listening on the socket at path, rather than it being left over from a daemon that died.
+def is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+
+    return True
+
+
+class PuzzleDaemon(object):
+    loaded_days: dict[tuple[int, int], LoadedDay]
+
+    def __init__(self):
+        self.loaded_days = {}
+
+        for module_name in PRELOADED_MODULES:
+            importlib.import_module(module_name)
+
+    def reload_helpers(self):
+        # Reloading only the changed files isn't enough: modules that did 'from helpers.grid import ArrayGrid' would
+        # keep the old class. Every repo module is dropped instead, and imported afresh as days need them again.
+        for module_name, module in list(sys.modules.items()):
+            if module_name != '__main__' and is_repo_module(module):
+                del sys.modules[module_name]
+
+        for module_name in PRELOADED_MODULES:
+            importlib.import_module(module_name)
+
+        self.loaded_days = {}
+
+    def get_day(self, year: int, day: int) -> (LoadedDay, bool):
+        day_path = os.path.join(ROOT_DIR, f'year_{year}', f'day-{day}.py')
+        loaded_day = self.loaded_days.get((year, day))
+
+        if loaded_day is not None:
+            current_times = get_file_times(loaded_day.file_times.keys())
+            changed_paths = [path for path, file_time in current_times.items()
+                             if file_time != loaded_day.file_times[path]]
+
+            if not changed_paths:
+                return loaded_day, False
+
+            if any(path != day_path for path in changed_paths):
+                self.reload_helpers()
+
+        spec = importlib.util.spec_from_file_location("Puzzle", day_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["Puzzle"] = module
+        spec.loader.exec_module(module)
+
+        file_times = get_file_times([day_path] + sorted(get_local_dependencies(day_path)))
+        loaded_day = LoadedDay(module, module.Puzzle(), file_times)
+
+        self.loaded_days[(year, day)] = loaded_day
+
+        return loaded_day, True
+
+    def run(self, request: dict) -> dict:
+        time_before = time.perf_counter_ns()
+
+        # Both end up in file paths, so anything but a number is turned away.
+        try:
+            year, day = int(request['year']), int(request['day'])
+        except (KeyError, TypeError, ValueError):
+            return {'error': f'Expected a year and day number, got {request.get("year")!r} and '
+                             f'{request.get("day")!r}.\n'}
+
+        loaded_day, reloaded = self.get_day(year, day)
+        puzzle = loaded_day.puzzle
+
+        time_after_load = time.perf_counter_ns()
+
+        # Puzzles pickle themselves by their module name when they use multiprocessing, so it has to point at them.
+        sys.modules["Puzzle"] = loaded_day.module
+
+        puzzle.is_silent = request.get('silent', True)
+
+        # Drops the puzzle's input, and what was parsed from it, when its file has changed, so it's re-read.
+        # Unchanged inputs are kept, along with anything parsed from them.
+        input_times = get_file_times([get_input_path(year, day)])
+        if input_times != loaded_day.input_times:
+            puzzle.forget_real_input()
+            loaded_day.input_times = input_times
+
+        answers = {}
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            for part in request.get('parts', [1, 2]):
+                if request.get('sample'):
+                    input_data = puzzle.sample_data.input_data if part == 1 else puzzle.sample_data.input_data_2
+                else:
+                    input_data = None
+
+                answers[part], _ = puzzle.run_part(input_data, part, request.get('sample', False))
+
+        run_type = 'sample' if request.get('sample') else 'real'
+
+        return {
+            'answers': answers,
+            'phases': {part: puzzle.phase_timings[run_type][part] for part in answers},
+            'load_ns': time_after_load - time_before,
+            'reloaded': reloaded,
+            'output': output.getvalue()
+        }
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+
+        # Other daemons starting up connect without sending anything, to check whether we're still here.
+        if not line:
+            return
+
+        request = json.loads(line)
+
+        if request['command'] == 'stop':
+            self.wfile.write(json.dumps({'stopped': True}).encode() + b'\n')
+            self.server.should_stop = True
+            return
+
+        try:
+            response = self.server.puzzle_daemon.run(request)
+        except Exception:
+            response = {'error': traceback.format_exc()}
+
+        self.wfile.write(json.dumps(response).encode() + b'\n')
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    puzzle_daemon: PuzzleDaemon
+    should_stop = False
+
+    def __init__(self, socket_path: str):
+        super().__init__(socket_path, RequestHandler)
+
+        self.puzzle_daemon = PuzzleDaemon()
+
+    def serve_until_stopped(self):
+        while not self.should_stop:
+            self.handle_request()
+
+
+def send_request(socket_path: str, request: dict) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode() + b'\n')
+
+        with client.makefile('rb') as response_file:
+            return json.loads(response_file.readline())
+
+
+def format_time(delta_ns: int) -> str:
+    return f'{delta_ns / 1e6:.3f} ms'
+
+
+class DaemonCli(object):
+    def __init__(self):
+        parser = ArgumentParser(
+            description="Puzzle Daemon",
+            usage="serve | stop | run year day [--part (1|2)] [--sample] [--show-output]"
+        )
+
+        parser.add_argument('--socket', default=SOCKET_PATH, help=f'socket to listen on (default: {SOCKET_PATH})')
+
+        subparsers = parser.add_subparsers(dest='command', required=True)
+
+        subparsers.add_parser('serve', help='start the daemon in the foreground')
+        subparsers.add_parser('stop', help='ask a running daemon to exit')
+
+        run_parser = subparsers.add_parser('run', help='run a day through the daemon')
+        run_parser.add_argument('year', type=int)
+        run_parser.add_argument('day', type=int)
+        run_parser.add_argument('--part', type=int, choices=[1, 2], help='only run one part')
+        run_parser.add_argument('--sample', action='store_true', help='run against the sample data')
+        run_parser.add_argument('--show-output', action='store_true',
+                                help='run the puzzle non-silently and print what it printed')
+
+        self.args = parser.parse_args(sys.argv[1:])
+
+    def serve(self):
+        if os.path.exists(self.args.socket):
+            if not stat.S_ISSOCK(os.stat(self.args.socket).st_mode):
+                print(f'{self.args.socket} exists and isn\'t a socket; pass --socket to use another path.')
+                return 1
+
+            if is_listening(self.args.socket):
+                print(f'A daemon is already listening on {self.args.socket}.')
+                return 1
+
+            os.remove(self.args.socket)
+
+        # Day modules import from the repo root, wherever the daemon was started from.
+        sys.path.insert(0, ROOT_DIR)
+        os.chdir(ROOT_DIR)
+
+        with DaemonServer(self.args.socket) as server:
+            socket_inode = os.stat(self.args.socket).st_ino
+
+            print(f'Puzzle daemon listening on {self.args.socket}')
+
+            try:
+                server.serve_until_stopped()
+            finally:
+                # Only our own socket is cleaned up, in case another daemon has replaced it since.
+                if os.path.exists(self.args.socket) and os.stat(self.args.socket).st_ino == socket_inode:
+                    os.remove(self.args.socket)
+
+        return 0
+
+    def run_day(self):
+        response = send_request(self.args.socket, {
+            'command': 'run',
+            'year': self.args.year,
+            'day': self.args.day,
+            'parts': [self.args.part] if self.args.part else [1, 2],
+            'sample': self.args.sample,
+            'silent': not self.args.show_output
+        })
+
+        if 'error' in response:
+            print(response['error'], end='')
+            return 1
+
+        if self.args.show_output and response['output']:
+            print(response['output'], end='')
+
+        print(f'Loaded in {format_time(response["load_ns"])}{" (reloaded)" if response["reloaded"] else ""}')
+
+        for part, answer in response['answers'].items():
+            phases = response['phases'][part]
+
+            print(f'=== Part {part} === {format_time(sum(phases.values()))} (reset {format_time(phases["reset"])}, '
+                  f'parse {format_time(phases["parse"])}, solve {format_time(phases["solve"])})')
+            print(answer)
+
+        return 0
+
+    def run(self):
+        if self.args.command == 'serve':
+            return self.serve()
+        elif self.args.command == 'stop':
+            send_request(self.args.socket, {'command': 'stop'})
+        else:
+            return self.run_day()
+
+        return 0
+
+
+if __name__ == "__main__":
+    main = DaemonCli()
+    sys.exit(main.run())
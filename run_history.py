@@ -0,0 +1,134 @@
+import os
+import sys
+from argparse import ArgumentParser
+
+from helpers.memory_tracking import format_size
+from helpers.run_history import HISTORY_PATH, connect, get_movers, get_slowest, get_trend, resolve_commit
+
+
+def format_time(delta_ns) -> str:
+    if delta_ns is None:
+        return 'N/A'
+
+    return f'{delta_ns / 1e6:.3f} ms'
+
+
+def format_commit(row) -> str:
+    if not row['commit_hash']:
+        return 'unknown'
+
+    # Runs made with uncommitted changes are marked, since they didn't run the commit's code as it is.
+    return row['commit_hash'][:10] + ('+' if row['is_dirty'] else '')
+
+
+class HistoryCli(object):
+    def __init__(self):
+        parser = ArgumentParser(
+            description="Run History",
+            usage="trend year day [--part (1|2)] | slowest [--year YEAR] [--commit REF] | movers old_ref new_ref"
+        )
+
+        parser.add_argument('--history', default=HISTORY_PATH,
+                            help=f'history file to read (default: {os.path.relpath(HISTORY_PATH)})')
+
+        # Shared by every command, so they can go after it.
+        filters = ArgumentParser(add_help=False)
+        filters.add_argument('--host', help='only use runs made on this host')
+        filters.add_argument('--mode', help='only use runs made in this mode, e.g. "run", "run,memory" or '
+                                                   '"benchmark=5,warmup=1"')
+        filters.add_argument('--limit', type=int, default=20, help='number of rows to show (default: 20)')
+
+        subparsers = parser.add_subparsers(dest='command', required=True)
+
+        trend_parser = subparsers.add_parser('trend', parents=[filters],
+                                             help='show how a day\'s results changed over its latest runs')
+        trend_parser.add_argument('year', type=int)
+        trend_parser.add_argument('day', type=int)
+        trend_parser.add_argument('--part', type=int, choices=[1, 2], help='only show one part')
+
+        slowest_parser = subparsers.add_parser('slowest', parents=[filters],
+                                               help='list the slowest parts as of their latest runs')
+        slowest_parser.add_argument('--year', type=int, help='only list parts from this year')
+        slowest_parser.add_argument('--commit', help='only use runs of this commit')
+
+        movers_parser = subparsers.add_parser('movers', parents=[filters],
+                                              help='list the parts that sped up or slowed down the most between two '
+                                                   'commits')
+        movers_parser.add_argument('old_ref', help='commit, branch or tag to compare from')
+        movers_parser.add_argument('new_ref', help='commit, branch or tag to compare to')
+
+        self.args = parser.parse_args(sys.argv[1:])
+
+    def print_trend(self, connection):
+        rows = get_trend(connection, self.args.year, self.args.day, self.args.part, self.args.limit, self.args.host,
+                         self.args.mode)
+
+        if not rows:
+            print(f'No runs of {self.args.year} day {self.args.day} recorded.')
+            return
+
+        print(f'{"run at":<20} {"commit":<11} {"mode":<20} {"part":>4} {"status":<10} {"time":>14} {"solve":>14} '
+              f'{"peak":>10}  answer')
+
+        for row in rows:
+            print(f'{row["started_at"]:<20} {format_commit(row):<11} {row["mode"]:<20} {row["part"]:>4} '
+                  f'{row["status"]:<10} {format_time(row["time_ns"]):>14} {format_time(row["solve_ns"]):>14} '
+                  f'{format_size(row["peak_bytes"]) if row["peak_bytes"] is not None else "":>10}  '
+                  f'{row["answer"] if row["answer"] is not None else ""}')
+
+    def print_slowest(self, connection):
+        commit = resolve_commit(self.args.commit) if self.args.commit else None
+        rows = get_slowest(connection, self.args.limit, self.args.year, commit, self.args.host, self.args.mode)
+
+        if not rows:
+            print('No successful runs recorded.')
+            return
+
+        print(f'{"day":<16} {"time":>14} {"solve":>14}  {"commit":<11} run at')
+
+        for row in rows:
+            label = f'{row["year"]} Day {row["day"]} Part {row["part"]}'
+
+            print(f'{label:<16} {format_time(row["time_ns"]):>14} {format_time(row["solve_ns"]):>14}  '
+                  f'{format_commit(row):<11} {row["started_at"]}')
+
+    def print_movers(self, connection):
+        old_commit, new_commit = resolve_commit(self.args.old_ref), resolve_commit(self.args.new_ref)
+        movers = get_movers(connection, old_commit, new_commit, self.args.limit, self.args.host, self.args.mode)
+
+        if not movers:
+            print(f'No parts were run successfully at both {old_commit[:10]} and {new_commit[:10]}.')
+            return
+
+        print(f'{"day":<16} {old_commit[:10]:>14} {new_commit[:10]:>14} {"change":>14}')
+
+        for mover in movers:
+            label = f'{mover["year"]} Day {mover["day"]} Part {mover["part"]}'
+            ratio = mover['ratio']
+            change = f'{ratio:.2f}x slower' if ratio >= 1 else f'{1 / ratio:.2f}x faster'
+
+            print(f'{label:<16} {format_time(mover["old_ns"]):>14} {format_time(mover["new_ns"]):>14} {change:>14}')
+
+    def run(self):
+        if not os.path.isfile(self.args.history):
+            print(f'No history at {self.args.history} yet; run_year.py adds to it on every run.')
+            return 1
+
+        connection = connect(self.args.history)
+
+        try:
+            if self.args.command == 'trend':
+                self.print_trend(connection)
+            elif self.args.command == 'slowest':
+                self.print_slowest(connection)
+            else:
+                self.print_movers(connection)
+        finally:
+            connection.close()
+
+        return 0
+
+
+if __name__ == "__main__":
+    cli = HistoryCli()
+    sys.exit(cli.run())
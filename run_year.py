@@ -1,24 +1,549 @@
+import csv
 import importlib.util
+import json
+import os
+import re
 import sys
 import time
-from argparse import ArgumentParser
+import traceback
+from argparse import ArgumentParser, ArgumentTypeError
+from contextlib import redirect_stdout
 
 from func_timeout import func_timeout, FunctionTimedOut
 
+from helpers.answer_cache import get_cache_key, load_cached_result, store_result
+from helpers.gc_tracking import parse_gc_thresholds
+from helpers.import_timing import measure_import_breakdown
+from helpers.instrumentation import ENVIRONMENT_VARIABLE, is_enabled_by_environment
+from helpers.dependency_map import build_dependency_map
+from helpers.complexity import DEFAULT_EXPECTED_GROWTH, estimate_exponent, estimate_growth, has_enough_sizes, \
+    is_worse_than_expected
+from helpers.baselines import save_baseline, load_baseline, compare_to_baseline, get_baseline_path
+from helpers.memory_tracking import format_size, get_max_rss
+from helpers.run_history import HISTORY_PATH, MEMORY_MODE_SUFFIX, connect, record_run
+from helpers.profiling import get_top_functions, get_top_sampled_functions
+from helpers.timing_stats import summarize
+from helpers.worker_pool import run_tasks, TIMED_OUT, CRASHED
+from puzzle_base import REFERENCE_IMPLEMENTATION, format_input
+
+TIMEOUT = 10
+
+WATCH_INTERVAL = 0.5
+
+
+def get_day_path(year, day):
+    return f'year_{year}/day-{day}.py'
+
+
+def load_puzzle_timed(year, day):
+    time_before = time.perf_counter_ns()
+
+    spec = importlib.util.spec_from_file_location("Puzzle", get_day_path(year, day))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["Puzzle"] = module
+    spec.loader.exec_module(module)
+
+    time_after_module = time.perf_counter_ns()
+
+    puzzle = module.Puzzle()
+
+    time_after = time.perf_counter_ns()
+
+    return puzzle, {'module': time_after_module - time_before, 'construct': time_after - time_after_module}
+
+
+def load_puzzle(year, day):
+    return load_puzzle_timed(year, day)[0]
+
+
+def find_years():
+    return sorted(int(match[1]) for match in [re.fullmatch(r'year_(\d+)', name) for name in os.listdir('.')] if match)
+
+
+def prepare_puzzle(puzzle, args):
+    puzzle.profile_dir = args.profile
+    puzzle.stack_sample_dir = args.sample_stacks
+    puzzle.stack_sample_rate = args.sample_rate
+    puzzle.line_count_dir = args.line_counts
+    puzzle.track_memory = args.memory
+    puzzle.instrument_helpers = args.instrument
+    puzzle.track_gc = args.gc_stats
+
+    # Puzzles' own collector settings are kept unless they're overridden.
+    if args.gc_freeze:
+        puzzle.freeze_gc_after_parse = True
+
+    if args.gc_threshold is not None:
+        puzzle.solve_gc_thresholds = args.gc_threshold
+    puzzle.is_silent = True
+
+
+def parse_day_timeout(override):
+    match = re.fullmatch(r'(\d+)-(\d+)=([\d.]+)(?:,([\d.]+))?', override)
+    if not match:
+        raise ArgumentTypeError(f'expected YEAR-DAY=SECONDS[,SECONDS], got "{override}"')
+
+    part_1_timeout = float(match[3])
+
+    return (int(match[1]), int(match[2])), (part_1_timeout, float(match[4]) if match[4] else part_1_timeout)
+
+
+def parse_sizes(sizes):
+    try:
+        return [int(size) for size in sizes.split(',')]
+    except ValueError:
+        raise ArgumentTypeError(f'expected comma-separated sizes, got "{sizes}"')
+
+
+# Overrides given on the command line win over ones the puzzle asks for, which win over the per-part defaults.
+def get_part_timeouts(puzzle, year, day, args, runs=None):
+    part_timeouts = dict(args.day_timeout).get((year, day)) or puzzle.part_timeouts or \
+        (args.part_1_timeout or args.timeout, args.part_2_timeout or args.timeout)
+
+    # Benchmarks get the budget for every run they make.
+    if runs is None:
+        runs = args.warmup + args.benchmark if args.benchmark else 1
+
+    return {1: part_timeouts[0] * runs, 2: part_timeouts[1] * runs}
+
+
+def new_result():
+    return {'answers': {}, 'times': {}, 'phases': {}, 'profiles': {}, 'stacks': {}, 'lines': {}, 'memory': {},
+            'helpers': {}, 'gc': {}, 'timeouts': {}}
+
+
+def run_puzzle_part(puzzle, part, args):
+    if args.benchmark:
+        answer, samples = puzzle.benchmark_part(part, args.benchmark, args.warmup)
+
+        stats = summarize_samples(samples)
+        part_result = {
+            'answer': answer,
+            'time': stats['total']['median'] / 1e9,
+            'phases': {phase: stats[phase]['median'] for phase in ['reset', 'parse', 'solve']},
+            'stats': stats
+        }
+    else:
+        answer, timespan = puzzle.run_part(None, part, False)
+
+        part_result = {'answer': answer, 'time': timespan, 'phases': puzzle.phase_timings['real'][part]}
+
+    if part in puzzle.profile_paths:
+        part_result['profile'] = puzzle.profile_paths[part]
+
+    if part in puzzle.stack_paths:
+        part_result['stacks'] = puzzle.stack_paths[part]
+
+    if part in puzzle.line_stats:
+        part_result['lines'] = puzzle.line_stats[part]
+
+    if part in puzzle.memory_stats['real']:
+        part_result['memory'] = puzzle.memory_stats['real'][part]
+
+    if part in puzzle.helper_stats['real']:
+        part_result['helpers'] = puzzle.helper_stats['real'][part]
+
+    if part in puzzle.gc_stats['real']:
+        part_result['gc'] = puzzle.gc_stats['real'][part]
+
+    return part_result
+
+
+def add_part_result(result, part, part_result):
+    result['answers'][part] = part_result['answer']
+    result['times'][part] = part_result['time']
+    result['phases'][part] = part_result['phases']
+
+    if 'stats' in part_result:
+        result.setdefault('stats', {})[part] = part_result['stats']
+
+    if 'profile' in part_result:
+        result['profiles'][part] = part_result['profile']
+
+    if 'stacks' in part_result:
+        result['stacks'][part] = part_result['stacks']
+
+    if 'lines' in part_result:
+        result['lines'][part] = part_result['lines']
+
+    if 'memory' in part_result:
+        result['memory'][part] = part_result['memory']
+
+    if 'helpers' in part_result:
+        result['helpers'][part] = part_result['helpers']
+
+    if 'gc' in part_result:
+        result['gc'][part] = part_result['gc']
+
+
+# Rebuilds what a killed worker got through from the updates it sent: finished parts keep their results, and the
+# part it was running is marked as timed out.
+def build_partial_result(timeout_info):
+    result = new_result()
+    running_part = 1
+
+    for update in timeout_info['updates']:
+        if 'result' in update:
+            add_part_result(result, update['part'], update['result'])
+        else:
+            running_part = update['part']
+
+    result['timeouts'][running_part] = {'elapsed': timeout_info['elapsed'], 'peak_rss': timeout_info['peak_rss']}
+
+    return result
+
+
+def add_load_details(result, year, day, load_timings, args):
+    result['load'] = load_timings
+
+    if args.import_breakdown:
+        result['imports'] = measure_import_breakdown(year, day)[:args.import_breakdown]
+
+
+def summarize_samples(samples):
+    stats = {phase: summarize([sample[phase] for sample in samples]) for phase in ['reset', 'parse', 'solve']}
+    stats['total'] = summarize([sum(sample.values()) for sample in samples])
+
+    return stats
+
+
+def write_records(path, records):
+    if path.endswith('.csv'):
+        with open(path, 'w', newline='') as output_file:
+            fieldnames = list(dict.fromkeys(key for record in records for key in record.keys()))
+
+            writer = csv.DictWriter(output_file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(records)
+    else:
+        with open(path, 'w') as output_file:
+            output_file.write(json.dumps(records, indent=2))
+
+
+def run_day_in_worker(year, day, args, report):
+    # Puzzles like to print their grids even when silent, which would garble the streamed table.
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        try:
+            puzzle, load_timings = load_puzzle_timed(year, day)
+            prepare_puzzle(puzzle, args)
+
+            part_timeouts = get_part_timeouts(puzzle, year, day, args)
+            result = new_result()
+
+            for part in [1, 2]:
+                # Each part starts a fresh budget, and anything reported before a timeout is kept.
+                report({'part': part, 'timeout': part_timeouts[part]})
+
+                part_result = run_puzzle_part(puzzle, part, args)
+                add_part_result(result, part, part_result)
+
+                report({'part': part, 'result': part_result})
+
+            add_load_details(result, year, day, load_timings, args)
+
+            return result
+        except AttributeError:
+            return None
+        except Exception:
+            traceback.print_exc()
+
+            return 'error'
+
+
+def run_generated_part(puzzle_type, input_data, part, args):
+    # Every run gets a fresh puzzle, so nothing parsed or cached at one size carries over to the next.
+    runs = []
+
+    # Sweeps are all about comparing times, so they always warm up first, even when they aren't benchmarking.
+    for i in range(args.warmup + max(1, args.benchmark)):
+        puzzle = puzzle_type()
+        puzzle.is_silent = True
+
+        answer, _ = puzzle.run_part(input_data, part, False)
+
+        if i >= args.warmup:
+            runs.append(puzzle.phase_timings['real'][part])
+
+    # Benchmarked sweeps keep the median run's phases, so one noisy run doesn't bend the curve.
+    phases = sorted(runs, key=lambda run_phases: sum(run_phases.values()))[len(runs) // 2]
+
+    # tracemalloc slows everything down, so memory is measured on a separate run rather than the timed one.
+    puzzle = puzzle_type()
+    puzzle.is_silent = True
+    puzzle.track_memory = True
+
+    puzzle.run_part(input_data, part, False)
+
+    return {'answer': answer, 'time': sum(phases.values()) / 1e9, 'phases': phases,
+            'peak': puzzle.memory_stats['real'][part]['peak']}
+
+
+# Yields (size, input_data) for every input a sweep should time the day on: the files in its folder under
+# --sweep-dir, smallest first and sized by their length, then the generated ones at each --sweep size.
+def get_sweep_inputs(puzzle, year, day, args):
+    day_dir = os.path.join(args.sweep_dir, f'year_{year}', f'day-{day}') if args.sweep_dir else None
+
+    if day_dir and os.path.isdir(day_dir):
+        paths = sorted((os.path.join(day_dir, name) for name in os.listdir(day_dir) if name.endswith('.txt')),
+                       key=os.path.getsize)
+
+        for path in paths:
+            with open(path, 'r') as input_file:
+                yield os.path.getsize(path), format_input(input_file.read(), puzzle.should_strip_data)
+
+    for size in args.sweep or []:
+        try:
+            yield size, puzzle.get_generated_input(size, args.seed)
+        except NotImplementedError:
+            return
+
+
+def sweep_day_in_worker(year, day, args, report):
+    if not os.path.isfile(get_day_path(year, day)):
+        return None
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        try:
+            puzzle = load_puzzle(year, day)
+            # Every size is run by run_generated_part(): warm-ups, timed runs and one more to measure memory.
+            part_timeouts = get_part_timeouts(puzzle, year, day, args, args.warmup + max(1, args.benchmark) + 1)
+
+            result = {'sizes': {}, 'timeout': None, 'expected_growth': puzzle.expected_growth}
+            report({'expected_growth': puzzle.expected_growth})
+
+            for size, input_data in get_sweep_inputs(puzzle, year, day, args):
+                input_bytes = sum(len(line) + 1 for line in input_data)
+                result['sizes'][size] = {'input_bytes': input_bytes, 'parts': {}}
+                report({'size': size, 'input_bytes': input_bytes})
+
+                for part in [1, 2]:
+                    report({'size': size, 'part': part, 'timeout': part_timeouts[part]})
+
+                    part_result = run_generated_part(type(puzzle), input_data, part, args)
+                    result['sizes'][size]['parts'][part] = part_result
+
+                    report({'size': size, 'part': part, 'result': part_result})
+
+            # Days without a generator (or a --sweep-dir of inputs) have nothing to sweep.
+            return result if result['sizes'] else None
+        except Exception:
+            traceback.print_exc()
+
+            return 'error'
+
+
+# Like build_partial_result(), but for sweeps: every size the worker finished is kept, and the run it was in the
+# middle of is marked as timed out.
+def build_partial_sweep_result(timeout_info):
+    result = {'sizes': {}, 'timeout': None}
+    running_run = None
+
+    for update in timeout_info['updates']:
+        if 'expected_growth' in update:
+            result['expected_growth'] = update['expected_growth']
+        elif 'input_bytes' in update:
+            result['sizes'][update['size']] = {'input_bytes': update['input_bytes'], 'parts': {}}
+        elif 'result' in update:
+            result['sizes'][update['size']]['parts'][update['part']] = update['result']
+        else:
+            running_run = update
+
+    if running_run is not None:
+        result['timeout'] = {'size': running_run['size'], 'part': running_run['part'],
+                             'elapsed': timeout_info['elapsed'], 'peak_rss': timeout_info['peak_rss']}
+
+    return result
+
+
+def run_implementation(puzzle, part, name, args):
+    puzzle.implementation_name = name
+
+    sample_input = puzzle.sample_data.input_data if part == 1 else puzzle.sample_data.input_data_2
+    sample_answer, _ = puzzle.run_part(sample_input, part, True)
+
+    # Comparisons are all about times, so like sweeps they always warm up and take at least one timed run.
+    answer, samples = puzzle.benchmark_part(part, max(1, args.benchmark), args.warmup)
+    stats = summarize_samples(samples)
+
+    return {'sample_answer': sample_answer, 'answer': answer, 'time': stats['total']['median'] / 1e9, 'stats': stats}
+
+
+def compare_day_in_worker(year, day, args, report):
+    if not os.path.isfile(get_day_path(year, day)):
+        return None
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        try:
+            puzzle = load_puzzle(year, day)
+            puzzle.is_silent = True
+
+            # Each implementation gets the budget for its sample run as well as every benchmark run.
+            part_timeouts = get_part_timeouts(puzzle, year, day, args, args.warmup + max(1, args.benchmark) + 1)
+
+            result = {'parts': {}, 'timeout': None}
+
+            for part in [1, 2]:
+                names = list(puzzle.get_implementations(part).keys())
+
+                if len(names) < 2:
+                    continue
+
+                result['parts'][part] = {}
+
+                for name in names:
+                    report({'part': part, 'implementation': name, 'timeout': part_timeouts[part]})
+
+                    implementation_result = run_implementation(puzzle, part, name, args)
+                    result['parts'][part][name] = implementation_result
+
+                    report({'part': part, 'implementation': name, 'result': implementation_result})
+
+            # Days with only their reference implementations have nothing to compare.
+            return result if result['parts'] else None
+        except Exception:
+            traceback.print_exc()
+
+            return 'error'
+
+
+# Like build_partial_result(), but for comparisons: every implementation the worker finished is kept, and the one it
+# was in the middle of is marked as timed out.
+def build_partial_comparison_result(timeout_info):
+    result = {'parts': {}, 'timeout': None}
+    running = None
+
+    for update in timeout_info['updates']:
+        if 'result' in update:
+            result['parts'].setdefault(update['part'], {})[update['implementation']] = update['result']
+        else:
+            result['parts'].setdefault(update['part'], {})
+            running = update
+
+    if running is not None:
+        result['timeout'] = {'part': running['part'], 'implementation': running['implementation'],
+                             'elapsed': timeout_info['elapsed']}
+
+    return result
+
 
 class Tester(object):
-    year: int
+    years: list[int]
+
+    grid_width = 20
+
+    year_totals: dict[int, dict[str, float]]
+    records: list[dict]
+
+    cache_keys: dict[tuple[int, int], str]
+    used_cache = False
+    cached_days: set[tuple[int, int]]
+
+    # Set once --compare-implementations finds an implementation that disagrees with its part's reference one.
+    has_mismatches = False
+
+    # Days skipped by a sweep because they had no inputs to sweep over.
+    days_without_sweep_inputs: dict[int, list[int]]
+    expected_growth: dict[tuple[int, int], tuple[str, str]]
 
     def __init__(self):
         parser = ArgumentParser(
             description="Year Runner",
-            usage="year"
+            usage="year [year ...] | all [options]"
         )
 
-        parser.add_argument('year')
+        parser.add_argument('years', nargs='+', help='one or more years to run, or "all"')
+        parser.add_argument('--jobs', '-j', type=int, default=1,
+                            help='number of worker processes to run days in (default: run serially in-process)')
+        parser.add_argument('--phases', action='store_true',
+                            help='show reset/parse/solve timings under each day')
+        parser.add_argument('--export', metavar='PATH',
+                            help='write per-part answers and phase timings to a .json or .csv file')
+        parser.add_argument('--benchmark', type=int, default=0, metavar='N',
+                            help='time each part N times and report min/median/p95/stdev instead of one cold run')
+        parser.add_argument('--warmup', type=int, default=1, metavar='N',
+                            help='untimed runs of each part before benchmarking (default: 1)')
+        profilers = parser.add_mutually_exclusive_group()
+        profilers.add_argument('--profile', nargs='?', const='profiles', metavar='DIR',
+                               help='profile each part\'s solve phase with cProfile, saving .pstats files to DIR '
+                                    '(default: profiles)')
+        profilers.add_argument('--sample-stacks', nargs='?', const='stacks', metavar='DIR',
+                               help='sample each part\'s solve phase\'s stack instead, which barely slows it down, '
+                                    'saving collapsed stacks for flame graph tools to DIR (default: stacks)')
+        profilers.add_argument('--line-counts', nargs='?', const='line_counts', metavar='DIR',
+                               help='count how often each line of the day and of helpers/ runs while solving, '
+                                    'saving annotated source to DIR (default: line_counts)')
+        parser.add_argument('--sample-rate', type=float, default=1000, metavar='HZ',
+                            help='stack samples per second for --sample-stacks (default: 1000)')
+        parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                            help='number of hot functions or helpers to list under each profiled or instrumented day '
+                                 '(default: 10)')
+        parser.add_argument('--memory', action='store_true',
+                            help='track each part\'s tracemalloc peak, max RSS and largest allocation sites')
+        parser.add_argument('--instrument', action='store_true', default=is_enabled_by_environment(),
+                            help='count calls to, and time spent in, the grid, point and list helpers each part '
+                                 f'uses (default: on if ${ENVIRONMENT_VARIABLE} is set)')
+        parser.add_argument('--gc-stats', action='store_true',
+                            help='count the garbage collections each part triggers and how long they paused it')
+        parser.add_argument('--gc-freeze', action='store_true',
+                            help='freeze everything that exists after parsing, so collections during solving skip it')
+        parser.add_argument('--gc-threshold', type=parse_gc_thresholds, metavar='N[,N,N]',
+                            help='collector thresholds while solving, as for gc.set_threshold(); 0 disables it')
+        parser.add_argument('--history', default=HISTORY_PATH, metavar='PATH',
+                            help='SQLite file each run\'s results are added to, for run_history.py to query '
+                                 f'(default: {os.path.relpath(HISTORY_PATH)})')
+        parser.add_argument('--no-history', action='store_true', help='don\'t add this run to the history')
+        parser.add_argument('--save-baseline', action='store_true',
+                            help='store this run\'s timings as the baseline for each year')
+        parser.add_argument('--compare-baseline', action='store_true',
+                            help='compare timings against the stored baselines, exiting non-zero on regressions')
+        parser.add_argument('--threshold', type=float, default=20, metavar='PERCENT',
+                            help='how far a part\'s time can move from its baseline before being flagged (default: 20)')
+        parser.add_argument('--load-times', action='store_true',
+                            help='show how long each day took to execute its module and construct its Puzzle')
+        parser.add_argument('--import-breakdown', type=int, default=0, metavar='N',
+                            help='load each day in a fresh interpreter under -X importtime and list the N '
+                                 'slowest modules it imports')
+        parser.add_argument('--watch', action='store_true',
+                            help='keep running, and re-run only the days affected whenever a day, its input or a '
+                                 'helper it imports changes')
+        parser.add_argument('--force', action='store_true',
+                            help='recompute every day, even ones whose cached answers are still valid')
+        parser.add_argument('--compare-implementations', action='store_true',
+                            help='for days with more than one implementation of a part, check they all give the '
+                                 'same answers and time them side by side')
+        parser.add_argument('--sweep', type=parse_sizes, metavar='SIZES',
+                            help='instead of the real inputs, run each day that can generate its own inputs at '
+                                 'each of these comma-separated sizes, recording runtime and memory')
+        parser.add_argument('--seed', type=int, default=0,
+                            help='seed for the inputs generated by --sweep (default: 0)')
+        parser.add_argument('--sweep-dir', metavar='DIR',
+                            help='also sweep over the inputs in DIR/year_YYYY/day-D/*.txt, sized by their length')
+        parser.add_argument('--fit', action='store_true',
+                            help='after a sweep, fit each part\'s runtime against its input length, and flag parts '
+                                 'growing faster than their puzzle expects')
+        parser.add_argument('--fit-csv', metavar='PATH',
+                            help='write each sweep measurement and its fitted curve to a CSV file, implying --fit')
+        parser.add_argument('--timeout', type=float, default=TIMEOUT, metavar='SECONDS',
+                            help=f'how long each part can run before it is stopped (default: {TIMEOUT})')
+        parser.add_argument('--part-1-timeout', type=float, metavar='SECONDS',
+                            help='budget for part 1, overriding --timeout')
+        parser.add_argument('--part-2-timeout', type=float, metavar='SECONDS',
+                            help='budget for part 2, overriding --timeout')
+        parser.add_argument('--day-timeout', type=parse_day_timeout, action='append', default=[],
+                            metavar='YEAR-DAY=SECONDS[,SECONDS]',
+                            help='budget for one day\'s parts (or each part separately), overriding every other '
+                                 'budget; can be given more than once')
 
         self.args = parser.parse_args(sys.argv[1:])
 
+        self.years = find_years() if 'all' in self.args.years else [int(year) for year in self.args.years]
+        self.year_totals = {}
+        self.records = []
+        self.cache_keys = {}
+        self.cached_days = set()
+        self.days_without_sweep_inputs = {}
+        self.expected_growth = {}
+
     def format_run_time(self, delta):
         if delta < 1:
             return f'{delta * 1000:.6f} ms'
@@ -29,38 +554,813 @@ class Tester(object):
         else:
             return f'{delta / 3600:.2f} hours'
 
-    def run(self):
-        start_time = time.time()
+    def day_label(self, year, day):
+        return f'{year} Day {day}' if len(self.years) > 1 else f'Day {day}'
 
-        grid_width = 20
-        print(f'{"":<{grid_width}} | {"Part 1":<{grid_width}} | {"Part 2":<{grid_width}}')
+    def print_row(self, label, answer_1, answer_2, time_1, time_2):
+        grid_width = self.grid_width
+
+        print('=' * ((grid_width * 3) + 6))
+        print(f'{label + " Result":<{grid_width}} | {answer_1:<{grid_width}} | {answer_2:<{grid_width}}')
+        print(f'{label + " Time":<{grid_width}} | {time_1:<{grid_width}} | {time_2:<{grid_width}}')
+
+    def print_result(self, year, day, result):
+        label = self.day_label(year, day)
+
+        if isinstance(result, dict) and result.get('cached'):
+            label += '*'
+        totals = self.year_totals.setdefault(year, {'part_1': 0, 'part_2': 0, 'solved': 0, 'failed': 0})
+
+        if result is None:
+            self.print_row(label, "N/A", "N/A", "N/A", "N/A")
+        elif result == 'error' or result == CRASHED:
+            totals['failed'] += 1
+            self.print_row(label, "Error", "Error", "N/A", "N/A")
+        else:
+            answers, times, phases, timeouts = result['answers'], result['times'], result['phases'], \
+                result.get('timeouts', {})
+
+            totals['part_1'] += times.get(1, 0)
+            totals['part_2'] += times.get(2, 0)
+            totals['failed' if timeouts else 'solved'] += 1
+
+            cells = [self.get_part_cells(part, answers, times, timeouts) for part in [1, 2]]
+            self.print_row(label, cells[0][0], cells[1][0], cells[0][1], cells[1][1])
+
+            if timeouts:
+                self.print_timeouts(label, timeouts)
+
+            if 'stats' in result:
+                self.print_stats(label, result['stats'])
+
+            if self.args.load_times and 'load' in result:
+                self.print_load_times(label, result['load'])
+
+            if result.get('imports'):
+                self.print_imports(result['imports'])
+
+            if self.args.phases:
+                self.print_phases(label, phases)
+
+            if result.get('gc'):
+                self.print_gc_stats(label, result['gc'])
+
+            if result['memory']:
+                self.print_memory(label, result['memory'])
+
+            if result['profiles']:
+                self.print_profiles(result['profiles'])
+
+            if result.get('stacks'):
+                self.print_sampled_stacks(result['stacks'])
+
+            if result.get('helpers'):
+                self.print_helper_stats(result['helpers'])
+
+            if result.get('lines'):
+                self.print_hot_lines(result['lines'])
+
+        self.add_records(year, day, result)
+
+    def get_part_cells(self, part, answers, times, timeouts):
+        if part in answers:
+            return answers[part], self.format_run_time(times[part])
+        elif part in timeouts:
+            return "Timed Out", "> " + self.format_run_time(timeouts[part]['elapsed'])
+        else:
+            return "Skipped", "N/A"
+
+    def print_timeouts(self, label, timeouts):
+        grid_width = self.grid_width
+
+        peak_values = [format_size(timeouts[part]['peak_rss']) + ' when stopped' if part in timeouts else ""
+                       for part in [1, 2]]
+
+        print(f'{label + " Max RSS":<{grid_width}} | {peak_values[0]:<{grid_width}} | {peak_values[1]:<{grid_width}}')
+
+    def print_gc_stats(self, label, gc_stats):
+        grid_width = self.grid_width
+
+        pauses = [f'{gc_stats[part]["collections"]} in {self.format_run_time(gc_stats[part]["pause_ns"] / 1e9)}'
+                  if part in gc_stats else "" for part in [1, 2]]
+        longest = [f'longest {self.format_run_time(gc_stats[part]["max_pause_ns"] / 1e9)}'
+                   if part in gc_stats else "" for part in [1, 2]]
+
+        print(f'{label + " GC Pauses":<{grid_width}} | {pauses[0]:<{grid_width}} | {pauses[1]:<{grid_width}}')
+        print(f'{"":<{grid_width}} | {longest[0]:<{grid_width}} | {longest[1]:<{grid_width}}')
+
+    def print_load_times(self, label, load_timings):
+        grid_width = self.grid_width
+
+        module_time = 'module ' + self.format_run_time(load_timings['module'] / 1e9)
+        construct_time = 'init ' + self.format_run_time(load_timings['construct'] / 1e9)
+
+        print(f'{label + " Load":<{grid_width}} | {module_time:<{grid_width}} | {construct_time:<{grid_width}}')
+
+    def print_imports(self, imports):
+        print(f'  Slowest imports ({self.format_run_time(sum(entry[2] for entry in imports) / 1e6)} listed):')
+        print(f'    {"cumulative":>12} {"self":>12}  module')
+
+        for module_name, self_time, cumulative_time in imports:
+            print(f'    {self.format_run_time(cumulative_time / 1e6):>12} {self.format_run_time(self_time / 1e6):>12}'
+                  f'  {module_name}')
+
+    def print_phases(self, label, phases):
+        grid_width = self.grid_width
+
+        for phase in ['reset', 'parse', 'solve']:
+            phase_times = [self.format_run_time(phases[part][phase] / 1e9) if part in phases else "N/A"
+                           for part in [1, 2]]
+
+            print(f'{label + " " + phase.capitalize():<{grid_width}} | {phase_times[0]:<{grid_width}} | '
+                  f'{phase_times[1]:<{grid_width}}')
+
+    def print_stats(self, label, stats):
+        grid_width = self.grid_width
+
+        for stat, stat_label in [('min', 'Min'), ('p95', 'P95'), ('stdev', 'Std Dev')]:
+            stat_values = [self.format_run_time(stats[part]['total'][stat] / 1e9) if part in stats else "N/A"
+                           for part in [1, 2]]
+
+            print(f'{label + " " + stat_label:<{grid_width}} | {stat_values[0]:<{grid_width}} | '
+                  f'{stat_values[1]:<{grid_width}}')
 
-        for day in range(1, 26):
-            spec = importlib.util.spec_from_file_location("Puzzle", f"year_{self.args.year}/day-{day}.py")
-            module = importlib.util.module_from_spec(spec)
-            sys.modules["Puzzle"] = module
-            spec.loader.exec_module(module)
+    def print_memory(self, label, memory_stats):
+        grid_width = self.grid_width
 
-            puzzle = module.Puzzle()
+        for stat, stat_label in [('peak', 'Peak Mem'), ('max_rss', 'Max RSS')]:
+            stat_values = [format_size(memory_stats[part][stat]) if part in memory_stats else "N/A"
+                           for part in [1, 2]]
+
+            print(f'{label + " " + stat_label:<{grid_width}} | {stat_values[0]:<{grid_width}} | '
+                  f'{stat_values[1]:<{grid_width}}')
+
+        for part in sorted(memory_stats.keys()):
+            print(f'  Part {part} largest allocation sites:')
+
+            for site, size, count in memory_stats[part]['top_sites']:
+                print(f'    {format_size(size):>12} {count:>10} blocks  {site}')
+
+    def print_profiles(self, profile_paths):
+        for part in sorted(profile_paths.keys()):
+            print(f'  Part {part} hot functions ({profile_paths[part]}):')
+            print(f'    {"cumulative":>12} {"own":>12} {"calls":>10}  function')
+
+            for function, call_count, total_time, cumulative_time in \
+                    get_top_functions(profile_paths[part], self.args.profile_top):
+                print(f'    {self.format_run_time(cumulative_time):>12} {self.format_run_time(total_time):>12} '
+                      f'{call_count:>10}  {function}')
+
+    def print_sampled_stacks(self, stack_paths):
+        for part in sorted(stack_paths.keys()):
+            entries, sample_count = get_top_sampled_functions(stack_paths[part], self.args.profile_top)
+
+            print(f'  Part {part} hot functions ({stack_paths[part]}, {sample_count} samples):')
+            if not sample_count:
+                # Parts that finish within one sampling interval.
+                continue
+
+            print(f'    {"total":>8} {"own":>8}  function')
+
+            for function, own_samples, total_samples in entries:
+                print(f'    {total_samples / sample_count:>8.1%} {own_samples / sample_count:>8.1%}  {function}')
+
+    def print_hot_lines(self, line_stats):
+        for part in sorted(line_stats.keys()):
+            total = line_stats[part]['total'] or 1
+
+            print(f'  Part {part} hottest lines ({line_stats[part]["report"]}, {line_stats[part]["total"]} run):')
+            print(f'    {"runs":>12} {"share":>6}  line')
+
+            for location, executions, source in line_stats[part]['hottest'][:self.args.profile_top]:
+                print(f'    {executions:>12} {executions / total:>6.1%}  {location}  {source}')
+
+    def print_helper_stats(self, helper_stats):
+        for part in sorted(helper_stats.keys()):
+            if not helper_stats[part]:
+                continue
+
+            print(f'  Part {part} helper calls:')
+            print(f'    {"time":>12} {"calls":>10} {"per call":>12}  helper')
+
+            for helper, calls, time_ns in helper_stats[part][:self.args.profile_top]:
+                print(f'    {self.format_run_time(time_ns / 1e9):>12} {calls:>10} '
+                      f'{self.format_run_time(time_ns / calls / 1e9):>12}  {helper}')
+
+    def add_records(self, year, day, result):
+        for part in [1, 2]:
+            record = {'year': year, 'day': day, 'part': part}
+
+            timeouts = result.get('timeouts', {}) if isinstance(result, dict) else {}
+
+            if part in timeouts:
+                record.update({
+                    'status': 'timed_out',
+                    'answer': None, 'total_ns': None, 'reset_ns': None, 'parse_ns': None, 'solve_ns': None,
+                    'elapsed_ns': int(timeouts[part]['elapsed'] * 1e9),
+                    'max_rss_bytes': timeouts[part]['peak_rss']
+                })
+            elif isinstance(result, dict) and part not in result['answers']:
+                record.update({
+                    'status': 'skipped',
+                    'answer': None, 'total_ns': None, 'reset_ns': None, 'parse_ns': None, 'solve_ns': None
+                })
+            elif isinstance(result, dict):
+                phases = result['phases'].get(part, {})
+
+                if 'load' in result:
+                    # Loading happens once per day, so it's only attributed to part 1.
+                    record.update({
+                        'module_load_ns': result['load']['module'] if part == 1 else 0,
+                        'construct_ns': result['load']['construct'] if part == 1 else 0
+                    })
+
+                record.update({
+                    'status': 'ok',
+                    'answer': result['answers'][part],
+                    'total_ns': sum(phases.values()),
+                    'reset_ns': phases.get('reset'),
+                    'parse_ns': phases.get('parse'),
+                    'solve_ns': phases.get('solve')
+                })
+
+                if part in result.get('gc', {}):
+                    record.update({
+                        'gc_collections': result['gc'][part]['collections'],
+                        'gc_pause_ns': result['gc'][part]['pause_ns']
+                    })
+
+                if part in result['memory']:
+                    record.update({
+                        'peak_bytes': result['memory'][part]['peak'],
+                        'max_rss_bytes': result['memory'][part]['max_rss']
+                    })
+
+                if 'stats' in result and part in result['stats']:
+                    total_stats = result['stats'][part]['total']
+
+                    record.update({
+                        'runs': total_stats['runs'],
+                        'min_ns': total_stats['min'],
+                        'median_ns': total_stats['median'],
+                        'p95_ns': total_stats['p95'],
+                        'stdev_ns': total_stats['stdev']
+                    })
+            else:
+                record.update({
+                    'status': result or 'not_implemented',
+                    'answer': None, 'total_ns': None, 'reset_ns': None, 'parse_ns': None, 'solve_ns': None
+                })
+
+            self.records.append(record)
+
+    def print_sweep_result(self, year, day, result):
+        grid_width = self.grid_width
+        label = self.day_label(year, day)
+
+        if result is None:
+            self.days_without_sweep_inputs.setdefault(year, []).append(day)
+            return
+
+        if isinstance(result, dict):
+            self.expected_growth[(year, day)] = result.get('expected_growth',
+                                                           (DEFAULT_EXPECTED_GROWTH, DEFAULT_EXPECTED_GROWTH))
+
+        print('=' * ((grid_width * 3) + 6))
+
+        if result == 'error' or result == CRASHED:
+            print(f'{label + " Sweep":<{grid_width}} | {"Error":<{grid_width}} | {"Error":<{grid_width}}')
+            return
+
+        print(f'{label + " Sweep":<{grid_width}} | {"Part 1":<{grid_width}} | {"Part 2":<{grid_width}}')
+
+        timeout = result['timeout']
+
+        for size, size_result in result['sizes'].items():
+            parts = size_result['parts']
+
+            times = [self.format_run_time(parts[part]['time']) if part in parts else "" for part in [1, 2]]
+            peaks = [format_size(parts[part]['peak']) + ' peak' if part in parts else "" for part in [1, 2]]
+
+            if timeout and timeout['size'] == size:
+                times[timeout['part'] - 1] = "> " + self.format_run_time(timeout['elapsed'])
+                peaks[timeout['part'] - 1] = format_size(timeout['peak_rss']) + ' when stopped'
+
+            size_label = f'n={size}'
+            print(f'{size_label + " Time":<{grid_width}} | {times[0]:<{grid_width}} | {times[1]:<{grid_width}}')
+            print(f'{size_label + " Memory":<{grid_width}} | {peaks[0]:<{grid_width}} | {peaks[1]:<{grid_width}}')
+
+        self.add_sweep_records(year, day, result)
+
+    def add_sweep_records(self, year, day, result):
+        for size, size_result in result['sizes'].items():
+            for part, part_result in sorted(size_result['parts'].items()):
+                phases = part_result['phases']
+
+                self.records.append({
+                    'year': year, 'day': day, 'part': part,
+                    'size': size, 'input_bytes': size_result['input_bytes'],
+                    'status': 'ok',
+                    'answer': part_result['answer'],
+                    'total_ns': sum(phases.values()),
+                    'reset_ns': phases['reset'],
+                    'parse_ns': phases['parse'],
+                    'solve_ns': phases['solve'],
+                    'peak_bytes': part_result['peak']
+                })
+
+        timeout = result['timeout']
+        if timeout:
+            self.records.append({
+                'year': year, 'day': day, 'part': timeout['part'],
+                'size': timeout['size'], 'input_bytes': result['sizes'][timeout['size']]['input_bytes'],
+                'status': 'timed_out',
+                'elapsed_ns': int(timeout['elapsed'] * 1e9),
+                'max_rss_bytes': timeout['peak_rss']
+            })
+
+    def print_days_without_sweep_inputs(self):
+        for year in sorted(self.days_without_sweep_inputs.keys()):
+            days = ', '.join(str(day) for day in sorted(self.days_without_sweep_inputs[year]))
+
+            print(f'{year}: nothing to sweep for days {days}')
+
+    def get_growth_fits(self):
+        points = {}
+        timeouts = {}
+
+        for record in self.records:
+            key = (record['year'], record['day'], record['part'])
+
+            if record['status'] == 'ok':
+                points.setdefault(key, []).append((record['input_bytes'], record['total_ns'] / 1e9))
+            elif record['status'] == 'timed_out':
+                timeouts[key] = record['input_bytes']
+
+        fits = {}
+
+        for key in sorted(points.keys()):
+            year, day, part = key
+
+            fits[key] = {
+                'points': points[key],
+                'growth': estimate_growth(points[key]),
+                'exponent': estimate_exponent(points[key]),
+                'expected': self.expected_growth[(year, day)][part - 1],
+                'timed_out_at': timeouts.get(key)
+            }
+
+            fit = fits[key]
+            fit['worse_than_expected'] = fit['growth'] is not None and \
+                is_worse_than_expected(fit['growth'][0], fit['exponent'], fit['expected'])
+
+        return fits
+
+    def print_growth_report(self, fits):
+        print('How each part\'s runtime grows with its input\'s length in bytes:')
+
+        for (year, day, part), fit in fits.items():
+            label = f'{self.day_label(year, day)} Part {part}'
+
+            if not has_enough_sizes(fit['points']):
+                print(f'  {label:<20} not enough sizes, or too close together, to fit')
+                continue
+
+            growth_class = fit['growth'][0] if fit['growth'] else 'no fit'
+            line = f'  {label:<20} {growth_class:<8} (~n^{fit["exponent"]:.2f}, expected {fit["expected"]})'
+
+            if fit['timed_out_at'] is not None:
+                line += f', timed out at {format_size(fit["timed_out_at"])}'
+
+            if fit['worse_than_expected']:
+                line += '  WORSE THAN EXPECTED'
+
+            print(line)
+
+    def write_growth_csv(self, path, fits):
+        # One row per measurement, next to the fitted curve's value there, so each part can be plotted as is.
+        with open(path, 'w', newline='') as output_file:
+            writer = csv.writer(output_file)
+            writer.writerow(['year', 'day', 'part', 'input_bytes', 'seconds', 'growth', 'fitted_seconds', 'exponent',
+                             'expected_growth', 'worse_than_expected'])
+
+            for (year, day, part), fit in fits.items():
+                growth_class, predict = fit['growth'] or (None, None)
+
+                for input_bytes, seconds in sorted(fit['points']):
+                    writer.writerow([
+                        year, day, part, input_bytes, seconds,
+                        growth_class or '', predict(input_bytes) if predict else '',
+                        f'{fit["exponent"]:.3f}' if fit['exponent'] is not None else '',
+                        fit['expected'],
+                        fit['worse_than_expected'] if growth_class else ''
+                    ])
+
+    def print_year_totals(self):
+        grid_width = self.grid_width
+
+        print('=' * ((grid_width * 3) + 6))
+
+        for year in sorted(self.year_totals.keys()):
+            totals = self.year_totals[year]
+
+            print(f'{str(year) + " Total":<{grid_width}} | {self.format_run_time(totals["part_1"]):<{grid_width}} | '
+                  f'{self.format_run_time(totals["part_2"]):<{grid_width}}')
+            print(f'{str(year) + " Days":<{grid_width}} | {str(totals["solved"]) + " solved":<{grid_width}} | '
+                  f'{str(totals["failed"]) + " timed out/failed":<{grid_width}}')
+
+    def print_baseline_comparison(self) -> bool:
+        has_regressions = False
+
+        for year in self.years:
+            baseline = load_baseline(year)
+
+            if baseline is None:
+                print(f'No baseline stored for {year} (expected {get_baseline_path(year)}).')
+                continue
+
+            year_records = [record for record in self.records if record['year'] == year]
+            changes = compare_to_baseline(baseline, year_records, self.args.threshold / 100)
+
+            if not changes:
+                print(f'{year}: no parts moved more than {self.args.threshold:g}% from the baseline.')
+                continue
+
+            print(f'{year}: {len(changes)} part(s) moved more than {self.args.threshold:g}% from the baseline:')
+
+            for change in changes:
+                baseline_time = self.format_run_time(change['baseline_ns'] / 1e9) \
+                    if change['baseline_ns'] is not None else 'N/A'
+                current_time = self.format_run_time(change['current_ns'] / 1e9) \
+                    if change['current_ns'] is not None else 'N/A'
+                ratio = f'{change["ratio"]:.2f}x' if change['ratio'] is not None else ''
+
+                print(f'  Day {change["day"]} Part {change["part"]}: {baseline_time} -> {current_time} '
+                      f'{ratio} {change["flag"].upper()}')
+
+                if change['flag'] in ['slower', 'broken']:
+                    has_regressions = True
+
+        return has_regressions
+
+    def get_tasks(self):
+        return [(year, day) for year in self.years for day in range(1, 26)]
+
+    def can_use_cache(self):
+        # Memory tracking and the other measurements are about taking new ones, so they always run.
+        return not self.args.memory and not self.changes_measurements()
+
+    def changes_measurements(self):
+        # Profiling, stack sampling, line counting, instrumentation and import breakdowns slow every part down, and
+        # collector settings change what's measured.
+        return self.args.profile or self.args.sample_stacks or self.args.line_counts or self.args.instrument or \
+            self.args.import_breakdown or self.uses_gc_options()
+
+    def get_cache_mode(self):
+        return f'benchmark={self.args.benchmark},warmup={self.args.warmup}' if self.args.benchmark else 'run'
+
+    def uses_gc_options(self):
+        return self.args.gc_stats or self.args.gc_freeze or self.args.gc_threshold is not None
+
+    def should_record_history(self):
+        # Runs taking other measurements are slowed down by them, so their timings would only muddy the history.
+        # Memory tracking slows parts down too, but its peaks are worth keeping, so those runs get their own mode.
+        return not self.args.no_history and not self.changes_measurements()
+
+    def get_history_mode(self):
+        return self.get_cache_mode() + (MEMORY_MODE_SUFFIX if self.args.memory else '')
+
+    def record_history(self):
+        # Cached days were already recorded by the run that produced them, and missing days have nothing to record.
+        records = [record for record in self.records
+                   if (record['year'], record['day']) not in self.cached_days and record['status'] != 'not_implemented']
+
+        if not records:
+            return
+
+        connection = connect(self.args.history)
+        try:
+            record_run(connection, records, self.get_history_mode())
+        finally:
+            connection.close()
+
+    def print_cached_results(self, tasks):
+        uncached_tasks = []
+
+        for year, day in tasks:
+            key = get_cache_key(year, day, self.get_cache_mode())
+            self.cache_keys[(year, day)] = key
+
+            result = load_cached_result(year, day, key) if not self.args.force else None
+
+            if result is None:
+                uncached_tasks.append((year, day))
+                continue
+
+            result['cached'] = True
+            self.used_cache = True
+            self.cached_days.add((year, day))
+
+            self.print_result(year, day, result)
+
+        return uncached_tasks
+
+    def finish_day(self, year, day, result):
+        # Timeouts depend on the budget and the machine's load as much as on the code, so they're never cached.
+        if isinstance(result, dict) and not result['timeouts'] and self.can_use_cache():
+            store_result(year, day, self.cache_keys.get((year, day)), result)
+
+        self.print_result(year, day, result)
+
+    def run_serial(self, tasks):
+        for year, day in tasks:
+            puzzle, load_timings = load_puzzle_timed(year, day)
+            prepare_puzzle(puzzle, self.args)
+
+            part_timeouts = get_part_timeouts(puzzle, year, day, self.args)
+            result = new_result()
 
             try:
-                print('=' * ((grid_width * 3) + 6))
+                for part in [1, 2]:
+                    start_time = time.monotonic()
 
-                answer_1, answer_2, part_1_timespan, part_2_timespan = func_timeout(10, puzzle.run, args=(True, True))
+                    try:
+                        part_result = func_timeout(part_timeouts[part], run_puzzle_part,
+                                                   args=(puzzle, part, self.args))
+                    except FunctionTimedOut:
+                        # Everything shares our process here, so its high-water mark is the best we can report.
+                        result['timeouts'][part] = {'elapsed': time.monotonic() - start_time,
+                                                    'peak_rss': get_max_rss()}
+                        break
 
-                print(f'{"Day " + str(day) + " Result":<{grid_width}} | {answer_1:<{grid_width}} | {answer_2:<{grid_width}}')
-                print(f'{"Day " + str(day) + " Time":<{grid_width}} | { self.format_run_time(part_1_timespan):<{grid_width}} | {self.format_run_time(part_2_timespan):<{grid_width}}')
-            except FunctionTimedOut:
-                print(f'{"Day " + str(day) + " Result":<{grid_width}} | {"Timed Out":<{grid_width}} | {"Timed Out":<{grid_width}}')
-                print(f'{"Day " + str(day) + " Time":<{grid_width}} | {"N/A":<{grid_width}} | {"N/A":<{grid_width}}')
+                    add_part_result(result, part, part_result)
 
+                add_load_details(result, year, day, load_timings, self.args)
             except AttributeError:
-                print(f'{"Day " + str(day) + " Result":<{grid_width}} | {"N/A":<{grid_width}} | {"N/A":<{grid_width}}')
-                print(f'{"Day " + str(day) + " Time":<{grid_width}} | {"N/A":<{grid_width}} | {"N/A":<{grid_width}}')
+                result = None
+
+            self.finish_day(year, day, result)
+
+    def run_parallel(self, tasks, start_method=None):
+        tasks = [(year, day, self.args) for year, day in tasks]
+
+        # The first budget covers loading the day; workers set their own for each part after that.
+        for task, status, result in run_tasks(run_day_in_worker, tasks, self.args.jobs, self.args.timeout,
+                                              start_method):
+            year, day, _ = task
+
+            if status == TIMED_OUT:
+                result = build_partial_result(result)
+            elif status != 'ok':
+                result = status
+
+            self.finish_day(year, day, result)
+
+    def get_file_times(self, paths):
+        return {path: os.stat(path).st_mtime_ns if os.path.exists(path) else None for path in paths}
+
+    def watch(self):
+        dependency_map = build_dependency_map(self.get_tasks())
+        file_times = self.get_file_times(dependency_map.keys())
+
+        print(f'Watching {len(file_times)} files for changes...')
+
+        while True:
+            time.sleep(WATCH_INTERVAL)
+
+            current_times = self.get_file_times(dependency_map.keys())
+            changed_paths = [path for path in current_times if current_times[path] != file_times[path]]
+
+            if not changed_paths:
+                continue
+
+            affected_tasks = sorted(set(task for path in changed_paths for task in dependency_map[path]))
+
+            # Edited days may have picked up (or dropped) helper imports. Everything is snapshotted before re-running,
+            # so files saved while the re-run goes are picked up by the next check.
+            dependency_map = build_dependency_map(self.get_tasks())
+            file_times = {**self.get_file_times(dependency_map.keys()), **current_times}
+
+            print(f'\nChanged: {", ".join(os.path.relpath(path) for path in changed_paths)}')
+            print(f'Re-running {len(affected_tasks)} day(s)...')
+
+            start_time = time.time()
+
+            self.year_totals = {}
+            self.records = []
+
+            # Results are cached under a hash of the sources that produced them, so the edited days need fresh keys.
+            for year, day in affected_tasks:
+                self.cache_keys[(year, day)] = get_cache_key(year, day, self.get_cache_mode())
+
+            # Forked workers would inherit every module we've imported, helpers included, as they were when we
+            # started. Spawned ones import the edited files afresh.
+            self.run_parallel(affected_tasks, 'spawn')
+
+            print(f'Re-run finished in {self.format_run_time(time.time() - start_time)}')
+
+    def print_comparison(self, year, day, result):
+        grid_width = self.grid_width
+        label = self.day_label(year, day)
+
+        if result is None:
+            return
+
+        print('=' * ((grid_width * 3) + 6))
+
+        if result == 'error' or result == CRASHED:
+            print(f'{label:<{grid_width}} | {"Error":<{grid_width}} |')
+            return
+
+        timeout = result['timeout']
+
+        for part, implementations in sorted(result['parts'].items()):
+            reference = implementations.get(REFERENCE_IMPLEMENTATION)
+            names = list(implementations.keys())
+
+            if timeout and timeout['part'] == part:
+                names.append(timeout['implementation'])
+
+            for i, name in enumerate(names):
+                row_label = f'{label} Part {part}' if i == 0 else ''
+
+                if name not in implementations:
+                    cell = f'Timed Out after {self.format_run_time(timeout["elapsed"])}'
+                else:
+                    cell = self.format_run_time(implementations[name]['time'])
+
+                    if reference is None:
+                        cell += '  UNVERIFIED'
+                    elif name != REFERENCE_IMPLEMENTATION:
+                        cell += '  ' + self.format_speedup(reference['time'], implementations[name]['time'])
+
+                        if self.is_mismatch(reference, implementations[name]):
+                            cell += '  DIFFERENT ANSWER'
+
+                print(f'{row_label:<{grid_width}} | {name:<{grid_width}} | {cell}')
+
+            if reference is not None:
+                for name, implementation_result in implementations.items():
+                    if self.is_mismatch(reference, implementation_result):
+                        self.has_mismatches = True
+
+                        print(f'  {name}: {implementation_result["sample_answer"]!r} on the sample and '
+                              f'{implementation_result["answer"]!r} on the real input, but {REFERENCE_IMPLEMENTATION} '
+                              f'gave {reference["sample_answer"]!r} and {reference["answer"]!r}')
+
+        self.add_comparison_records(year, day, result)
+
+    @staticmethod
+    def is_mismatch(reference, implementation_result):
+        return implementation_result['sample_answer'] != reference['sample_answer'] or \
+            implementation_result['answer'] != reference['answer']
+
+    @staticmethod
+    def format_speedup(reference_time, time_taken):
+        if not time_taken or not reference_time:
+            return ''
+
+        ratio = reference_time / time_taken
+
+        return f'{ratio:.2f}x faster' if ratio >= 1 else f'{1 / ratio:.2f}x slower'
+
+    def add_comparison_records(self, year, day, result):
+        timeout = result['timeout']
+
+        for part, implementations in sorted(result['parts'].items()):
+            reference = implementations.get(REFERENCE_IMPLEMENTATION)
+
+            for name, implementation_result in implementations.items():
+                total_stats = implementation_result['stats']['total']
+
+                self.records.append({
+                    'year': year, 'day': day, 'part': part, 'implementation': name,
+                    'status': 'mismatch' if reference and self.is_mismatch(reference, implementation_result) else 'ok',
+                    'answer': implementation_result['answer'],
+                    'sample_answer': implementation_result['sample_answer'],
+                    'runs': total_stats['runs'],
+                    'min_ns': total_stats['min'],
+                    'median_ns': total_stats['median'],
+                    'p95_ns': total_stats['p95'],
+                    'speedup': reference['time'] / implementation_result['time']
+                    if reference and implementation_result['time'] else None
+                })
+
+            if timeout and timeout['part'] == part:
+                self.records.append({
+                    'year': year, 'day': day, 'part': part, 'implementation': timeout['implementation'],
+                    'status': 'timed_out', 'answer': None, 'sample_answer': None,
+                    'elapsed_ns': int(timeout['elapsed'] * 1e9)
+                })
+
+    def run_comparison(self):
+        tasks = [(year, day, self.args) for year, day in self.get_tasks()]
+        compared_days = 0
+
+        for task, status, result in run_tasks(compare_day_in_worker, tasks, self.args.jobs, self.args.timeout):
+            year, day, _ = task
+
+            if status == TIMED_OUT:
+                result = build_partial_comparison_result(result)
+            elif status != 'ok':
+                result = status
+
+            if result is not None:
+                compared_days += 1
+
+            self.print_comparison(year, day, result)
+
+        if not compared_days:
+            print('No days in these years have more than one implementation of a part.')
+        else:
+            print('=' * ((self.grid_width * 3) + 6))
+
+        if self.args.export:
+            write_records(self.args.export, self.records)
+
+        return 1 if self.has_mismatches else 0
+
+    def run_sweep(self):
+        tasks = [(year, day, self.args) for year, day in self.get_tasks()]
+
+        # Sweeps always run in workers, so a size that takes too long only costs that day its remaining sizes.
+        for task, status, result in run_tasks(sweep_day_in_worker, tasks, self.args.jobs, self.args.timeout):
+            year, day, _ = task
+
+            if status == TIMED_OUT:
+                result = build_partial_sweep_result(result)
+            elif status != 'ok':
+                result = status
+
+            self.print_sweep_result(year, day, result)
+
+        print('=' * ((self.grid_width * 3) + 6))
+        self.print_days_without_sweep_inputs()
+
+        if self.args.fit or self.args.fit_csv:
+            fits = self.get_growth_fits()
+            self.print_growth_report(fits)
+
+            if self.args.fit_csv:
+                self.write_growth_csv(self.args.fit_csv, fits)
+
+        if self.args.export:
+            write_records(self.args.export, self.records)
+
+        return 0
+
+    def run(self):
+        start_time = time.time()
+
+        if self.args.sweep or self.args.sweep_dir:
+            return self.run_sweep()
+
+        if self.args.compare_implementations:
+            return self.run_comparison()
+
+        grid_width = self.grid_width
+        print(f'{"":<{grid_width}} | {"Part 1":<{grid_width}} | {"Part 2":<{grid_width}}')
+
+        tasks = self.get_tasks()
+
+        if self.can_use_cache():
+            tasks = self.print_cached_results(tasks)
+
+        # Watching always runs days in worker processes, so edited helpers are never served from our own imports.
+        if self.args.jobs > 1 or self.args.watch:
+            self.run_parallel(tasks)
+        else:
+            self.run_serial(tasks)
+
+        self.print_year_totals()
+
+        if self.used_cache:
+            print('Days marked * were answered from the cache with their original timings; use --force to rerun them.')
 
         print(f'Total runtime: {self.format_run_time(time.time() - start_time)}')
 
+        if self.args.export:
+            write_records(self.args.export, self.records)
+
+        if self.should_record_history():
+            self.record_history()
+
+        if self.args.compare_baseline and self.print_baseline_comparison():
+            return 1
+
+        if self.args.save_baseline:
+            for year in self.years:
+                save_baseline(year, self.records)
+
+        if self.args.watch:
+            try:
+                self.watch()
+            except KeyboardInterrupt:
+                pass
+
+        return 0
+
 
 if __name__ == "__main__":
     main = Tester()
-    main.run()
+    sys.exit(main.run())
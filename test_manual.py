@@ -2,6 +2,8 @@ import importlib.util
 import sys
 from argparse import ArgumentParser
 
+from helpers.profiling import get_top_functions
+
 
 class Tester(object):
     year: int
@@ -13,13 +15,15 @@ class Tester(object):
     def __init__(self):
         parser = ArgumentParser(
             description="Manual Tester",
-            usage="year day part:(1|2) test_input"
+            usage="year day part:(1|2) test_input [--profile [DIR]]"
         )
 
         parser.add_argument('year')
         parser.add_argument('day')
         parser.add_argument('part')
         parser.add_argument('test_input')
+        parser.add_argument('--profile', nargs='?', const='profiles', metavar='DIR')
+        parser.add_argument('--profile-top', type=int, default=10, metavar='N')
 
         self.args = parser.parse_args(sys.argv[1:])
 
@@ -32,13 +36,17 @@ class Tester(object):
         puzzle = module.Puzzle()
         puzzle.input_data = self.args.test_input.split('\\n')
 
-        puzzle.reset()
-        puzzle.prepare_data(puzzle.input_data, self.args.part)
+        puzzle.profile_dir = self.args.profile
+
+        answer, _ = puzzle.run_part(puzzle.input_data, 1 if self.args.part == "1" else 2, False)
+        print(answer)
+
+        for part, stats_path in puzzle.profile_paths.items():
+            print(f'Part {part} hot functions ({stats_path}):')
 
-        if self.args.part == "1":
-            print(puzzle.get_part_1_answer())
-        else:
-            print(puzzle.get_part_2_answer())
+            for function, call_count, total_time, cumulative_time in \
+                    get_top_functions(stats_path, self.args.profile_top):
+                print(f'  {cumulative_time:>10.6f}s {total_time:>10.6f}s {call_count:>10}  {function}')
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+import math
+import unittest
+
+from helpers.complexity import estimate_exponent, estimate_growth, has_enough_sizes, is_worse_than, \
+    is_worse_than_expected
+
+SIZES = [100, 200, 400, 800, 1600]
+
+
+class ComplexityTests(unittest.TestCase):
+    def test_linear(self):
+        growth, predict = estimate_growth([(n, 0.001 + 0.0001 * n) for n in SIZES])
+
+        self.assertEqual('n', growth)
+        self.assertAlmostEqual(0.161, predict(1600))
+
+    def test_quadratic(self):
+        # Alternating noise shouldn't be enough to push the fit to a steeper class.
+        points = [(n, 1e-6 * n ** 2 * (1.1 if i % 2 else 0.9)) for i, n in enumerate(SIZES)]
+
+        self.assertEqual('n^2', estimate_growth(points)[0])
+        self.assertAlmostEqual(2, estimate_exponent(points), delta=0.1)
+
+    def test_exponential(self):
+        self.assertEqual('exp', estimate_growth([(n, 1e-6 * math.exp(n)) for n in [5, 10, 15, 20, 25]])[0])
+
+    def test_too_close_to_fit(self):
+        self.assertIsNone(estimate_growth([(n, n) for n in [100, 120, 140, 160]]))
+        self.assertIsNone(estimate_growth([(100, 1), (1000, 10)]))
+
+    def test_no_class_fits(self):
+        # Timings that jump around, or are too noisy to follow any curve closely, shouldn't be labelled with a class.
+        scattered = [(100, 1), (200, 0.01), (400, 5), (800, 0.02), (1600, 3)]
+        noisy_cubic = [(n, 1e-9 * n ** 3 * (3 if i % 2 else 1 / 3)) for i, n in enumerate(SIZES)]
+
+        for points in [scattered, noisy_cubic]:
+            self.assertTrue(has_enough_sizes(points))
+            self.assertIsNone(estimate_growth(points))
+
+        self.assertAlmostEqual(3, estimate_exponent(noisy_cubic))
+
+    def test_is_worse_than(self):
+        self.assertTrue(is_worse_than('n^2', 'n log n'))
+        self.assertFalse(is_worse_than('n', 'n log n'))
+        self.assertFalse(is_worse_than('exp', 'exp'))
+
+    def test_is_worse_than_expected(self):
+        self.assertTrue(is_worse_than_expected('n^2', 1.9, 'n log n'))
+        self.assertFalse(is_worse_than_expected('n^2', 1.2, 'n log n'))
+        self.assertFalse(is_worse_than_expected('n', 1.9, 'n log n'))
@@ -0,0 +1,32 @@
+import glob
+import os
+import re
+import unittest
+
+from helpers.dependency_map import ROOT_DIR, build_dependency_map, get_local_dependencies
+
+
+def get_all_days():
+    return [(int(year), int(day)) for year, day in
+            (re.search(r'year_(\d+)[/\\]day-(\d+)\.py$', path).groups()
+             for path in glob.glob(os.path.join(ROOT_DIR, 'year_*', 'day-*.py')))]
+
+
+class DependencyMapTests(unittest.TestCase):
+    def test_helper_maps_to_its_importers(self):
+        pathing_grid_path = os.path.join(ROOT_DIR, 'helpers', 'pathing_grid.py')
+        importers = set()
+
+        for year, day in get_all_days():
+            with open(os.path.join(ROOT_DIR, f'year_{year}', f'day-{day}.py'), 'r') as day_file:
+                if 'helpers.pathing_grid' in day_file.read():
+                    importers.add((year, day))
+
+        self.assertTrue(importers)
+        self.assertEqual(importers, build_dependency_map(get_all_days())[pathing_grid_path])
+
+    def test_puzzle_base_does_not_depend_on_grids(self):
+        dependencies = get_local_dependencies(os.path.join(ROOT_DIR, 'puzzle_base.py'))
+
+        self.assertNotIn(os.path.join(ROOT_DIR, 'helpers', 'grid.py'), dependencies)
+        self.assertNotIn(os.path.join(ROOT_DIR, 'helpers', 'pathing_grid.py'), dependencies)
@@ -0,0 +1,27 @@
+import gc
+import unittest
+
+from helpers.gc_tracking import GcTracker, parse_gc_thresholds
+
+
+class GcTrackingTests(unittest.TestCase):
+    def test_counts_collections(self):
+        tracker = GcTracker()
+        tracker.start()
+
+        for _ in range(10):
+            cycle = []
+            cycle.append(cycle)
+
+        del cycle
+        gc.collect()
+        stats = tracker.stop()
+
+        self.assertEqual(1, stats['by_generation'][2])
+        self.assertGreaterEqual(stats['collected'], 10)
+        self.assertGreater(stats['pause_ns'], 0)
+        self.assertNotIn(tracker.on_collection, gc.callbacks)
+
+    def test_parse_gc_thresholds(self):
+        self.assertEqual((0,), parse_gc_thresholds('0'))
+        self.assertEqual((50000, 20, 20), parse_gc_thresholds('50000,20,20'))
@@ -0,0 +1,22 @@
+import sys
+import unittest
+
+from run_year import load_puzzle
+
+
+class GeneratedInputTests(unittest.TestCase):
+    def test_2022_12_small_maps_are_climbable(self):
+        puzzle = load_puzzle(2022, 12)
+        puzzle.is_silent = True
+
+        for size in [6, 7, 10, 13, 20]:
+            input_data = puzzle.get_generated_input(size)
+
+            for part in [1, 2]:
+                answer, _ = puzzle.run_part(input_data, part, False)
+
+                self.assertLess(int(answer), sys.maxsize, f'size {size}, part {part}')
+                self.assertGreater(int(answer), 0, f'size {size}, part {part}')
+
+        with self.assertRaises(ValueError):
+            puzzle.get_generated_input(5)
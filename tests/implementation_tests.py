@@ -0,0 +1,37 @@
+import unittest
+
+from puzzle_base import REFERENCE_IMPLEMENTATION, PuzzleBase, implementation
+
+
+class CountingPuzzle(PuzzleBase):
+    def reset(self):
+        pass
+
+    def prepare_data(self, input_data, current_part):
+        pass
+
+    def get_part_1_answer(self, use_sample=False) -> str:
+        return 'loop'
+
+    def get_part_2_answer(self, use_sample=False) -> str:
+        return 'loop'
+
+    @implementation(1, 'formula')
+    def get_part_1_answer_formula(self, use_sample=False) -> str:
+        return 'formula'
+
+
+class ImplementationTests(unittest.TestCase):
+    def test_get_implementations(self):
+        puzzle = CountingPuzzle()
+
+        self.assertEqual([REFERENCE_IMPLEMENTATION, 'formula'], list(puzzle.get_implementations(1)))
+        self.assertEqual([REFERENCE_IMPLEMENTATION], list(puzzle.get_implementations(2)))
+
+    def test_get_solver(self):
+        puzzle = CountingPuzzle()
+        puzzle.implementation_name = 'formula'
+
+        self.assertEqual('formula', puzzle.get_solver(1)())
+        # Parts without the named implementation fall back to their reference one.
+        self.assertEqual('loop', puzzle.get_solver(2)())
@@ -0,0 +1,23 @@
+import random
+import unittest
+
+from helpers.input_generation import random_rows, unique_names
+
+
+class InputGenerationTests(unittest.TestCase):
+    def test_random_rows(self):
+        rows = random_rows(7, 3, random.Random(0), '.#')
+
+        self.assertEqual(3, len(rows))
+        self.assertTrue(all(len(row) == 7 and set(row) <= {'.', '#'} for row in rows))
+
+    def test_same_seed_same_rows(self):
+        self.assertEqual(random_rows(10, 10, random.Random(4), '0123456789'),
+                         random_rows(10, 10, random.Random(4), '0123456789'))
+
+    def test_unique_names(self):
+        names = unique_names(30, random.Random(0), 1)
+
+        self.assertEqual(30, len(set(names)))
+        # 26 one-letter names aren't enough, so they all grow to two letters.
+        self.assertTrue(all(len(name) == 2 for name in names))
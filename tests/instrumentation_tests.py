@@ -0,0 +1,30 @@
+import unittest
+
+from helpers.grid import Point
+from helpers.instrumentation import HelperInstrumentation
+from helpers.list_helpers import ListHelper
+
+
+class InstrumentationTests(unittest.TestCase):
+    def test_counts_calls(self):
+        instrumentation = HelperInstrumentation()
+        instrumentation.start()
+
+        Point(1, 2) + Point(3, 4) + Point(5, 6)
+        ListHelper().get_permutations([1, 2, 3])
+
+        calls = {helper: call_count for helper, call_count, _ in instrumentation.stop()}
+
+        self.assertEqual(2, calls['Point.__add__'])
+        # The recursive calls on two-item sublists count too.
+        self.assertEqual(4, calls['ListHelper.get_permutations'])
+
+    def test_unwraps_on_stop(self):
+        original = Point.__add__
+
+        instrumentation = HelperInstrumentation()
+        instrumentation.start()
+        self.assertIsNot(original, Point.__add__)
+
+        instrumentation.stop()
+        self.assertIs(original, Point.__add__)
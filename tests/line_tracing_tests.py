@@ -0,0 +1,26 @@
+import sys
+import unittest
+
+from helpers.line_tracing import count_lines_call, get_hottest_lines
+
+
+def sum_squares(count):
+    total = 0
+    for i in range(count):
+        total += i * i
+    return total
+
+
+class LineTracingTests(unittest.TestCase):
+    def test_count_lines_call(self):
+        trace = sys.gettrace()
+        result, counts = count_lines_call(sum_squares, [__file__], 10)
+
+        self.assertEqual(285, result)
+        self.assertIs(trace, sys.gettrace())
+
+        hottest = get_hottest_lines(counts, 1)[0]
+
+        # The loop header runs once more than its body, to find the range is done.
+        self.assertEqual(11, hottest[1])
+        self.assertEqual('for i in range(count):', hottest[2])
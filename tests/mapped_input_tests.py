@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+from helpers.mapped_input import MappedInput
+from puzzle_base import format_input
+
+
+class MappedInputTests(unittest.TestCase):
+    def write_input(self, contents: bytes) -> str:
+        input_file = tempfile.NamedTemporaryFile(delete=False)
+        input_file.write(contents)
+        input_file.close()
+
+        self.addCleanup(os.remove, input_file.name)
+
+        return input_file.name
+
+    def test_matches_format_input(self):
+        for contents in [b'abc\n def \n\nghi', b'abc\ndef\n', b'  x  \r\ny\r\n', b'', b'\n']:
+            path = self.write_input(contents)
+
+            with open(path, 'r') as input_file:
+                text = input_file.read()
+
+            for should_strip_data in [True, False]:
+                self.assertEqual(format_input(text, should_strip_data),
+                                 list(MappedInput(path, should_strip_data)))
+
+    def test_line_types(self):
+        path = self.write_input(b'12 34\n 56\n')
+
+        self.assertEqual([b'12 34', b'56', b''], list(MappedInput(path, line_type='bytes')))
+
+        lines = [bytes(line) for line in MappedInput(path, line_type='memoryview')]
+        self.assertEqual([b'12 34', b'56', b''], lines)
+
+    def test_can_iterate_repeatedly(self):
+        path = self.write_input(b'a\nb')
+        mapped_input = MappedInput(path)
+
+        self.assertEqual(list(mapped_input), list(mapped_input))
+
+
+if __name__ == '__main__':
+    unittest.main()
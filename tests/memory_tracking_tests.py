@@ -0,0 +1,29 @@
+import tracemalloc
+import unittest
+
+from puzzle_base import PuzzleBase
+
+
+class FailingPuzzle(PuzzleBase):
+    def reset(self):
+        pass
+
+    def prepare_data(self, input_data, current_part):
+        pass
+
+    def get_part_1_answer(self, use_sample=False) -> str:
+        raise ValueError('unsolvable')
+
+    def get_part_2_answer(self, use_sample=False) -> str:
+        return ''
+
+
+class MemoryTrackingTests(unittest.TestCase):
+    def test_stops_tracing_when_part_fails(self):
+        puzzle = FailingPuzzle()
+        puzzle.track_memory = True
+
+        with self.assertRaises(ValueError):
+            puzzle.run_part([], 1, True)
+
+        self.assertFalse(tracemalloc.is_tracing())
@@ -0,0 +1,30 @@
+import unittest
+
+from helpers.microbenchmarks import BENCHMARKS, compare_benchmarks, get_benchmark_names, run_benchmarks
+
+
+class MicrobenchmarksTests(unittest.TestCase):
+    def test_every_benchmark_runs(self):
+        results = run_benchmarks(list(BENCHMARKS), repeat=1, min_time=0, sizes=[4])
+
+        self.assertEqual(len(BENCHMARKS), len(results))
+
+        for key, result in results.items():
+            self.assertGreater(result['operations'], 0, key)
+            self.assertGreater(result['median'], 0, key)
+
+    def test_get_benchmark_names(self):
+        names = get_benchmark_names(['point.*'])
+
+        self.assertIn('point.hash', names)
+        self.assertNotIn('point3d.hash', names)
+        self.assertEqual(list(BENCHMARKS), get_benchmark_names())
+
+    def test_compare_benchmarks(self):
+        old_results = {'a/1': {'median': 100}, 'b/1': {'median': 100}, 'c/1': {'median': 100}, 'd/1': {'median': 100}}
+        new_results = {'a/1': {'median': 105}, 'b/1': {'median': 300}, 'c/1': {'median': 50}}
+
+        changes = compare_benchmarks(old_results, new_results, 0.1)
+
+        self.assertEqual([('b/1', 'slower'), ('c/1', 'faster')],
+                         [(change['key'], change['flag']) for change in changes])
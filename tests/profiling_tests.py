@@ -0,0 +1,33 @@
+import os
+import tempfile
+import time
+import unittest
+
+from helpers.profiling import get_top_sampled_functions, sample_call
+
+
+def busy_leaf(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def busy_root(seconds):
+    busy_leaf(seconds)
+    return 'done'
+
+
+class ProfilingTests(unittest.TestCase):
+    def test_sample_call(self):
+        with tempfile.TemporaryDirectory() as folder:
+            stacks_path = os.path.join(folder, 'stacks.folded')
+
+            self.assertEqual('done', sample_call(busy_root, stacks_path, 500, 0.1))
+
+            entries, sample_count = get_top_sampled_functions(stacks_path, 2)
+
+        self.assertGreater(sample_count, 0)
+        # Every sample is inside busy_root, and nearly all of its time is spent in busy_leaf.
+        self.assertTrue(entries[0][0].endswith('(busy_root)'))
+        self.assertEqual(sample_count, entries[0][2])
+        self.assertTrue(entries[1][0].endswith('(busy_leaf)'))
@@ -0,0 +1,52 @@
+import unittest
+
+from puzzle_base import PuzzleBase
+from puzzle_daemon import PuzzleDaemon
+
+
+class CountingPuzzle(PuzzleBase):
+    parse_once = True
+
+    def __init__(self):
+        super().__init__()
+        self.parse_count = 0
+
+    def parse_input(self, input_data):
+        self.parse_count += 1
+        return len(input_data)
+
+    def reset(self):
+        pass
+
+    def prepare_data(self, input_data, current_part):
+        pass
+
+    def get_part_1_answer(self, use_sample=False) -> str:
+        return ''
+
+    def get_part_2_answer(self, use_sample=False) -> str:
+        return ''
+
+
+class PuzzleDaemonTests(unittest.TestCase):
+    def test_rejects_days_that_are_not_numbers(self):
+        daemon = PuzzleDaemon()
+
+        for request in [{'year': '../../etc', 'day': 1}, {'year': 2022, 'day': None}, {'year': 2022}]:
+            self.assertIn('error', daemon.run({'command': 'run', **request}))
+
+    def test_forget_real_input_drops_parsed_input(self):
+        puzzle = CountingPuzzle()
+        puzzle.input_data = ['a', 'b']
+
+        self.assertEqual(2, puzzle.get_parsed_input(puzzle.input_data))
+        self.assertEqual(2, puzzle.get_parsed_input(puzzle.input_data))
+
+        puzzle.forget_real_input()
+
+        self.assertEqual({}, puzzle._parsed_inputs)
+
+        puzzle.input_data = ['a', 'b', 'c']
+
+        self.assertEqual(3, puzzle.get_parsed_input(puzzle.input_data))
+        self.assertEqual(2, puzzle.parse_count)
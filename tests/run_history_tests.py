@@ -0,0 +1,55 @@
+import unittest
+from unittest import mock
+
+from helpers.run_history import MEMORY_MODE_SUFFIX, connect, get_movers, get_slowest, get_trend, record_run
+
+
+def make_record(day, part, total_ns, status='ok'):
+    return {'year': 2022, 'day': day, 'part': part, 'status': status, 'answer': 1 if status == 'ok' else None,
+            'total_ns': total_ns, 'reset_ns': 0, 'parse_ns': 0, 'solve_ns': total_ns}
+
+
+class RunHistoryTests(unittest.TestCase):
+    def setUp(self):
+        self.connection = connect(':memory:')
+
+    def tearDown(self):
+        self.connection.close()
+
+    def record(self, commit_hash, records, is_dirty=False, mode='run'):
+        with mock.patch('helpers.run_history.get_commit', return_value=(commit_hash, is_dirty)):
+            record_run(self.connection, records, mode)
+
+    def test_trend(self):
+        self.record('aaa', [make_record(1, 1, 5_000_000)])
+        self.record('bbb', [make_record(1, 1, 3_000_000)])
+
+        self.assertEqual(['aaa', 'bbb'], [row['commit_hash'] for row in get_trend(self.connection, 2022, 1)])
+
+    def test_slowest_uses_latest_run(self):
+        self.record('aaa', [make_record(1, 1, 9_000_000), make_record(2, 1, 5_000_000)])
+        self.record('bbb', [make_record(1, 1, 1_000_000), make_record(2, 1, None, 'timed_out')])
+
+        rows = get_slowest(self.connection)
+
+        # Day 2 timed out in the latest run, so its latest successful one is used.
+        self.assertEqual([(2, 5_000_000), (1, 1_000_000)], [(row['day'], row['time_ns']) for row in rows])
+
+    def test_slowest_leaves_out_memory_runs(self):
+        self.record('aaa', [make_record(1, 1, 1_000_000)])
+        self.record('aaa', [{**make_record(1, 1, 8_000_000), 'peak_bytes': 4096}], mode='run' + MEMORY_MODE_SUFFIX)
+
+        self.assertEqual([1_000_000], [row['time_ns'] for row in get_slowest(self.connection)])
+        self.assertEqual([4096], [row['peak_bytes'] for row in get_slowest(self.connection, mode='run,memory')])
+        self.assertEqual(['run', 'run,memory'], [row['mode'] for row in get_trend(self.connection, 2022, 1)])
+
+    def test_movers(self):
+        self.record('aaa', [make_record(1, 1, 10_000_000), make_record(2, 1, 10_000_000), make_record(3, 1, 100)])
+        self.record('bbb', [make_record(1, 1, 40_000_000), make_record(2, 1, 5_000_000), make_record(3, 1, 900)])
+        # Runs with uncommitted changes don't count towards either commit.
+        self.record('bbb', [make_record(1, 1, 1)], is_dirty=True)
+
+        movers = get_movers(self.connection, 'aaa', 'bbb')
+
+        # Day 3 moved the most relative to its old time, but by too little to be more than noise.
+        self.assertEqual([(1, 4.0), (2, 0.5)], [(mover['day'], mover['ratio']) for mover in movers])
@@ -0,0 +1,49 @@
+import unittest
+
+from helpers.grid import ArrayGrid, Point
+from helpers.shared_grid import SharedArrays, attach, shared_pool_map
+
+
+def create_cell_reader(views: dict):
+    grid, table = views['grid'], views['table']
+
+    return lambda point: (grid[point], table[point.y, point.x])
+
+
+class SharedGridTests(unittest.TestCase):
+    def test_grid_view(self):
+        grid = ArrayGrid.from_strings(['#..', '.#.'])
+
+        with SharedArrays() as shared:
+            view = attach(shared.publish_grid(grid))
+
+            self.assertEqual('#', view[Point(1, 1)])
+            self.assertEqual('.', view[(2, 0)])
+            self.assertIsNone(view[(3, 0)])
+            self.assertEqual(grid.neighbors(Point(1, 0), True), view.neighbors(Point(1, 0), True))
+            self.assertEqual(str(grid), str(view))
+            self.assertEqual((3, 2), (view.width, view.height))
+
+            with self.assertRaises(TypeError):
+                view[(0, 0)] = '.'
+
+    def test_table_view(self):
+        with SharedArrays() as shared:
+            table = attach(shared.publish_table([0, 1, 2, 3, 4, -5], (2, 3)))
+
+            self.assertEqual(-5, table[1, 2])
+            self.assertTrue(table.readonly)
+
+            with self.assertRaises(ValueError):
+                shared.publish_table([1, 2, 3], (2, 2))
+
+    def test_shared_pool_map(self):
+        grid = ArrayGrid.from_strings(['#..', '.#.'])
+        points = [Point(x, y) for y in range(2) for x in range(3)]
+
+        with SharedArrays() as shared:
+            handles = {'grid': shared.publish_grid(grid), 'table': shared.publish_table(list(range(6)), (2, 3))}
+
+            results = shared_pool_map(create_cell_reader, points, handles, 2)
+
+        self.assertEqual([('#', 0), ('.', 1), ('.', 2), ('.', 3), ('#', 4), ('.', 5)], results)
@@ -0,0 +1,32 @@
+import unittest
+
+from helpers.timing_stats import percentile, summarize
+
+
+class TimingStatsTests(unittest.TestCase):
+    def test_percentile(self):
+        samples = list(range(1, 101))
+
+        self.assertEqual(95, percentile(samples, 0.95))
+        self.assertEqual(1, percentile(samples, 0))
+        self.assertEqual(100, percentile(samples, 1))
+        self.assertEqual(7, percentile([7], 0.95))
+
+    def test_summarize(self):
+        summary = summarize([5, 1, 3, 2, 4])
+
+        self.assertEqual(5, summary['runs'])
+        self.assertEqual(1, summary['min'])
+        self.assertEqual(3, summary['median'])
+        self.assertEqual(5, summary['p95'])
+        self.assertAlmostEqual(1.5811, summary['stdev'], places=4)
+
+    def test_summarize_single_run(self):
+        summary = summarize([10])
+
+        self.assertEqual(10, summary['median'])
+        self.assertEqual(0, summary['stdev'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
+import random
 import re
+import string
 from typing import List
 
+from helpers.input_generation import unique_names
 from helpers.list_helpers import ListHelper
 from puzzle_base import PuzzleBase
 
@@ -9,6 +12,9 @@ class Puzzle(PuzzleBase):
     year = 2015
     day = 13
 
+    # Every seating arrangement is tried, so runtime grows exponentially.
+    expected_growth = ('exp', 'exp')
+
     guests: list[str] = []
     happiness_pairs: dict[tuple[str, str], int]
 
@@ -31,6 +37,20 @@ class Puzzle(PuzzleBase):
             if sections[4] not in self.guests:
                 self.guests.append(sections[4])
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of guests, each with a feeling about sitting next to every other guest.
+        names = [name.capitalize() for name in unique_names(size, rng, 6, string.ascii_lowercase)]
+        lines = []
+
+        for guest in names:
+            for neighbor in names:
+                if guest != neighbor:
+                    change = rng.randint(-99, 99)
+                    lines.append(f'{guest} would {"gain" if change >= 0 else "lose"} {abs(change)} happiness units '
+                                 f'by sitting next to {neighbor}.')
+
+        return '\n'.join(lines)
+
     def get_happiness(self, layout):
         total = 0
 
@@ -1,6 +1,9 @@
+import random
 import re
+import string
 from typing import List
 
+from helpers.input_generation import unique_names
 from puzzle_base import PuzzleBase
 
 
@@ -45,6 +48,13 @@ class Puzzle(PuzzleBase):
             reindeer = Reindeer(sections[1], int(sections[2]), int(sections[3]), int(sections[4]))
             self.reindeer.append(reindeer)
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of reindeer.
+        names = [name.capitalize() for name in unique_names(size, rng, 6, string.ascii_lowercase)]
+
+        return '\n'.join(f'{name} can fly {rng.randint(2, 30)} km/s for {rng.randint(2, 20)} seconds, '
+                         f'but then must rest for {rng.randint(20, 180)} seconds.' for name in names)
+
     def get_reindeer_distance(self, reindeer: Reindeer, seconds: int):
         periods = seconds // reindeer.period_time
         period_remainder = seconds % reindeer.period_time
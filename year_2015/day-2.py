@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from puzzle_base import PuzzleBase
@@ -57,6 +58,10 @@ class Puzzle(PuzzleBase):
             box = Box(int(dimensions[0]), int(dimensions[1]), int(dimensions[2]))
             self.boxes.append(box)
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of presents.
+        return '\n'.join(f'{rng.randint(1, 30)}x{rng.randint(1, 30)}x{rng.randint(1, 30)}' for _ in range(size))
+
     def get_part_1_answer(self, use_sample=False) -> str:
         total_feet = 0
         for box in self.boxes:
@@ -1,5 +1,8 @@
+import random
+import string
 from typing import List
 
+from helpers.input_generation import unique_names
 from helpers.list_helpers import ListHelper
 from puzzle_base import PuzzleBase
 
@@ -15,6 +18,9 @@ class Puzzle(PuzzleBase):
     year = 2015
     day = 9
 
+    # Every route between the locations is tried, so runtime grows exponentially.
+    expected_growth = ('exp', 'exp')
+
     cities = dict[str, City]
     city_paths = {}
 
@@ -38,6 +44,13 @@ class Puzzle(PuzzleBase):
             self.city_paths[(parts[0], parts[2])] = int(parts[4])
             self.city_paths[(parts[2], parts[0])] = int(parts[4]) # getting the reverse too
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of locations, with a distance between every pair of them.
+        names = [name.capitalize() for name in unique_names(size, rng, 6, string.ascii_lowercase)]
+
+        return '\n'.join(f'{names[i]} to {names[j]} = {rng.randint(10, 150)}'
+                         for i in range(size) for j in range(i + 1, size))
+
     def get_distance(self, path: list[str]):
         total = 0
 
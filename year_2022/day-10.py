@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable
 
 from puzzle_base import PuzzleBase
 
@@ -14,6 +14,8 @@ class Puzzle(PuzzleBase):
 
     crt = []
 
+    stream_input = 'str'
+
     def reset(self):
         self.crt = [[False for _ in range(40)] for __ in range(6)]
 
@@ -21,10 +23,8 @@ class Puzzle(PuzzleBase):
         self.X = 1
         self.total_signal = 0
 
-    def prepare_data(self, input_data: List[str], current_part: int):
-        for i in range(len(input_data)):
-            line = input_data[i]
-
+    def prepare_data(self, input_data: Iterable[str], current_part: int):
+        for line in input_data:
             operands = line.strip().split(' ')
 
             if operands[0] == 'noop':
@@ -1,9 +1,11 @@
+import heapq
+import random
 import sys
 from typing import List, Tuple, Optional, Union
 
 from helpers.grid import Grid, Grid, Point, ArrayGrid
 from helpers.pathing_grid import PathingGrid, ElevationNode
-from puzzle_base import PuzzleBase
+from puzzle_base import PuzzleBase, implementation
 
 
 class Puzzle(PuzzleBase):
@@ -16,22 +18,73 @@ class Puzzle(PuzzleBase):
         Point(-1, 0), Point(1, 0), Point(0, -1), Point(0, 1)
     ]
 
+    parse_once = True
+
     def reset(self):
         pass
 
+    def parse_input(self, input_data: List[str]) -> PathingGrid:
+        grid = PathingGrid.from_strings(input_data, node_type=ElevationNode)
+        self.locate_start_end(grid)
+
+        return grid
+
+    def copy_parsed_input(self, parsed_input: PathingGrid) -> PathingGrid:
+        return parsed_input.copy()
+
     def prepare_data(self, input_data: List[str], current_part: int):
-        self.grid = PathingGrid.from_strings(input_data, node_type=ElevationNode)
-        self.locate_start_end()
+        self.grid = self.parsed_input
 
-    def locate_start_end(self):
-        for x in range(self.grid.extents[0][1]):
-            for y in range(self.grid.extents[1][1]):
-                node = self.grid[(x, y)]
+    def locate_start_end(self, grid: PathingGrid):
+        for x in range(grid.extents[0][1] + 1):
+            for y in range(grid.extents[1][1] + 1):
+                node = grid[(x, y)]
 
                 if node.char_code == 'S':
-                    self.grid.set_start(Point(x, y))
+                    grid.set_start(Point(x, y))
                 elif node.char_code == 'E':
-                    self.grid.set_end(Point(x, y))
+                    grid.set_end(Point(x, y))
+
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the heightmap's width and height. A winding path runs from S in the top left corner along every
+        # other row, stepping down at alternate ends, and climbs evenly to E at its end, so there's always a way up.
+        # The rows in between are bumps and dips around the path above them. Climbing from a to z takes 26 cells,
+        # which the smallest maps only fit by winding through every row.
+        if size < 6:
+            raise ValueError('Heightmaps smaller than 6x6 have too few cells to climb from a to z.')
+
+        row_step = 2 if ((size + 1) // 2) * (size + 1) - 1 >= 26 else 1
+
+        path = []
+
+        for row_index, y in enumerate(range(0, size, row_step)):
+            if path:
+                path += [(path[-1][0], between) for between in range(path[-1][1] + 1, y)]
+
+            path += [(x, y) for x in (range(size) if row_index % 2 == 0 else range(size - 1, -1, -1))]
+
+        elevations = {pos: index * 25 // (len(path) - 1) for index, pos in enumerate(path)}
+
+        rows = []
+
+        for y in range(size):
+            row = ''
+
+            for x in range(size):
+                if (x, y) in elevations:
+                    elevation = elevations[(x, y)]
+                else:
+                    elevation = min(25, max(0, elevations[(x, y - 1)] + rng.randint(-2, 2)))
+
+                row += chr(ord('a') + elevation)
+
+            rows.append(row)
+
+        (start_x, start_y), (end_x, end_y) = path[0], path[-1]
+        rows[start_y] = rows[start_y][:start_x] + 'S' + rows[start_y][start_x + 1:]
+        rows[end_y] = rows[end_y][:end_x] + 'E' + rows[end_y][end_x + 1:]
+
+        return '\n'.join(rows)
 
     def calc_path(self):
         node_queue = []
@@ -68,6 +121,45 @@ class Puzzle(PuzzleBase):
 
         return True
 
+    def calc_path_heap(self):
+        # The same search as calc_path(), with the queue kept in a heap rather than re-sorted for every node. Nodes
+        # are pushed again whenever they get closer, and the stale entries are skipped when they come up.
+        for x in range(self.grid.extents[0][1] + 1):
+            for y in range(self.grid.extents[1][1] + 1):
+                node = self.grid[(x, y)]
+
+                if not node.is_end:
+                    node.distance = sys.maxsize
+                node.last_node = None
+                node.next_node_in_path = None
+
+        end_node = self.grid.get_end_node()
+        # The counter breaks ties, since nodes can't be compared.
+        node_queue = [(end_node.distance, 0, end_node)]
+        pushed = 1
+
+        while node_queue:
+            distance, _, node = heapq.heappop(node_queue)
+
+            if distance > node.distance:
+                continue
+
+            for movement in self.movements:
+                next_node = self.grid[node.pos + movement]
+
+                if not next_node or node.elevation - next_node.elevation > 1:
+                    continue
+
+                movement_cost = node.distance + 1
+                if movement_cost < next_node.distance:
+                    next_node.distance = movement_cost
+                    next_node.last_node = node
+
+                    heapq.heappush(node_queue, (movement_cost, pushed, next_node))
+                    pushed += 1
+
+        return True
+
     def retrace_path(self, goal_coords) -> int:
         current_node = self.grid[goal_coords]
         goal_node = self.grid.get_end_node()
@@ -94,9 +186,13 @@ class Puzzle(PuzzleBase):
 
         return str(path_len)
 
-    def get_part_2_answer(self, use_sample=False) -> str:
-        self.calc_path()
+    @implementation(1, 'heap')
+    def get_part_1_answer_heap(self, use_sample=False) -> str:
+        self.calc_path_heap()
+
+        return str(self.retrace_path(self.grid.start_pos))
 
+    def get_shortest_trail_length(self) -> int:
         a_candidates = []
 
         for x in range(self.grid.extents[0][1] + 1):
@@ -108,9 +204,22 @@ class Puzzle(PuzzleBase):
 
         path_lens = [self.retrace_path(candidate) for candidate in a_candidates]
 
+        return min(path_lens)
+
+    def get_part_2_answer(self, use_sample=False) -> str:
+        self.calc_path()
+
+        shortest_trail_length = self.get_shortest_trail_length()
+
         print(self.grid)
 
-        return str(min(path_lens))
+        return str(shortest_trail_length)
+
+    @implementation(2, 'heap')
+    def get_part_2_answer_heap(self, use_sample=False) -> str:
+        self.calc_path_heap()
+
+        return str(self.get_shortest_trail_length())
 
 
 if __name__ == "__main__":
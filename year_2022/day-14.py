@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from helpers.grid import ArrayGrid
@@ -8,6 +9,9 @@ class Puzzle(PuzzleBase):
     year = 2022
     day = 14
 
+    # Collections while the sand falls shouldn't have to rescan the parsed grid.
+    freeze_gc_after_parse = True
+
     grid: ArrayGrid
 
     sand_spawn_point = (500, 0)
@@ -52,6 +56,33 @@ class Puzzle(PuzzleBase):
                     point[1] += offset[1]
                 self.grid[(point[0], point[1])] = '#'  # last point
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the cave's depth, with a rock path for every other row of it. The floor's sand pile spreads as
+        # wide as it is deep, so it has to stay well within the 1000-wide grid.
+        if size > 480:
+            raise ValueError('Caves deeper than 480 don\'t fit in the grid')
+
+        paths = []
+
+        for _ in range(size // 2 + 1):
+            x, y = rng.randint(500 - size, 500 + size), rng.randint(1, size)
+            points = [(x, y)]
+
+            for segment in range(rng.randint(1, 4)):
+                length = rng.randint(1, 8) * rng.choice([-1, 1])
+
+                if segment % 2 == 0:
+                    x = min(500 + size, max(500 - size, x + length))
+                else:
+                    y = min(size, max(1, y + length))
+
+                if (x, y) != points[-1]:
+                    points.append((x, y))
+
+            paths.append(' -> '.join(f'{x},{y}' for x, y in points))
+
+        return '\n'.join(paths)
+
     def process_sand(self, current_pos, simulate_floor=False):
         x0, y0 = current_pos
 
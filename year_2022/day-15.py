@@ -49,6 +49,22 @@ class Puzzle(PuzzleBase):
             self.sensor_beacons[sensor] = beacon
             self.sensor_distances[sensor] = abs(sensor[0] - beacon[0]) + abs(sensor[1] - beacon[1])
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of sensors. They're spread over the 4000000-wide search area, each one's beacon
+        # close enough that more sensors means smaller, more numerous diamonds.
+        max_distance = 4000000 // max(1, int(size ** 0.5))
+        lines = []
+
+        for _ in range(size):
+            sensor_x, sensor_y = rng.randint(0, 4000000), rng.randint(0, 4000000)
+            offset_x = rng.randint(-max_distance, max_distance)
+            offset_y = rng.randint(-max_distance, max_distance)
+
+            lines.append(f'Sensor at x={sensor_x}, y={sensor_y}: '
+                         f'closest beacon is at x={sensor_x + offset_x}, y={sensor_y + offset_y}')
+
+        return '\n'.join(lines)
+
     def try_marking(self, point):
         if not self.grid[point] or self.grid[point] == '░░':
             self.grid[point] = '██'
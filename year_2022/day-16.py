@@ -2,12 +2,14 @@ import functools
 import itertools
 import math
 import operator
+import random
 import re
 import sys
 from functools import reduce
 from typing import List, Union
 
 from helpers.grid import Grid
+from helpers.input_generation import unique_names
 from puzzle_base import PuzzleBase
 
 
@@ -31,6 +33,12 @@ class Puzzle(PuzzleBase):
     year = 2022
     day = 16
 
+    # The search over which valves to open grows exponentially with how many have a flow rate.
+    expected_growth = ('exp', 'exp')
+
+    # The search churns through short-lived tuples and sets, so collections shouldn't have to rescan the parsed rooms.
+    freeze_gc_after_parse = True
+
     rooms: dict[str, Room] = {}
     cached_room_paths = {}
 
@@ -48,6 +56,37 @@ class Puzzle(PuzzleBase):
             match = re.match(r'Valve ([A-Z]+) has flow rate=(\d+); tunnels? leads? to valves? ([A-Z, ]+)', line)
             self.rooms[match[1]] = Room(match[1], int(match[2]), match[3].split(', '))
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of valves, about a quarter of which have a flow rate. They're joined up as a random
+        # tree, plus a few extra tunnels, so every valve can be reached from AA.
+        names = ['AA'] + [name for name in unique_names(size, rng) if name != 'AA'][:size - 1]
+        rng.shuffle(names)
+
+        tunnels = {name: set() for name in names}
+
+        for i in range(1, len(names)):
+            other = names[rng.randrange(i)]
+            tunnels[names[i]].add(other)
+            tunnels[other].add(names[i])
+
+        for _ in range(len(names) // 4):
+            first, second = rng.sample(names, 2)
+            tunnels[first].add(second)
+            tunnels[second].add(first)
+
+        lines = []
+
+        for name in names:
+            rate = rng.randint(1, 25) if name != 'AA' and rng.random() < 0.25 else 0
+            neighbors = sorted(tunnels[name])
+
+            if len(neighbors) == 1:
+                lines.append(f'Valve {name} has flow rate={rate}; tunnel leads to valve {neighbors[0]}')
+            else:
+                lines.append(f'Valve {name} has flow rate={rate}; tunnels lead to valves {", ".join(neighbors)}')
+
+        return '\n'.join(lines)
+
     def get_path_to_target(self, current_room: Room, goal_room: Room) -> list[Room]:
         cached_index = (current_room.id, goal_room.id)
         if cached_index in self.cached_room_paths:
@@ -371,5 +410,6 @@ class Puzzle(PuzzleBase):
         return out_str
 
 
-puzzle = Puzzle()
-print(puzzle.test_and_run(True))
+if __name__ == "__main__":
+    puzzle = Puzzle()
+    print(puzzle.test_and_run(True))
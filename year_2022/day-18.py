@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from helpers.grid import Grid3D, Point3D
@@ -23,6 +24,16 @@ class Puzzle(PuzzleBase):
             x, y, z = [int(num) for num in line.split(',')]
             self.grid[(x, y, z)] = '#'
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of cubes. They fill about half of a box, which leaves plenty of pockets of air.
+        side = max(2, round((size * 2) ** (1 / 3)))
+        cubes = set()
+
+        while len(cubes) < min(size, side ** 3):
+            cubes.add((rng.randint(1, side), rng.randint(1, side), rng.randint(1, side)))
+
+        return '\n'.join(f'{x},{y},{z}' for x, y, z in sorted(cubes))
+
     def get_part_1_answer(self, use_sample=False) -> str:
         surfaces = 0
 
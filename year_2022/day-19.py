@@ -1,3 +1,4 @@
+import random
 import re
 from copy import deepcopy
 from enum import Enum
@@ -112,6 +113,9 @@ class Puzzle(PuzzleBase):
     year = 2022
     day = 19
 
+    # The search churns through short-lived states, so collections shouldn't have to rescan the parsed blueprints.
+    freeze_gc_after_parse = True
+
     blueprints: list[Blueprint]
 
     decision_cache = {}
@@ -141,6 +145,15 @@ class Puzzle(PuzzleBase):
 
                 self.blueprints.append(blueprint)
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of blueprints, with costs in the same ranges as the real ones.
+        return '\n'.join(f'Blueprint {i + 1}: '
+                         f'Each ore robot costs {rng.randint(2, 4)} ore. '
+                         f'Each clay robot costs {rng.randint(2, 4)} ore. '
+                         f'Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. '
+                         f'Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(7, 20)} obsidian.'
+                         for i in range(size))
+
     def get_ideal_decision(self, blueprint: Blueprint,
                            ore_robots=1, clay_robots=0, obsidian_robots=0, geode_robots=0,
                            ore_count=0, clay_count=0, obsidian_count=0, geode_count=0,
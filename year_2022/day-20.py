@@ -1,3 +1,4 @@
+import random
 from copy import deepcopy
 from typing import List
 
@@ -30,6 +31,13 @@ class Puzzle(PuzzleBase):
             if number_tuple[0] == 0:
                 self.zero_index = i
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of values to mix, exactly one of which is 0.
+        numbers = [rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(size - 1)]
+        numbers.insert(rng.randint(0, len(numbers)), 0)
+
+        return '\n'.join(str(number) for number in numbers)
+
     def mix(self):
         for i in range(len(self.numbers)):
             number, original_index = number_tuple = self.tuples_by_index[i]
@@ -1,5 +1,7 @@
 import functools
+import random
 from typing import List
+from helpers.input_generation import random_rows
 from puzzle_base import PuzzleBase
 
 
@@ -32,6 +34,10 @@ class Puzzle(PuzzleBase):
             if input_data[i].strip() != '':
                 self.trees.append([int(char) for char in input_data[i].strip()])
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the forest's width and height.
+        return '\n'.join(random_rows(size, size, rng, '0123456789'))
+
     def get_part_1_answer(self, use_sample=False) -> str:
         visible_trees = []
 
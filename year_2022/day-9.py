@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from puzzle_base import PuzzleBase
@@ -47,6 +48,10 @@ class Puzzle(PuzzleBase):
             move = line.split(' ')
             self.moves.append((move[0], int(move[1])))
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of moves.
+        return '\n'.join(f'{rng.choice("UDLR")} {rng.randint(1, 19)}' for _ in range(size))
+
     def get_part_1_answer(self, use_sample=False) -> str:
         self.perform_moves()
         return str(len(self.tiles_visited))
@@ -1,4 +1,5 @@
 import functools
+import random
 from enum import Enum
 from typing import List, Union
 
@@ -261,6 +262,23 @@ class Puzzle(PuzzleBase):
                 [int(r) for r in broken_runs.split(',')]
             ))
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of rows. Each row's damaged runs are read off a random row of springs before half of
+        # it is hidden behind ?s, so there's always at least one arrangement. Rows are kept shorter than the real
+        # ones, since arrangements grow exponentially with length and would drown out how rows scale.
+        lines = []
+
+        for _ in range(size):
+            springs = rng.choices('#.', k=rng.randint(5, 12))
+            springs[rng.randrange(len(springs))] = '#'
+
+            runs = [len(run) for run in ''.join(springs).split('.') if run]
+            hidden = ''.join('?' if rng.random() < 0.5 else spring for spring in springs)
+
+            lines.append(f'{hidden} {",".join(str(run) for run in runs)}')
+
+        return '\n'.join(lines)
+
     def expand_rows(self):
         new_rows = []
 
@@ -1,6 +1,8 @@
+import random
 from typing import List
 
 from helpers.grid import Grid, Point, ArrayGrid
+from helpers.input_generation import random_rows
 from puzzle_base import PuzzleBase
 
 
@@ -19,6 +21,10 @@ class Puzzle(PuzzleBase):
     def prepare_data(self, input_data: List[str], current_part: int):
         self.grid = ArrayGrid.from_strings(input_data)
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the platform's width and height.
+        return '\n'.join(random_rows(size, size, rng, 'O#.', [0.2, 0.1, 0.7]))
+
     def get_round_rocks(self) -> list[Point]:
         rock_positions = []
 
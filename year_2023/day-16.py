@@ -1,6 +1,8 @@
+import random
 from typing import List
 
 from helpers.grid import Grid, Point, SparseGrid, ArrayGrid
+from helpers.input_generation import random_rows
 from puzzle_base import PuzzleBase
 
 
@@ -16,11 +18,11 @@ class Puzzle(PuzzleBase):
     active_grid: Grid
     filled_dirs: dict
 
-    base_data: List[str]
-
     new_lasers: list[tuple[Point, Point]]
     laser_total = 0
 
+    parse_once = True
+
     def reset(self):
         self.grid = ArrayGrid.create_empty(0, 0, '.')
         self.dir_grid = ArrayGrid.create_empty(0, 0, '.')
@@ -30,19 +32,26 @@ class Puzzle(PuzzleBase):
         self.new_lasers = []
         self.laser_total = 0
 
+    def parse_input(self, input_data: List[str]) -> ArrayGrid:
+        return ArrayGrid.from_strings(input_data)
+
+    def copy_parsed_input(self, parsed_input: ArrayGrid) -> ArrayGrid:
+        return parsed_input.copy()
+
     def prepare_data(self, input_data: List[str], current_part: int):
-        self.grid = ArrayGrid.from_strings(input_data)
-        self.dir_grid = ArrayGrid.from_strings(input_data)
-        self.active_grid = ArrayGrid.from_strings(input_data)
+        self.reset_grids()
 
-        self.base_data = input_data
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the contraption's width and height, with a mirror or splitter on about one tile in ten.
+        return '\n'.join(random_rows(size, size, rng, '.|-/\\', [0.9, 0.025, 0.025, 0.025, 0.025]))
 
     def reset_grids(self):
         self.reset()
 
-        self.grid = ArrayGrid.from_strings(self.base_data)
-        self.dir_grid = ArrayGrid.from_strings(self.base_data)
-        self.active_grid = ArrayGrid.from_strings(self.base_data)
+        # The mirror grid itself is never written to, so only the grids we draw lasers into need fresh copies.
+        self.grid = self.parsed_input
+        self.dir_grid = self.parsed_input.copy()
+        self.active_grid = self.parsed_input.copy()
 
     def dir_to_char(self, direction: Point):
         if direction == Point(1, 0):
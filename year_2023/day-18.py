@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from helpers.grid import ArrayGrid, Point, Grid, SparseGrid
@@ -51,6 +52,33 @@ class Puzzle(PuzzleBase):
             current_point += DIRECTIONS[direction] * int(steps)
             self.vertices.append(current_point)
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of columns in the lagoon's outline. Both parts' plans trace a skyline - a random
+        # height for every column, sitting on a flat base - so neither ever crosses itself. The colors hold the
+        # second plan, with much longer edges.
+        def trace_skyline(max_length):
+            widths = [rng.randint(1, max_length) for _ in range(size)]
+            heights = [rng.randint(1, max_length)]
+
+            for _ in range(size - 1):
+                # Heights never repeat, so every column ends in a turn and both plans have the same number of moves.
+                height = rng.randint(1, max_length)
+                heights.append(height + 1 if height >= heights[-1] else height)
+
+            moves = [('U', heights[0]), ('R', widths[0])]
+
+            for i in range(1, size):
+                moves.append(('U' if heights[i] > heights[i - 1] else 'D', abs(heights[i] - heights[i - 1])))
+                moves.append(('R', widths[i]))
+
+            return moves + [('D', heights[-1]), ('L', sum(widths))]
+
+        moves = trace_skyline(10)
+        color_moves = trace_skyline(100000)
+
+        return '\n'.join(f'{direction} {steps} (#{color_steps:05x}{"RDLU".index(color_direction)})'
+                         for (direction, steps), (color_direction, color_steps) in zip(moves, color_moves))
+
     def get_inside_count(self):
         is_inside = False
         last_corner_was_up = None
@@ -1,3 +1,4 @@
+import random
 import re
 from typing import List
 
@@ -45,6 +46,24 @@ class Puzzle(PuzzleBase):
                 [int(n.strip()) for n in re.split(' +', found.strip())]
             ))
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of cards, each with 10 winning numbers and 25 numbers to check against them. Like the
+        # real ones, no card wins copies of cards past the end of the table.
+        lines = []
+
+        for i in range(size):
+            numbers = rng.sample(range(1, 100), 35)
+            winners = numbers[:10]
+
+            win_count = rng.randint(0, min(10, size - 1 - i))
+            found = winners[:win_count] + numbers[10:35 - win_count]
+            rng.shuffle(found)
+
+            lines.append(f'Card {i + 1:>{len(str(size))}}: {" ".join(f"{n:>2}" for n in winners)} | '
+                         f'{" ".join(f"{n:>2}" for n in found)}')
+
+        return '\n'.join(lines)
+
     def get_win_count(self, card: Card):
         return len([n for n in card.found_numbers if n in card.winning_numbers])
 
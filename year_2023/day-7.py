@@ -1,3 +1,4 @@
+import random
 from functools import cmp_to_key
 from typing import List
 
@@ -86,6 +87,10 @@ class Puzzle(PuzzleBase):
             if line != '':
                 self.hands.append(Hand(line.split()[0], int(line.split()[1])))
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of hands.
+        return '\n'.join(f'{"".join(rng.choices("AKQJT98765432", k=5))} {rng.randint(1, 1000)}' for _ in range(size))
+
     def compare_hands(self, left: Hand, right: Hand):
         a_hand = left.get_hand_type()
         b_hand = right.get_hand_type()
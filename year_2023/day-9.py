@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from puzzle_base import PuzzleBase
@@ -18,6 +19,19 @@ class Puzzle(PuzzleBase):
             if line != '':
                 self.value_sets.append([int(i) for i in line.split()])
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of histories. Each is a random polynomial of degree 5 or less, so extrapolating it
+        # always works out.
+        lines = []
+
+        for _ in range(size):
+            coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+            values = [sum(c * x ** power for power, c in enumerate(coefficients)) for x in range(21)]
+
+            lines.append(' '.join(str(value) for value in values))
+
+        return '\n'.join(lines)
+
     def get_next_value(self, value_set: list[int]):
         edge_values = [value_set[-1]]
 
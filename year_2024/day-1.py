@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from puzzle_base import PuzzleBase
@@ -24,6 +25,10 @@ class Puzzle(PuzzleBase):
             self.left_list.append(int(nums[0]))
             self.right_list.append(int(nums[-1]))
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the length of both lists.
+        return '\n'.join(f'{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}' for _ in range(size))
+
     def get_part_1_answer(self, use_sample=False) -> str:
         total = 0
 
@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from puzzle_base import PuzzleBase
@@ -49,6 +50,25 @@ class Puzzle(PuzzleBase):
             if line != '':
                 self.reports.append([int(n) for n in line.split(' ')])
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of reports. Most start out safe, and about a third then get one level knocked out of
+        # line, so both parts have something to find.
+        lines = []
+
+        for _ in range(size):
+            direction = rng.choice([-1, 1])
+            levels = [rng.randint(10, 90)]
+
+            for _ in range(rng.randint(4, 7)):
+                levels.append(levels[-1] + direction * rng.randint(1, 3))
+
+            if rng.random() < 0.3:
+                levels[rng.randrange(len(levels))] += rng.randint(-4, 4)
+
+            lines.append(' '.join(str(level) for level in levels))
+
+        return '\n'.join(lines)
+
     def get_part_1_answer(self, use_sample=False) -> str:
         return str(sum([1 for report in self.reports if is_safe_record(report, False)]))
 
@@ -1,4 +1,5 @@
 import functools
+import random
 import re
 from typing import List
 
@@ -30,6 +31,26 @@ class Puzzle(PuzzleBase):
     def prepare_data(self, input_data: List[str], current_part: int):
         self.program_memory = "\n".join(input_data)
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of instructions, valid or not, hidden among the corrupted memory.
+        fragments = []
+
+        for _ in range(size):
+            roll = rng.random()
+
+            if roll < 0.6:
+                fragments.append(f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})')
+            elif roll < 0.7:
+                fragments.append('do()')
+            elif roll < 0.8:
+                fragments.append('don\'t()')
+            else:
+                fragments.append(f'mul[{rng.randint(1, 999)},{rng.randint(1, 999)})')
+
+            fragments.append(''.join(rng.choices('mul()do,%&[]!@^*<>{} \'', k=rng.randint(0, 8))))
+
+        return ''.join(fragments)
+
     def get_matching_functions(self, function_names: list[str]) -> list[Function]:
         regex = r"(%s)\(((\d+), ?(\d+))?\)" % "|".join(function_names)
         pattern = re.compile(regex)
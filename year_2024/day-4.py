@@ -1,6 +1,8 @@
+import random
 from typing import List
 
 from helpers.grid import Point
+from helpers.input_generation import random_rows
 from puzzle_base import PuzzleBase
 
 
@@ -17,6 +19,10 @@ class Puzzle(PuzzleBase):
     def prepare_data(self, input_data: List[str], current_part: int):
         self.text = [l for l in input_data if l != '']
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the word search's width and height.
+        return '\n'.join(random_rows(size, size, rng, 'XMAS'))
+
     def get_diagonal(self, x: int, y: int, is_right: bool) -> str:
         diagonal = ''
 
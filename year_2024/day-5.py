@@ -1,4 +1,5 @@
 import math
+import random
 from typing import List
 
 from puzzle_base import PuzzleBase
@@ -35,6 +36,19 @@ class Puzzle(PuzzleBase):
                 nums = line.split(',')
                 self.updates.append([int(i) for i in nums])
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of updates. As in the real inputs, there are 49 pages and a rule for every pair of
+        # them, and each update lists an odd number of pages in a random order.
+        pages = rng.sample(range(10, 100), 49)
+
+        rules = [f'{pages[i]}|{pages[j]}' for i in range(len(pages)) for j in range(i + 1, len(pages))]
+        rng.shuffle(rules)
+
+        updates = [','.join(str(page) for page in rng.sample(pages, rng.choice(range(5, 24, 2))))
+                   for _ in range(size)]
+
+        return '\n'.join(rules) + '\n\n' + '\n'.join(updates)
+
     def get_rules_for_update(self, update: list[int]) -> list[tuple]:
         rules = []
 
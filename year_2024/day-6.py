@@ -1,7 +1,9 @@
-from multiprocessing import Pool
-from typing import List
+import random
+from typing import Callable, List
 
 from helpers.grid import ArrayGrid, Point
+from helpers.input_generation import random_rows
+from helpers.shared_grid import SharedArrays, shared_pool_map
 from helpers.number_helpers import clamp
 from puzzle_base import PuzzleBase
 
@@ -24,6 +26,48 @@ OFFSETS = {
 }
 
 
+DIRECTIONS = list(OFFSETS.keys())
+
+
+# The jumps dict as a shared table, indexed by direction, y and x, holding each jump's target (or -1s for none).
+class SharedJumps:
+    table: memoryview
+
+    def __init__(self, table: memoryview):
+        self.table = table
+
+    @staticmethod
+    def encode(jumps: dict[PathStep, Point], width: int, height: int) -> list[int]:
+        values = [-1] * (len(DIRECTIONS) * height * width * 2)
+
+        for (direction, pos), target in jumps.items():
+            index = ((DIRECTIONS.index(direction) * height + pos.y) * width + pos.x) * 2
+            values[index:index + 2] = [target.x, target.y]
+
+        return values
+
+    def __contains__(self, step: PathStep) -> bool:
+        direction, pos = step
+
+        return 0 <= pos.x < self.table.shape[2] and 0 <= pos.y < self.table.shape[1] and \
+            self.table[DIRECTIONS.index(direction), pos.y, pos.x, 0] >= 0
+
+    def __getitem__(self, step: PathStep) -> Point:
+        direction, pos = step
+        direction_index = DIRECTIONS.index(direction)
+
+        return Point(self.table[direction_index, pos.y, pos.x, 0], self.table[direction_index, pos.y, pos.x, 1])
+
+
+# Runs in each of get_loop_count()'s workers, building a puzzle around the shared grid and jumps once per worker.
+def create_loop_tester(views: dict) -> Callable[[PathStep], tuple[bool, Point]]:
+    puzzle = Puzzle()
+    puzzle.grid = views['grid']
+    puzzle.jumps = SharedJumps(views['jumps'])
+
+    return puzzle.test_for_loop
+
+
 class Puzzle(PuzzleBase):
     year = 2024
     day = 6
@@ -39,6 +83,31 @@ class Puzzle(PuzzleBase):
         self.grid = ArrayGrid.from_strings(input_data)
         self.init_jumps()
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the lab's width and height, with an obstruction on about one tile in twenty. Like in the real
+        # inputs, the guard always walks out; labs that would trap them are drawn again.
+        while True:
+            rows = [list(row) for row in random_rows(size, size, rng, '.#', [0.95, 0.05])]
+
+            x, y = rng.randrange(size), rng.randrange(size)
+            rows[y][x] = '^'
+
+            offset = (0, -1)
+            visited = set()
+
+            while 0 <= x < size and 0 <= y < size and (x, y, offset) not in visited:
+                visited.add((x, y, offset))
+
+                next_x, next_y = x + offset[0], y + offset[1]
+
+                if 0 <= next_x < size and 0 <= next_y < size and rows[next_y][next_x] == '#':
+                    offset = (-offset[1], offset[0])
+                else:
+                    x, y = next_x, next_y
+
+            if not (0 <= x < size and 0 <= y < size):
+                return '\n'.join(''.join(row) for row in rows)
+
     def add_jumps_from_slice(self, grid_slice: ArrayGrid, top_left_coords: Point):
         is_horizontal = grid_slice.height == 1
         offset = Point(1, 0) if is_horizontal else Point(0, 1)
@@ -188,8 +257,15 @@ class Puzzle(PuzzleBase):
         start_dir = self.grid[start_pos]
         canonical_path = self.simulate_guard_path(start_pos, start_dir)[0]
 
-        with Pool(5) as pool:
-            loop_results = pool.map(self.test_for_loop, canonical_path)
+        # The workers read the grid and jumps from shared memory, so only the path steps are sent to them.
+        with SharedArrays() as shared:
+            handles = {
+                'grid': shared.publish_grid(self.grid),
+                'jumps': shared.publish_table(SharedJumps.encode(self.jumps, self.grid.width, self.grid.height),
+                                              (len(DIRECTIONS), self.grid.height, self.grid.width, 2))
+            }
+
+            loop_results = shared_pool_map(create_loop_tester, canonical_path, handles, 5)
 
         return len(set([l[1] for l in loop_results if l[0]]))
 
@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 from puzzle_base import PuzzleBase
@@ -29,6 +30,33 @@ class Puzzle(PuzzleBase):
 
             self.equations.append((int(left), [int(n) for n in rights.strip().split(' ')]))
 
+    def generate_input(self, size: int, rng: random.Random) -> str:
+        # size is the number of equations. About half are built from random operators, so they have a solution;
+        # the rest have a random test value and almost never do.
+        lines = []
+
+        for _ in range(size):
+            numbers = [rng.randint(1, 99) for _ in range(rng.randint(2, 12))]
+
+            if rng.random() < 0.5:
+                test_value = numbers[0]
+
+                for number in numbers[1:]:
+                    operator = rng.choice('+*|')
+
+                    if operator == '+':
+                        test_value += number
+                    elif operator == '*':
+                        test_value *= number
+                    else:
+                        test_value = int(f'{test_value}{number}')
+            else:
+                test_value = rng.randint(1, 10 ** rng.randint(2, 14))
+
+            lines.append(f'{test_value}: {" ".join(str(number) for number in numbers)}')
+
+        return '\n'.join(lines)
+
     def get_solutions(self, right_values: list[int], allow_concat=False) -> list[int]:
         if len(right_values) == 2:
             if allow_concat: